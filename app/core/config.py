@@ -11,10 +11,164 @@ class Settings(BaseSettings):
     DB_USER: str = "postgres"
     DB_PASSWORD: str = "Emir1234**"
 
+    # --- Connection Pool ---
+    # Toplam bağlantı üst sınırı (worker başına): DB_POOL_SIZE + DB_MAX_OVERFLOW
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30        # saniye; havuz boşalmazsa TimeoutError
+    DB_POOL_RECYCLE: int = 1800      # saniye; -1 => kapalı
+    DB_POOL_PRE_PING: bool = True
+
+    # --- Read Replica ---
+    # Virgülle ayrılmış "host" veya "host:port" listesi. Boşsa tüm trafik primary'ye gider.
+    DB_REPLICA_HOSTS: str = ""
+    # Yazma yapan istemci bu süre boyunca okumalarda da primary'ye sabitlenir
+    DB_READ_YOUR_WRITES_SECONDS: int = 5
+
+    # --- Sayfalama (Keyset Pagination) ---
+    PAGINATION_DEFAULT_LIMIT: int = 50
+    PAGINATION_MAX_LIMIT: int = 500
+
+    # --- Dışa Aktarım (Export) ---
+    # Sunucu tarafı cursor'dan tek seferde çekilen / istemciye yazılan satır sayısı
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # --- Geliştirme / SQL Teşhis ---
+    # Açıkken her isteğin SQL sayısı ve DB süresi header'lara ve loglara yazılır
+    DEBUG: bool = False
+    # Aynı SQL bir istekte bu sayıda veya daha fazla çalışırsa olası N+1 kabul edilir
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+
+    # --- Yavaş Sorgu Kaydı ---
+    # Bu süreyi (ms) aşan ifadeler kaydedilir; 0 => kapalı
+    SLOW_QUERY_THRESHOLD_MS: int = 200
+    # Bellekte tutulan son yavaş sorgu sayısı (ring buffer)
+    SLOW_QUERY_BUFFER_SIZE: int = 1000
+
+    # --- Audit Log Yazımı ---
+    # "sync"     => her kayıt çağıranın session'ıyla hemen commit edilir
+    # "transactional" => değişiklikler flush hook'u ile iş transaction'ına eklenir (tek commit)
+    # "buffered" => kayıtlar kuyruğa alınır, arka planda toplu INSERT ile yazılır (opt-in;
+    #               süreç çökerse / SIGKILL alırsa kuyruktaki kayıtlar kaybolur)
+    AUDIT_LOG_MODE: str = "sync"
+    # Tek INSERT'te yazılan en fazla kayıt ve en uzun bekleme süresi (ms)
+    AUDIT_LOG_BATCH_SIZE: int = 500
+    AUDIT_LOG_FLUSH_INTERVAL_MS: int = 200
+    # Kuyruk dolarsa kayıtlar senkron yazılır
+    AUDIT_LOG_QUEUE_MAX_SIZE: int = 10000
+    # Başarısız batch'in deneme sayısı; sonra batch bölünerek yazılır ve yine yazılamayan
+    # satırlar dead-letter dosyasına (JSON Lines) eklenir; boş => sadece loglanır
+    AUDIT_LOG_WRITE_ATTEMPTS: int = 3
+    AUDIT_LOG_DEAD_LETTER_PATH: str = "archive/audit_logs_dead_letter.jsonl"
+
+    # --- Audit Log Bölümleme / Arşiv ---
+    # Postgres'te audit_logs created_at'e göre aylık bölümlenir (scripts.partition_audit_logs).
+    # İçinde bulunulan aydan sonra önceden oluşturulan bölüm sayısı
+    AUDIT_LOG_PARTITION_MONTHS_AHEAD: int = 3
+    # Bu kadar aydan eski bölümler arşiv dizinine (gzip JSON Lines) taşınır; 0 => kapalı
+    AUDIT_LOG_RETENTION_MONTHS: int = 24
+    AUDIT_LOG_ARCHIVE_DIR: str = "archive/audit_logs"
+    # Bölüm oluşturma / arşivleme kontrol aralığı (sn); 0 => kapalı
+    AUDIT_LOG_MAINTENANCE_INTERVAL_SECONDS: int = 3600
+
+    # --- AI Job Worker (python -m app.worker) ---
+    # Süreç başına aynı anda çalışan iş sayısı
+    AI_WORKER_CONCURRENCY: int = 4
+    # Kuyruk boşken yeni iş kontrol aralığı (ms)
+    AI_WORKER_POLL_INTERVAL_MS: int = 500
+    # İş kirasının süresi ve worker'ın kirayı uzatma aralığı (sn)
+    AI_JOB_LEASE_SECONDS: int = 60
+    AI_JOB_HEARTBEAT_SECONDS: int = 15
+    # Bu kadar denemeden sonra hata alan (veya kirası düşen) iş FAILED olur
+    AI_JOB_MAX_ATTEMPTS: int = 3
+    # Aynı girdi için bu süre (sn) içinde tamamlanmış iş varsa (girdi o zamandan beri
+    # değişmediyse) yeni iş açılmaz, o döner
+    AI_JOB_DEDUP_WINDOW_SECONDS: int = 3600
+    # Kuyruk sırası: "fair" => INTERACTIVE işler önce, tenant'lar arasında plan ağırlığına
+    # (SubscriptionPlan.ai_job_weight) göre adil paylaşım; "fifo" => sadece created_at sırası
+    AI_JOB_SCHEDULER: str = "fair"
+    # Aktif aboneliği olmayan tenant'ların ağırlığı
+    AI_JOB_DEFAULT_WEIGHT: int = 1
+    # Adil paylaşımda tenant kullanımının sayıldığı pencere (sn): bu süre içinde başlayan işler
+    AI_JOB_FAIR_WINDOW_SECONDS: int = 60
+    # Her claim'de tenant + öncelik başına sıralanan en fazla bekleyen iş (en az claim limiti);
+    # claim maliyeti kuyruk derinliğinden bağımsız kalır
+    AI_JOB_FAIR_CANDIDATES_PER_GROUP: int = 32
+    # Bir claim'de sıralanan en fazla tenant (bekleyen işi olan, tenant_id sırasıyla);
+    # daha fazla tenant aynı anda beklerse ID'si büyük olanlar sonraki claim'lere kalır
+    AI_JOB_FAIR_MAX_TENANTS: int = 1000
+    # Toplu çıkarım: aynı model + prompt sürümündeki bu kadar iş tek model çağrısında işlenir;
+    # 1 => kapalı (her iş ayrı çağrı)
+    AI_BATCH_MAX_SIZE: int = 1
+    # Batch dolmasa bile en eski iş bu kadar (ms) beklediyse eldeki işlerle çağrı yapılır
+    AI_BATCH_MAX_WAIT_MS: int = 200
+    # Model sağlayıcı: "fake" ya da "paket.modul:SinifAdi"
+    AI_PROVIDER: str = "fake"
+    # Fake sağlayıcının istek başına simüle ettiği gecikme (ms)
+    AI_FAKE_PROVIDER_LATENCY_MS: int = 200
+    # Fake sağlayıcıda batch'e eklenen her ek öğenin maliyeti (ms)
+    AI_FAKE_PROVIDER_BATCH_ITEM_LATENCY_MS: int = 10
+
+    # --- AI İş Olayları (SSE / WebSocket) ---
+    # İş durum değişiklikleri ve kısmi çıktı /ai-jobs/events (SSE) ve /ai-jobs/ws'den
+    # yayınlanır; Postgres'te süreçler arası LISTEN/NOTIFY ile taşınır
+    AI_JOB_EVENTS_ENABLED: bool = True
+    AI_JOB_EVENTS_CHANNEL: str = "ai_job_events"
+    # Bağlantı başına bekleyen en fazla olay; dolarsa en eskisi atılır ve "resync" gönderilir
+    AI_JOB_EVENTS_QUEUE_SIZE: int = 256
+    # Olay yokken bağlantıyı canlı tutan ping aralığı (sn)
+    AI_JOB_EVENTS_KEEPALIVE_SECONDS: int = 15
+    # Worker'ın aynı iş için kısmi çıktı yayınlama aralığı (ms)
+    AI_JOB_EVENTS_PARTIAL_INTERVAL_MS: int = 250
+    # LISTEN bağlantısı koparsa yeniden bağlanma bekleme süresi (sn)
+    AI_JOB_EVENTS_RECONNECT_SECONDS: int = 5
+    # Tarayıcıların (EventSource / WebSocket header gönderemez) URL'de taşıdığı
+    # stream token'ının ömrü (sn); sadece bağlantı kurulurken doğrulanır
+    AI_JOB_STREAM_TOKEN_EXPIRE_SECONDS: int = 60
+
+    # --- AI Özet Cache ---
+    # Aynı içerik + model + prompt sürümü için model tekrar çağrılmaz, cache'teki çıktı yazılır
+    AI_SUMMARY_CACHE_ENABLED: bool = True
+    # Bu kadar gündür kullanılmayan kayıtlar silinir; 0 => süre sınırı yok
+    AI_SUMMARY_CACHE_TTL_DAYS: int = 30
+    # Tenant başına en fazla kayıt; aşılırsa en uzun süredir kullanılmayanlar silinir (LRU)
+    AI_SUMMARY_CACHE_MAX_ENTRIES_PER_TENANT: int = 10000
+    # Worker'ın eviction çalıştırma aralığı (sn); 0 => kapalı
+    AI_SUMMARY_CACHE_EVICT_INTERVAL_SECONDS: int = 3600
+
+    # --- Kimlik Doğrulama Cache ---
+    # get_current_user'ın aktif kullanıcıları bellekte tuttuğu süre (sn); 0 => kapalı
+    AUTH_USER_CACHE_TTL_SECONDS: int = 30
+    # Cache'te tutulan en fazla kullanıcı sayısı (LRU)
+    AUTH_USER_CACHE_MAX_SIZE: int = 10000
+
+    # --- Şifre Hashleme (bcrypt) ---
+    # bcrypt maliyet faktörü; değişirse eski hash'ler login sırasında yenilenir
+    BCRYPT_ROUNDS: int = 12
+    # Hashleme için ayrılan thread sayısı ve bekleyebilecek en fazla iş
+    BCRYPT_MAX_WORKERS: int = 4
+    BCRYPT_MAX_QUEUE: int = 32
+
+    # --- Toplu Kullanıcı Ekleme ---
+    # POST /users/bulk isteğindeki en fazla satır
+    USER_BULK_MAX_SIZE: int = 500
+
+    # --- Claims-only (stateless) Auth ---
+    # True => okuma endpoint'leri kullanıcıyı DB'den çekmeden JWT claim'lerine güvenir
+    AUTH_STATELESS_READS: bool = False
+    # İptal listesinin (logout / pasif, silinen, rolü değişen kullanıcılar) DB'den yenilenme aralığı (sn)
+    AUTH_REVOCATION_REFRESH_SECONDS: int = 15
+
     # --- JWT Ayarları ---
     JWT_SECRET_KEY: str = "super-secret-key"
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 1 gün
+    # RS256 / ES256 gibi asimetrik algoritmalar için PEM dosyaları.
+    # Sadece doğrulama yapan servislerde private key boş bırakılabilir.
+    JWT_PRIVATE_KEY_PATH: str = ""
+    JWT_PUBLIC_KEY_PATH: str = ""
+    # Doğrulanmış token'ların (exp'e kadar) bellekte tutulduğu LRU boyutu; 0 => kapalı
+    JWT_DECODE_CACHE_SIZE: int = 10000
 
     class Config:
         env_file = ".env"
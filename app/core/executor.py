@@ -0,0 +1,99 @@
+# app/core/executor.py
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable
+
+
+class ExecutorSaturated(Exception):
+    """
+    Havuzdaki tüm worker'lar meşgul ve bekleme kuyruğu dolu.
+    main.py'deki exception handler bunu 503 (Retry-After) cevabına çevirir.
+    """
+
+
+class BoundedExecutor:
+    """
+    Kuyruk sınırı olan thread havuzu.
+
+    - En fazla max_workers iş aynı anda çalışır, max_queue iş sırada bekler
+    - Sınır aşılırsa iş kuyruğa alınmaz, hemen ExecutorSaturated fırlatılır
+      (istekler birikip threadpool'u kilitlemek yerine hızlıca reddedilir)
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, thread_name_prefix: str = ""):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=thread_name_prefix,
+        )
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def submit(self, fn, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ExecutorSaturated()
+
+        with self._lock:
+            self.in_flight += 1
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+        self._slots.release()
+
+    def run(self, fn, *args):
+        """
+        Sync çağıranlar için: işi havuzda çalıştırır ve sonucu bekler.
+        """
+        return self.submit(fn, *args).result()
+
+    def map(self, fn, items: Iterable) -> list:
+        """
+        fn'i her eleman için havuzda paralel çalıştırır, sonuçları sırayla döner.
+        Aynı anda en fazla max_workers iş gönderilir; böylece toplu işler
+        kuyruğu doldurup tekil istekleri (login) reddettirmez.
+        """
+        items = list(items)
+        results = []
+        for start in range(0, len(items), self.max_workers):
+            futures = [
+                self.submit(fn, item)
+                for item in items[start:start + self.max_workers]
+            ]
+            results.extend(f.result() for f in futures)
+        return results
+
+    async def run_async(self, fn, *args):
+        """
+        Async çağıranlar için: event loop'u bloklamadan sonucu bekler.
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,49 @@
+# app/core/metrics.py
+
+import threading
+from bisect import bisect_left
+from typing import Sequence
+
+
+class Histogram:
+    """
+    Sabit kovalı (bucket), thread-safe basit histogram.
+    Kovalar Prometheus'taki 'le' (küçük veya eşit) mantığıyla tutulur.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(sorted(buckets))
+        # Son eleman +Inf kovası
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> dict:
+        """
+        Kümülatif kova sayılarıyla birlikte anlık görüntü döner.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            value_sum = self._sum
+
+        buckets = {}
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            buckets[str(bound)] = running
+        buckets["+Inf"] = total
+
+        return {
+            "count": total,
+            "sum": round(value_sum, 6),
+            "buckets": buckets,
+        }
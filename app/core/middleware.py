@@ -0,0 +1,149 @@
+# app/core/middleware.py
+
+import logging
+import time
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.sql_instrumentation import (
+    start_request_context,
+    start_request_stats,
+    stop_request_context,
+    stop_request_stats,
+)
+from app.database import PRIMARY_PIN_COOKIE
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# URL'de taşınabilen kimlik bilgileri (tarayıcı stream bağlantıları)
+SENSITIVE_QUERY_PARAMS = frozenset({"access_token", "stream_token"})
+
+
+def redact_query_string(query_string: bytes) -> bytes:
+    """
+    Hassas query parametrelerinin değerini "REDACTED" yapar; diğerleri korunur.
+    """
+    if not any(name.encode() in query_string for name in SENSITIVE_QUERY_PARAMS):
+        return query_string
+    pairs = parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)
+    return urlencode([
+        (key, "REDACTED" if key in SENSITIVE_QUERY_PARAMS else value) for key, value in pairs
+    ]).encode("latin-1")
+
+
+class ReadYourWritesMiddleware:
+    """
+    Başarılı her yazma isteğinden (POST/PUT/PATCH/DELETE) sonra istemciye
+    kısa ömürlü bir cookie bırakır. get_read_db bu cookie'yi gördüğü sürece
+    okumaları replica yerine primary'ye yönlendirir; böylece istemci kendi
+    yazdığı veriyi replica gecikmesine takılmadan okur.
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: int):
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                pinned_until = time.time() + self.window_seconds
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "set-cookie",
+                    f"{PRIMARY_PIN_COOKIE}={pinned_until:.3f}; "
+                    f"Max-Age={self.window_seconds}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class SQLInstrumentationMiddleware:
+    """
+    Her istek için çalışan SQL ifadesi sayısını ve toplam DB süresini ölçer
+    (geliştirme modu). Sonuçlar yanıt header'larına eklenir ve loglanır;
+    aynı ifade n_plus_one_threshold kez veya daha fazla tekrarlanırsa
+    olası N+1 olarak uyarı verilir.
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_request_stats()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Query-Count"] = str(stats.count)
+                headers["X-DB-Time-Ms"] = f"{stats.total_time * 1000:.1f}"
+                repeated = stats.repeated(self.n_plus_one_threshold)
+                if repeated:
+                    headers["X-DB-N-Plus-One"] = str(len(repeated))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stop_request_stats(token)
+            self._log(scope, stats)
+
+    def _log(self, scope: Scope, stats) -> None:
+        route = f"{scope['method']} {scope['path']}"
+        logger.info(
+            "%s: %d sorgu, %.1f ms DB süresi",
+            route, stats.count, stats.total_time * 1000,
+        )
+        for statement, times in stats.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                "Olası N+1 (%s): aynı sorgu %d kez çalıştı: %s",
+                route, times, " ".join(statement.split())[:500],
+            )
+
+
+class RequestContextMiddleware:
+    """
+    Çalışan SQL ifadelerini isteğe (route, tenant, kullanıcı) bağlayabilmek
+    için her HTTP isteğinde bir RequestContext açar. Yavaş sorgu kaydı bu
+    bilgileri kullanır.
+
+    Yanıt başlarken (endpoint query parametrelerini okuduktan sonra) scope'taki
+    query string'den token'lar silinir; sunucunun erişim logu ve bu scope'u
+    etiketlemede kullanan kayıtlar token'ı görmez.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] in ("http.response.start", "websocket.accept", "websocket.close"):
+                scope["query_string"] = redact_query_string(scope.get("query_string", b""))
+            await send(message)
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send_wrapper)
+            return
+
+        token = start_request_context(scope)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stop_request_context(token)
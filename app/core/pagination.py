@@ -0,0 +1,150 @@
+# app/core/pagination.py
+
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Generic, List, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, Query, Response, status
+from sqlalchemy import literal, tuple_
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_LIMIT = settings.PAGINATION_DEFAULT_LIMIT
+
+# Bir sonraki sayfanın cursor'ı bu header ile döner (body yapısı değişmez)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class PageParams:
+    """
+    Liste endpoint'leri için ortak sayfalama parametreleri (FastAPI dependency).
+
+    Sayfalama opt-in'dir: ne limit ne cursor verilirse limit None olur ve
+    endpoint eskisi gibi tüm kayıtları döner. Sadece cursor verilirse
+    DEFAULT_PAGE_LIMIT kullanılır.
+    """
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(
+            None,
+            description=f"Önceki yanıttaki {NEXT_CURSOR_HEADER} header'ının değeri",
+        ),
+        limit: Optional[int] = Query(
+            None,
+            ge=1,
+            le=settings.PAGINATION_MAX_LIMIT,
+            description=f"Verilmezse (ve cursor da yoksa) tüm kayıtlar döner; cursor ile varsayılan {DEFAULT_PAGE_LIMIT}",
+        ),
+    ):
+        self.cursor = cursor
+        self.limit = limit if limit is not None or cursor is None else DEFAULT_PAGE_LIMIT
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor.",
+    )
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _from_json(value: Any, column) -> Any:
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Sıralama anahtarı değerlerini opak (base64) bir cursor'a çevirir.
+    """
+    raw = json.dumps([_to_json(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> list:
+    """
+    Cursor'ı, sıralama kolonlarının tiplerine göre Python değerlerine çözer.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        return [_from_json(v, c) for v, c in zip(values, columns)]
+    except (ValueError, TypeError, UnicodeError):
+        raise _invalid_cursor()
+
+
+def apply_keyset(
+    query,
+    columns: Sequence,
+    cursor: Optional[str],
+    limit: Optional[int],
+    descending: bool = False,
+):
+    """
+    Query (veya 2.0 tarzı Select) üzerine keyset filtresi, sıralama ve limit uygular.
+
+    - columns: sıralama kolonları; son kolon benzersiz olmalı (genellikle id)
+    - Bir sonraki sayfa olup olmadığını anlamak için limit + 1 satır istenir
+    - limit None ise sınır konmaz (sayfalamasız istek)
+    """
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        key = tuple_(*columns)
+        bound = tuple_(*(literal(v, c.type) for v, c in zip(values, columns)))
+        query = query.filter(key < bound if descending else key > bound)
+
+    order_by = [c.desc() if descending else c.asc() for c in columns]
+    query = query.order_by(*order_by)
+    if limit is None:
+        return query
+    return query.limit(limit + 1)
+
+
+def build_page(rows: Sequence[T], columns: Sequence, limit: Optional[int]) -> Page[T]:
+    """
+    apply_keyset ile çekilen satırlardan Page oluşturur.
+    """
+    rows = list(rows)
+    if limit is None or len(rows) <= limit:
+        return Page(items=rows)
+
+    items = rows[:limit]
+    last = items[-1]
+    next_cursor = encode_cursor([getattr(last, c.key) for c in columns])
+    return Page(items=items, next_cursor=next_cursor)
+
+
+def paginated(response: Response, page: Page[T]) -> List[T]:
+    """
+    Router yardımcı fonksiyonu: cursor'ı header'a yazar, elemanları döner.
+    """
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
@@ -1,43 +1,162 @@
 # app/core/security.py
 
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Union
+from typing import Iterable, List, Optional, Union
 
 import bcrypt
-from jose import jwt
+from jose import jwk, jwt
+from jose.backends.base import Key
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.executor import BoundedExecutor
 
 ALGORITHM = settings.JWT_ALGORITHM
 
 
+class JWTKeys:
+    """
+    JWT imzalama / doğrulama anahtarları.
+    Anahtar nesneleri (HMAC secret, RSA / EC PEM) bir kez kurulur; her
+    encode / decode çağrısında yeniden parse edilmez.
+    """
+
+    def __init__(self, algorithm: str, signing_key: Optional[Key], verification_key: Key):
+        self.algorithm = algorithm
+        self.signing_key = signing_key
+        self.verification_key = verification_key
+
+    @property
+    def is_asymmetric(self) -> bool:
+        return not self.algorithm.startswith("HS")
+
+    def public_jwks(self) -> dict:
+        """
+        Diğer servislerin token doğrulayabilmesi için public key'i JWKS olarak döner.
+        Simetrik (HS*) algoritmalarda secret paylaşılmaz, liste boştur.
+        """
+        if not self.is_asymmetric:
+            return {"keys": []}
+        return {"keys": [self.verification_key.to_dict()]}
+
+
+def _read_key_file(path: str) -> Optional[str]:
+    if not path:
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def load_jwt_keys(
+    algorithm: str,
+    secret: Optional[str] = None,
+    private_key_pem: Optional[str] = None,
+    public_key_pem: Optional[str] = None,
+) -> JWTKeys:
+    """
+    - HS* algoritmalarda secret hem imzalama hem doğrulama anahtarıdır
+    - RS* / ES* / PS* algoritmalarda private key ile imzalanır, public key ile
+      doğrulanır; public key verilmezse private key'den türetilir
+    """
+    if not algorithm.startswith("HS"):
+        signing_key = jwk.construct(private_key_pem, algorithm) if private_key_pem else None
+        if public_key_pem:
+            verification_key = jwk.construct(public_key_pem, algorithm)
+        elif signing_key is not None:
+            verification_key = signing_key.public_key()
+        else:
+            raise RuntimeError(
+                f"{algorithm} requires JWT_PRIVATE_KEY_PATH or JWT_PUBLIC_KEY_PATH."
+            )
+        return JWTKeys(algorithm, signing_key, verification_key)
+
+    key = jwk.construct(secret, algorithm)
+    return JWTKeys(algorithm, key, key)
+
+
+# Süreç başında bir kez yüklenir
+jwt_keys = load_jwt_keys(
+    settings.JWT_ALGORITHM,
+    secret=settings.JWT_SECRET_KEY,
+    private_key_pem=_read_key_file(settings.JWT_PRIVATE_KEY_PATH),
+    public_key_pem=_read_key_file(settings.JWT_PUBLIC_KEY_PATH),
+)
+
+# Aynı token'ın istemcinin ardışık isteklerinde tekrar tekrar doğrulanmaması için:
+# token özeti (sha256) -> claim'ler, en geç token'ın exp zamanına kadar
+token_cache = TTLCache(
+    max_size=settings.JWT_DECODE_CACHE_SIZE,
+    ttl_seconds=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
 def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None) -> str:
     """
     JWT Access Token oluşturur.
     """
+    if jwt_keys.signing_key is None:
+        raise RuntimeError("JWT signing key is not configured (JWT_PRIVATE_KEY_PATH).")
+
     to_encode = data.copy()
+    now = datetime.now(timezone.utc)
 
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
+        expire = now + timedelta(
             minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
         )
 
     to_encode.update({"exp": expire})
+    # Kullanıcı bazlı iptal (rol / tenant değişimi) bu andan önce verilen token'ları reddeder;
+    # saniyenin altındaki hassasiyet, iptalden hemen sonra alınan token'ı ayırmak için
+    to_encode.setdefault("iat", now.timestamp())
+    # Token'ı tek tek iptal edebilmek (logout) için benzersiz kimlik
+    to_encode.setdefault("jti", uuid.uuid4().hex)
 
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
-        algorithm=ALGORITHM
+        jwt_keys.signing_key,
+        algorithm=jwt_keys.algorithm,
     )
     return encoded_jwt
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def decode_access_token(token: str) -> dict:
     """
-    Şifreyi doğrular (Bcrypt kullanarak).
+    Token'ı doğrular ve claim'lerini döner; geçersizse JWTError fırlatır.
+    Doğrulanmış token'lar exp'lerine kadar cache'ten döner (imza tekrar kontrol edilmez).
     """
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    claims = token_cache.get(digest) if token_cache.enabled else None
+    if claims is not None:
+        return dict(claims)
+
+    claims = jwt.decode(
+        token,
+        jwt_keys.verification_key,
+        algorithms=[jwt_keys.algorithm],
+    )
+
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)):
+        token_cache.set(digest, claims, ttl_seconds=exp - time.time())
+    return dict(claims)
+
+
+# bcrypt istek thread'inde değil, sınırlı bir havuzda çalışır; böylece login /
+# kayıt patlamaları FastAPI threadpool'unu doldurup diğer endpoint'leri bekletmez
+password_executor = BoundedExecutor(
+    max_workers=settings.BCRYPT_MAX_WORKERS,
+    max_queue=settings.BCRYPT_MAX_QUEUE,
+    thread_name_prefix="bcrypt",
+)
+
+
+def _checkpw(plain_password: str, hashed_password: str) -> bool:
     # Bcrypt byte formatında çalışır, bu yüzden encode ediyoruz.
     return bcrypt.checkpw(
         plain_password.encode('utf-8'),
@@ -45,12 +164,58 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
+def _hashpw(password: str) -> str:
+    # Rastgele salt ile hashle ve string olarak dön
+    pwd_bytes = password.encode('utf-8')
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    hashed = bcrypt.hashpw(pwd_bytes, salt)
+    return hashed.decode('utf-8')
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Şifreyi doğrular (Bcrypt kullanarak).
+    Havuz doluysa ExecutorSaturated fırlatır.
+    """
+    return password_executor.run(_checkpw, plain_password, hashed_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    verify_password'ün async endpoint'ler için olan karşılığı.
+    """
+    return await password_executor.run_async(_checkpw, plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """
     Şifreyi hashler (Bcrypt kullanarak).
+    Havuz doluysa ExecutorSaturated fırlatır.
     """
-    # Rastgele salt ile hashle ve string olarak dön
-    pwd_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(pwd_bytes, salt)
-    return hashed.decode('utf-8')
\ No newline at end of file
+    return password_executor.run(_hashpw, password)
+
+
+def get_password_hashes(passwords: Iterable[str]) -> List[str]:
+    """
+    Birden çok şifreyi bcrypt havuzunda paralel hashler (toplu kullanıcı ekleme).
+    Havuz doluysa ExecutorSaturated fırlatır.
+    """
+    return password_executor.map(_hashpw, passwords)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    get_password_hash'in async endpoint'ler için olan karşılığı.
+    """
+    return await password_executor.run_async(_hashpw, password)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Hash, ayarlardaki BCRYPT_ROUNDS dışında bir maliyetle üretildiyse True döner.
+    Format: $2b$<rounds>$<salt+hash>
+    """
+    try:
+        return int(hashed_password.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
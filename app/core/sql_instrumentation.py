@@ -0,0 +1,272 @@
+# app/core/sql_instrumentation.py
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+slow_query_logger = logging.getLogger("app.slow_query")
+
+
+class QueryStats:
+    """
+    Tek bir isteğin çalıştırdığı SQL ifadelerinin sayısı ve toplam DB süresi.
+    Sync endpoint'ler threadpool'da çalıştığı için sayaçlar kilitle güncellenir.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.statements = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, duration: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_time += duration
+            self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        threshold veya daha fazla kez çalışan (olası N+1) ifadeler, çoktan aza.
+        """
+        return [(s, n) for s, n in self.statements.most_common() if n >= threshold]
+
+
+class RequestContext:
+    """
+    Sorguları isteğe bağlamak için tutulan bilgiler.
+    tenant_id / user_id, kimlik doğrulandığında get_current_user tarafından doldurulur.
+    """
+
+    __slots__ = ("scope", "tenant_id", "user_id")
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.tenant_id = None
+        self.user_id = None
+
+    @property
+    def route(self) -> str:
+        # Router eşleştikten sonra şablon yol (/api/v1/clients/{client_id}) kullanılır
+        return f"{self.scope.get('method')} {_route_template(self.scope)}"
+
+
+def _route_template(scope) -> str:
+    path = scope.get("path", "")
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if not template:
+        return path
+
+    # Dahil edilen router'ların route.path'i prefix'siz olabilir; istek yolunun
+    # route'a karşılık gelen sonek kısmı şablonla değiştirilir.
+    try:
+        concrete = getattr(route, "path_format", template).format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return path
+    if concrete and path.endswith(concrete):
+        return path[: len(path) - len(concrete)] + template
+    return path
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("sql_query_stats", default=None)
+_current_request: ContextVar[Optional[RequestContext]] = ContextVar("sql_request_context", default=None)
+
+
+def start_request_stats() -> Tuple[QueryStats, object]:
+    """
+    Yeni bir istek için sayaç başlatır; (stats, token) döner.
+    """
+    stats = QueryStats()
+    return stats, _current_stats.set(stats)
+
+
+def stop_request_stats(token) -> None:
+    _current_stats.reset(token)
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def start_request_context(scope) -> object:
+    return _current_request.set(RequestContext(scope))
+
+
+def stop_request_context(token) -> None:
+    _current_request.reset(token)
+
+
+def set_request_user(tenant_id: int, user_id: int) -> None:
+    """
+    Aktif isteğin kullanıcısını işaretler. Context nesnesi paylaşıldığı için
+    threadpool'da çalışan sync dependency'lerden de çağrılabilir.
+    """
+    ctx = _current_request.get()
+    if ctx is not None:
+        ctx.tenant_id = tenant_id
+        ctx.user_id = user_id
+
+
+# --- Yavaş sorgular ---
+_WHITESPACE = re.compile(r"\s+")
+_PARAM_MARKER = re.compile(r"%\(\w+\)s|%s|\$\d+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN \(\?(?:, \?)*\)", re.IGNORECASE)
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Gruplama için ifadeyi sadeleştirir: literal ve parametreler '?' olur,
+    IN (...) listeleri tekilleştirilir, boşluklar sadeleşir.
+    """
+    s = _WHITESPACE.sub(" ", statement).strip()
+    s = _PARAM_MARKER.sub("?", s)
+    s = _STRING_LITERAL.sub("?", s)
+    s = _NUMBER_LITERAL.sub("?", s)
+    return _IN_LIST.sub("IN (...)", s)
+
+
+def parameters_shape(parameters, executemany: bool = False):
+    """
+    Parametrelerin değerlerini değil, yapısını (isim/tip) döner.
+    """
+    if executemany and parameters:
+        return {"executemany": len(parameters), "row": parameters_shape(parameters[0])}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+class SlowQueryLog:
+    """
+    Eşik süresini aşan sorguların sınırlı boyutlu (ring buffer) kaydı.
+    """
+
+    def __init__(self, maxlen: int):
+        self._entries = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def record(self, entry: dict) -> None:
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self) -> List[dict]:
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def top(self, limit: int = 20, tenant_id: Optional[int] = None) -> List[dict]:
+        """
+        Kayıtları normalize edilmiş ifadeye göre gruplar; toplam süreye göre sıralar.
+        """
+        groups = {}
+        for entry in self.entries():
+            if tenant_id is not None and entry["tenant_id"] != tenant_id:
+                continue
+            group = groups.get(entry["statement"])
+            if group is None:
+                group = groups[entry["statement"]] = {
+                    "statement": entry["statement"],
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "tenants": Counter(),
+                    "routes": Counter(),
+                    "last_seen": entry["timestamp"],
+                }
+            group["count"] += 1
+            group["total_ms"] += entry["duration_ms"]
+            group["max_ms"] = max(group["max_ms"], entry["duration_ms"])
+            group["tenants"][entry["tenant_id"]] += 1
+            group["routes"][entry["route"]] += 1
+            group["last_seen"] = max(group["last_seen"], entry["timestamp"])
+
+        result = sorted(groups.values(), key=lambda g: g["total_ms"], reverse=True)[:limit]
+        for group in result:
+            group["avg_ms"] = round(group["total_ms"] / group["count"], 1)
+            group["total_ms"] = round(group["total_ms"], 1)
+            group["tenants"] = [
+                {"tenant_id": t, "count": n} for t, n in group["tenants"].most_common(5)
+            ]
+            group["routes"] = [
+                {"route": r, "count": n} for r, n in group["routes"].most_common(5)
+            ]
+        return result
+
+
+slow_query_log = SlowQueryLog(settings.SLOW_QUERY_BUFFER_SIZE)
+
+
+def _record_slow_query(statement, parameters, executemany, duration: float) -> None:
+    ctx = _current_request.get()
+    entry = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "duration_ms": round(duration * 1000, 1),
+        "statement": normalize_statement(statement),
+        "parameters": parameters_shape(parameters, executemany),
+        "tenant_id": ctx.tenant_id if ctx else None,
+        "user_id": ctx.user_id if ctx else None,
+        "route": ctx.route if ctx else None,
+    }
+    slow_query_log.record(entry)
+    slow_query_logger.warning(json.dumps({"event": "slow_query", **entry}, ensure_ascii=False))
+
+
+# --- SQLAlchemy dinleyicileri ---
+# Başlangıç zamanı ifadenin execution context'inde tutulur: hata veren ifadeler
+# after_cursor_execute'a ulaşmaz, context'leri de bağlantıda birikmeden atılır.
+_START_TIME_ATTR = "_sql_instrumentation_start"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        setattr(context, _START_TIME_ATTR, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, _START_TIME_ATTR, None)
+    if start is None:
+        return
+    duration = time.perf_counter() - start
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+
+    threshold_ms = settings.SLOW_QUERY_THRESHOLD_MS
+    if threshold_ms > 0 and duration * 1000 >= threshold_ms:
+        _record_slow_query(statement, parameters, executemany, duration)
+
+
+_installed = False
+
+
+def install_sql_instrumentation() -> None:
+    """
+    Tüm engine'lere (primary, replica'lar ve async engine'lerin sync çekirdeği)
+    cursor seviyesinde zamanlama dinleyicilerini bir kez ekler.
+    """
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _installed = True
@@ -1,22 +1,118 @@
 # app/database.py
 
-from sqlalchemy import create_engine
+import itertools
+import threading
+import time
+
+from fastapi import Request
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.schema import CreateColumn, CreateIndex
 
 from app.core.config import settings
+from app.core.metrics import Histogram
+
+
+def _database_url(driver: str, host: str, port: int) -> str:
+    return (
+        f"postgresql+{driver}://{settings.DB_USER}:"
+        f"{settings.DB_PASSWORD}@{host}:"
+        f"{port}/{settings.DB_NAME}"
+    )
+
+
+def _replica_addresses() -> list:
+    """
+    DB_REPLICA_HOSTS ayarını (host, port) listesine çevirir.
+    """
+    addresses = []
+    for item in settings.DB_REPLICA_HOSTS.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        host, _, port = item.partition(":")
+        addresses.append((host, int(port) if port else settings.DB_PORT))
+    return addresses
+
+
+DATABASE_URL = _database_url("psycopg2", settings.DB_HOST, settings.DB_PORT)
+
+# Event loop üzerinde çalışan endpoint'ler için asyncpg sürücüsü
+ASYNC_DATABASE_URL = _database_url("asyncpg", settings.DB_HOST, settings.DB_PORT)
+
+# Yazma yapan istemciyi primary'ye sabitleyen cookie (değeri: bitiş zamanı, epoch)
+PRIMARY_PIN_COOKIE = "db_primary_pin"
+
+# Bağlantı bekleme süresi kovaları (saniye)
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class _InstrumentedPoolMixin:
+    """
+    Havuzdan bağlantı alma (checkout) süresini ölçer.
+    Ölçülen süre; havuzda bekleme + gerekirse yeni bağlantı açma süresidir.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_time = Histogram(POOL_WAIT_BUCKETS)
+        self.timeouts = 0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.wait_time.observe(time.perf_counter() - start)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
 
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
 
-DATABASE_URL = (
-    f"postgresql+psycopg2://{settings.DB_USER}:"
-    f"{settings.DB_PASSWORD}@{settings.DB_HOST}:"
-    f"{settings.DB_PORT}/{settings.DB_NAME}"
+
+class _RoundRobin:
+    """
+    Replica session factory'leri arasında sırayla (round-robin) seçim yapar.
+    """
+
+    def __init__(self, items):
+        self.items = list(items)
+        self._cycle = itertools.cycle(self.items)
+        self._lock = threading.Lock()
+
+    def __bool__(self):
+        return bool(self.items)
+
+    def pick(self):
+        with self._lock:
+            return next(self._cycle)
+
+
+POOL_OPTIONS = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
 )
 
 
 engine = create_engine(
     DATABASE_URL,
     echo=False,          # SQL logları görmek istersen True yap
-    future=True
+    future=True,
+    poolclass=InstrumentedQueuePool,
+    **POOL_OPTIONS,
 )
 
 SessionLocal = sessionmaker(
@@ -25,9 +121,116 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=False,
+    poolclass=InstrumentedAsyncQueuePool,
+    **POOL_OPTIONS,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    # Async tarafta commit sonrası lazy refresh yapılamadığı için kapalı
+    expire_on_commit=False,
+)
+
+# --- Read Replica'lar (opsiyonel) ---
+replica_engines = [
+    create_engine(
+        _database_url("psycopg2", host, port),
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        **POOL_OPTIONS,
+    )
+    for host, port in _replica_addresses()
+]
+
+async_replica_engines = [
+    create_async_engine(
+        _database_url("asyncpg", host, port),
+        poolclass=InstrumentedAsyncQueuePool,
+        **POOL_OPTIONS,
+    )
+    for host, port in _replica_addresses()
+]
+
+ReplicaSessions = _RoundRobin(
+    sessionmaker(autocommit=False, autoflush=False, bind=e)
+    for e in replica_engines
+)
+
+AsyncReplicaSessions = _RoundRobin(
+    async_sessionmaker(bind=e, autoflush=False, expire_on_commit=False)
+    for e in async_replica_engines
+)
+
 Base = declarative_base()
 
 
+def get_pool_stats(bind=None) -> dict:
+    """
+    Bağlantı havuzunun anlık durumunu döner.
+    Pool boyutunu uvicorn worker sayısına göre ayarlarken kullanılır.
+    """
+    # AsyncEngine verilirse altındaki sync engine'in havuzu okunur
+    bind = getattr(bind, "sync_engine", bind) or engine
+    pool = bind.pool
+    stats = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        # QueuePool, boş slotları negatif overflow olarak raporlar
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "timeout_seconds": settings.DB_POOL_TIMEOUT,
+    }
+    if isinstance(pool, _InstrumentedPoolMixin):
+        stats["timeouts"] = pool.timeouts
+        stats["wait_time_seconds"] = pool.wait_time.snapshot()
+    return stats
+
+
+def ensure_columns(bind=None) -> None:
+    """
+    Model'lere sonradan eklenen kolonları, eksikse ALTER TABLE ... ADD COLUMN ile ekler.
+    Sadece boş bırakılabilen veya server_default'u olan kolonlar eklenebilir
+    (mevcut satırlar için değer gerekir).
+    """
+    bind = bind or engine
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                if not column.nullable and column.server_default is None:
+                    raise RuntimeError(
+                        f"{table.name}.{column.name} NOT NULL ve server_default yok; elle eklenmeli"
+                    )
+                ddl = CreateColumn(column).compile(dialect=conn.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+
+
+def ensure_indexes(bind=None) -> None:
+    """
+    Model'lerde tanımlı index'leri, eksikse oluşturur.
+    create_all var olan tabloları atladığı için sonradan eklenen index'ler
+    mevcut veritabanlarına bu fonksiyonla uygulanır.
+    IF NOT EXISTS kullanılır: ifade içeren index'ler (coalesce, desc) reflection'da
+    görünmediği için checkfirst onları tekrar oluşturmaya çalışır.
+    """
+    bind = bind or engine
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                conn.execute(CreateIndex(index, if_not_exists=True))
+
+
 # --- Dependency Injection ---
 def get_db():
     """
@@ -40,3 +243,65 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def is_pinned_to_primary(request: Request) -> bool:
+    """
+    İstemci son DB_READ_YOUR_WRITES_SECONDS içinde yazma yaptıysa True döner.
+    Bu durumda okumalar da primary'den yapılır (read-your-writes).
+    """
+    value = request.cookies.get(PRIMARY_PIN_COOKIE)
+    if not value:
+        return False
+    try:
+        return float(value) > time.time()
+    except ValueError:
+        return False
+
+
+def read_session_factory(request: Request):
+    """
+    Okuma için kullanılacak session factory'sini seçer:
+    - Replica tanımlıysa ve istemci primary'ye sabitlenmemişse bir replica
+    - Aksi halde primary (SessionLocal)
+    """
+    if ReplicaSessions and not is_pinned_to_primary(request):
+        return ReplicaSessions.pick()
+    return SessionLocal
+
+
+def get_read_db(request: Request):
+    """
+    FastAPI dependency (salt okunur endpoint'ler için):
+    - Replica tanımlıysa ve istemci primary'ye sabitlenmemişse replica'ya bağlı session açar
+    - Aksi halde get_db ile aynı şekilde primary kullanılır
+    """
+    db = read_session_factory(request)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """
+    FastAPI dependency (async):
+    - AsyncSession açar
+    - endpoint bitince otomatik kapatır
+    Threadpool'a düşmeden event loop üzerinde çalışan endpoint'ler içindir.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+
+async def get_async_read_db(request: Request):
+    """
+    get_read_db'nin async karşılığı.
+    """
+    factory = AsyncSessionLocal
+    if AsyncReplicaSessions and not is_pinned_to_primary(request):
+        factory = AsyncReplicaSessions.pick()
+
+    async with factory() as db:
+        yield db
@@ -1,13 +1,50 @@
 # app/main.py
 
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
-from app.database import Base, engine
+from app.core import security
+from app.core.config import settings
+from app.core.executor import ExecutorSaturated
+from app.core.middleware import (
+    ReadYourWritesMiddleware,
+    RequestContextMiddleware,
+    SQLInstrumentationMiddleware,
+)
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.sql_instrumentation import install_sql_instrumentation
+from app.database import (
+    engine,
+    async_engine,
+    ASYNC_DATABASE_URL,
+    replica_engines,
+    async_replica_engines,
+    get_pool_stats,
+)
 from app import models
+from app.services import auth_service
+from app.services.ai_job_events import (
+    broker as ai_job_event_broker,
+    install_event_hooks as install_ai_job_event_hooks,
+    listener_dsn,
+    run_ai_job_event_listener,
+)
+from app.services.audit_log_hooks import install_audit_hooks
+from app.services.audit_log_partitions import run_audit_log_maintainer
+from app.services.audit_log_writer import audit_log_writer
+from app.services.token_revocation_service import (
+    refresh_revocation_list,
+    revocation_list,
+    run_revocation_refresher,
+)
 from app.routers import auth
+from app.routers import users
 from app.routers import appointment
 from app.routers import clients
 from app.routers import practitioners
@@ -20,6 +57,9 @@ from app.routers import ai_jobs
 from app.routers import ai_summaries
 from app.routers import tenants
 from app.routers import client_consents
+from app.routers import exports
+from app.routers import admin
+from app.routers import audit_logs
 API_PREFIX = "/api/v1"
 
 
@@ -27,14 +67,53 @@ API_PREFIX = "/api/v1"
 async def lifespan(app: FastAPI):
     """
     Uygulama yaşam döngüsü:
-    - Startup: DB tablolarını oluştur
-    - Shutdown: Şimdilik özel bir şey yapmıyoruz
+    - Startup: token iptal listesini yükle, audit log yazıcısını ve AI iş
+      olayları dinleyicisini başlat. Şema değiştirilmez; tablo, kolon, index ve
+      audit log bölümleri deploy'da scripts.migrate_schema ile güncellenir.
+    - Shutdown: Arka plan görevlerini durdur, bekleyen audit log'ları yaz,
+      engine'leri (primary ve replica'lar, sync ve async) kapat
     """
     # --- STARTUP ---
-    Base.metadata.create_all(bind=engine)
+    refresh_revocation_list()
+    if settings.AUDIT_LOG_MODE == "buffered":
+        audit_log_writer.start()
+    refresher = None
+    if settings.AUTH_REVOCATION_REFRESH_SECONDS > 0:
+        refresher = asyncio.create_task(
+            run_revocation_refresher(settings.AUTH_REVOCATION_REFRESH_SECONDS)
+        )
+    maintainer = None
+    if settings.AUDIT_LOG_MAINTENANCE_INTERVAL_SECONDS > 0:
+        maintainer = asyncio.create_task(
+            run_audit_log_maintainer(settings.AUDIT_LOG_MAINTENANCE_INTERVAL_SECONDS)
+        )
+    ai_job_events = None
+    if settings.AI_JOB_EVENTS_ENABLED:
+        ai_job_event_broker.start()
+        install_ai_job_event_hooks()
+        if engine.dialect.name == "postgresql":
+            # Diğer süreçlerin (API worker'ları, AI worker'ları) olayları NOTIFY ile gelir
+            ai_job_events = asyncio.create_task(run_ai_job_event_listener(
+                listener_dsn(ASYNC_DATABASE_URL),
+                settings.AI_JOB_EVENTS_RECONNECT_SECONDS,
+            ))
     yield
     # --- SHUTDOWN ---
-    # İleride background task cleanup vs. eklenebilir.
+    security.password_executor.shutdown()
+    # Kuyrukta bekleyen audit log kayıtlarını yaz
+    await run_in_threadpool(audit_log_writer.stop)
+    for task in (refresher, maintainer, ai_job_events):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    ai_job_event_broker.stop()
+    await async_engine.dispose()
+    for replica in async_replica_engines:
+        await replica.dispose()
+    engine.dispose()
+    for replica in replica_engines:
+        replica.dispose()
 
 
 app = FastAPI(
@@ -60,8 +139,35 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Frontend'in sonraki sayfa cursor'ını okuyabilmesi için
+    expose_headers=[NEXT_CURSOR_HEADER, "X-DB-Query-Count", "X-DB-Time-Ms", "X-DB-N-Plus-One"],
 )
 
+# Replica kullanılıyorsa, yazma yapan istemcinin okumalarını kısa süre primary'ye sabitle
+if replica_engines and settings.DB_READ_YOUR_WRITES_SECONDS > 0:
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        window_seconds=settings.DB_READ_YOUR_WRITES_SECONDS,
+    )
+
+
+# Geliştirme modunda istek başına SQL sayısı / DB süresi ve N+1 uyarıları
+if settings.DEBUG:
+    logging.basicConfig(level=logging.INFO)
+    app.add_middleware(
+        SQLInstrumentationMiddleware,
+        n_plus_one_threshold=settings.SQL_N_PLUS_ONE_THRESHOLD,
+    )
+
+# Yavaş sorguları route / tenant / kullanıcı ile etiketlemek için istek bağlamı;
+# URL'deki token'ları erişim loglarından sildiği için her zaman eklenir
+if settings.DEBUG or settings.SLOW_QUERY_THRESHOLD_MS > 0:
+    install_sql_instrumentation()
+app.add_middleware(RequestContextMiddleware)
+
+# Unit-of-work audit: audit satırları iş transaction'ına flush hook'u ile eklenir
+if settings.AUDIT_LOG_MODE == "transactional":
+    install_audit_hooks()
 
 # --- Healthcheck / Root ---
 @app.get("/", tags=["system"])
@@ -73,11 +179,79 @@ def read_root():
     }
 
 
+@app.exception_handler(ExecutorSaturated)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturated):
+    """
+    bcrypt havuzu dolu: isteği kuyrukta bekletmek yerine hemen reddet.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy, please retry shortly."},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.get("/health", tags=["system"])
 def health_check():
     return {"status": "healthy"}
 
 
+# Aşağıdaki ayrıntılı sayaçlar (havuzlar, cache'ler, kuyruklar) iç yapıyı ve
+# trafik hacmini gösterir; sadece sistem yöneticileri. Liveness için /health yeterli.
+
+
+@app.get("/health/db-pool", tags=["system"])
+def db_pool_stats(current_user: models.User = Depends(auth_service.get_current_admin)):
+    """
+    Veritabanı bağlantı havuzunun anlık istatistikleri
+    (checked-out, overflow, bekleme süresi histogramı).
+    """
+    return {
+        "sync": get_pool_stats(engine),
+        "async": get_pool_stats(async_engine),
+        "replicas": [get_pool_stats(e) for e in replica_engines],
+        "async_replicas": [get_pool_stats(e) for e in async_replica_engines],
+    }
+
+
+@app.get("/health/auth-cache", tags=["system"])
+def auth_cache_stats(current_user: models.User = Depends(auth_service.get_current_admin)):
+    """
+    get_current_user kullanıcı cache'inin ve doğrulanmış token cache'inin
+    hit / miss / eviction sayaçları, token iptal listesinin boyutu / son yenilenme zamanı.
+    """
+    return {
+        "user_cache": auth_service.user_cache.stats(),
+        "token_cache": security.token_cache.stats(),
+        "revocation_list": revocation_list.stats(),
+    }
+
+
+@app.get("/health/password-hashing", tags=["system"])
+def password_hashing_stats(current_user: models.User = Depends(auth_service.get_current_admin)):
+    """
+    bcrypt havuzunun doluluk ve reddedilen iş sayıları.
+    """
+    return security.password_executor.stats()
+
+
+@app.get("/health/audit-log", tags=["system"])
+def audit_log_writer_stats(current_user: models.User = Depends(auth_service.get_current_admin)):
+    """
+    Write-behind audit log yazıcısının kuyruk ve yazım sayaçları.
+    """
+    return audit_log_writer.stats()
+
+
+@app.get("/health/ai-job-events", tags=["system"])
+def ai_job_event_stats(current_user: models.User = Depends(auth_service.get_current_admin)):
+    """
+    AI iş olayları (SSE / WebSocket) aboneleri ve yayınlanan / teslim edilen /
+    yavaş istemci yüzünden atılan olay sayaçları.
+    """
+    return ai_job_event_broker.stats()
+
+
 # --- Routers ---
 
 # Auth endpoints:
@@ -85,6 +259,7 @@ def health_check():
 # POST   /api/v1/auth/login
 # GET    /api/v1/auth/me
 app.include_router(auth.router, prefix=API_PREFIX)
+app.include_router(users.router, prefix=API_PREFIX)
 app.include_router(appointment.router, prefix=API_PREFIX)
 app.include_router(clients.router, prefix=API_PREFIX)
 app.include_router(practitioners.router, prefix=API_PREFIX)
@@ -96,4 +271,7 @@ app.include_router(subscriptions.router, prefix=API_PREFIX)
 app.include_router(ai_jobs.router, prefix=API_PREFIX)
 app.include_router(ai_summaries.router, prefix=API_PREFIX)
 app.include_router(tenants.router, prefix=API_PREFIX)
-app.include_router(client_consents.router, prefix=API_PREFIX)
\ No newline at end of file
+app.include_router(client_consents.router, prefix=API_PREFIX)
+app.include_router(exports.router, prefix=API_PREFIX)
+app.include_router(admin.router, prefix=API_PREFIX)
+app.include_router(audit_logs.router, prefix=API_PREFIX)
\ No newline at end of file
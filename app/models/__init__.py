@@ -2,6 +2,7 @@
 from .tenant import Tenant
 from .user import User
 from .practitioner_profile import PractitionerProfile
+from .revoked_token import RevokedToken
 
 # Client domain
 from .client import Client
@@ -15,6 +16,7 @@ from .session_note import SessionNote
 # AI pipeline domain
 from .ai_job import AIJob
 from .ai_summary import AISummary
+from .ai_summary_cache import AISummaryCache
 
 # Reports
 from .report import Report
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, ForeignKey, Index, func, text
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -12,7 +12,7 @@ class AIJob(Base):
     tenant_id = Column(Integer, ForeignKey("tenants.id"), nullable=False)
 
     type = Column(String(50), nullable=False)          # örn: "summary", "risk_flags"
-    status = Column(String(50), nullable=False)        # queued / running / done / failed
+    status = Column(String(50), nullable=False)        # PENDING / RUNNING / COMPLETED / FAILED
 
     input_ref_type = Column(String(50), nullable=False)  # "session", "session_note" vs.
     input_ref_id = Column(Integer, nullable=False)
@@ -21,12 +21,88 @@ class AIJob(Base):
     prompt_version = Column(String(50), nullable=True)
 
     payload = Column(Text, nullable=True)             # ham prompt / input
+
+    # INTERACTIVE / BATCH: kuyrukta INTERACTIVE işler önce alınır
+    priority = Column(String(20), nullable=False, default="INTERACTIVE", server_default="INTERACTIVE")
     error_message = Column(Text, nullable=True)
 
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     started_at = Column(DateTime, nullable=True)
     finished_at = Column(DateTime, nullable=True)
 
+    # Worker kiralaması (lease): işi alan worker ve kiranın bitişi.
+    # Worker heartbeat ile süreyi uzatır; süresi dolan RUNNING işler tekrar alınır.
+    worker_id = Column(String(100), nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # İstemcinin gönderdiği Idempotency-Key header'ı (tenant içinde benzersiz)
+    idempotency_key = Column(String(255), nullable=True)
+
+    # Sonuç AI özet cache'inden mi geldi (model çağrılmadı); cache isabet oranı için
+    cache_hit = Column(Boolean, nullable=True)
+
+    __table_args__ = (
+        # Tenant'ın iş listesi, en yeniden eskiye
+        Index("ix_ai_jobs_tenant_created_at", tenant_id, created_at.desc(), id.desc()),
+        # Worker kuyruğu: bekleyen işler eskiden yeniye (sadece PENDING satırlar)
+        Index(
+            "ix_ai_jobs_pending_created_at",
+            created_at, id,
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+        # Adil kuyruk: tenant + öncelik içinde bekleyen işlerin sırası
+        Index(
+            "ix_ai_jobs_pending_tenant_priority_created_at",
+            tenant_id, priority, created_at, id,
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+        # Kuyrukta bekleme süresi metrikleri (son X saatte başlayan işler)
+        Index("ix_ai_jobs_started_at", started_at),
+        # Adil kuyruk: tenant'ın son AI_JOB_FAIR_WINDOW_SECONDS içinde başlattığı işler
+        Index("ix_ai_jobs_tenant_started_at", tenant_id, started_at),
+        Index(
+            "ix_ai_jobs_running_tenant_started_at",
+            tenant_id, started_at,
+            postgresql_where=text("status = 'RUNNING'"),
+            sqlite_where=text("status = 'RUNNING'"),
+        ),
+        # Toplu (batch) iş alma: aynı model + prompt sürümündeki bekleyen işler eskiden yeniye
+        Index(
+            "ix_ai_jobs_pending_model_created_at",
+            func.coalesce(model_name, ""), func.coalesce(prompt_version, ""), created_at, id,
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+        # Süresi dolmuş kiraların bulunması (sadece RUNNING satırlar)
+        Index(
+            "ix_ai_jobs_running_lease",
+            lease_expires_at,
+            postgresql_where=text("status = 'RUNNING'"),
+            sqlite_where=text("status = 'RUNNING'"),
+        ),
+        # Aynı girdi için aynı anda tek bir bekleyen / çalışan iş (tekrarlanan istekler)
+        Index(
+            "ix_ai_jobs_dedup_inflight",
+            tenant_id, type, input_ref_type, input_ref_id,
+            func.coalesce(model_name, ""), func.coalesce(prompt_version, ""),
+            unique=True,
+            postgresql_where=text("status IN ('PENDING', 'RUNNING')"),
+            sqlite_where=text("status IN ('PENDING', 'RUNNING')"),
+        ),
+        # Yakın zamanda tamamlanmış aynı işin bulunması
+        Index("ix_ai_jobs_tenant_input", tenant_id, input_ref_type, input_ref_id, created_at.desc()),
+        Index(
+            "ix_ai_jobs_tenant_idempotency_key",
+            tenant_id, idempotency_key,
+            unique=True,
+            postgresql_where=text("idempotency_key IS NOT NULL"),
+            sqlite_where=text("idempotency_key IS NOT NULL"),
+        ),
+    )
+
     # ilişkiler (Tenant, AISummary) – diğer modelleri yazınca aktif olur
     tenant = relationship("Tenant", back_populates="ai_jobs", lazy="joined", overlaps="ai_jobs")
     summaries = relationship("AISummary", back_populates="job", lazy="selectin")
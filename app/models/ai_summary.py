@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -21,6 +21,14 @@ class AISummary(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Özet listesi (tümü / seans bazında), en yeniden eskiye
+    __table_args__ = (
+        Index("ix_ai_summaries_tenant_created_at", tenant_id, created_at.desc(), id.desc()),
+        Index("ix_ai_summaries_tenant_session_created_at", tenant_id, session_id, created_at.desc(), id.desc()),
+        # AIJob.summaries (selectin) yüklemesi için
+        Index("ix_ai_summaries_job_id", job_id),
+    )
+
     tenant = relationship("Tenant", back_populates="ai_summaries")
     session = relationship("Session", back_populates="ai_summaries")
     source_note = relationship("SessionNote", back_populates="ai_summaries")
@@ -0,0 +1,39 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+
+from app.database import Base
+
+
+class AISummaryCache(Base):
+    """
+    İçerik adresli AI özet cache'i: aynı metin + iş türü + model + prompt sürümü
+    için üretilmiş model çıktısı. Worker cache'te bulduğu çıktıyı modeli
+    çağırmadan AISummary olarak yazar.
+
+    Klinik içerik tenant'lar arasında paylaşılmaz; anahtar tenant içinde benzersizdir.
+    """
+
+    __tablename__ = "ai_summary_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    tenant_id = Column(Integer, ForeignKey("tenants.id"), nullable=False)
+
+    # sha256(iş türü, model, prompt sürümü, normalize edilmiş içerik) - hex
+    cache_key = Column(String(64), nullable=False)
+
+    summary_text = Column(Text, nullable=False)
+    key_points = Column(Text, nullable=True)  # AISummary ile aynı biçimde (JSON string)
+    risk_flags = Column(Text, nullable=True)
+
+    hit_count = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Eviction (TTL + tenant başına LRU) bu kolona göre yapılır
+    last_used_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_ai_summary_cache_tenant_key", tenant_id, cache_key, unique=True),
+        # Tenant başına en az kullanılan kayıtların silinmesi
+        Index("ix_ai_summary_cache_tenant_last_used_at", tenant_id, last_used_at.desc(), id.desc()),
+        # Süresi dolan kayıtların silinmesi
+        Index("ix_ai_summary_cache_last_used_at", last_used_at),
+    )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -28,6 +28,13 @@ class Appointment(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Randevu listesi; uzman / danışan takvimleri zaman aralığıyla artan sırada
+    __table_args__ = (
+        Index("ix_appointments_tenant_starts_at", tenant_id, starts_at.desc(), id.desc()),
+        Index("ix_appointments_tenant_practitioner_starts_at", tenant_id, practitioner_id, starts_at, id),
+        Index("ix_appointments_tenant_client_starts_at", tenant_id, client_id, starts_at, id),
+    )
+
     tenant = relationship("Tenant", back_populates="appointment")
     practitioner = relationship("User", back_populates="appointment")
     client = relationship("Client", back_populates="appointment")
@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import JSON, Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -16,9 +17,25 @@ class AuditLog(Base):
     entity_id = Column(Integer, nullable=True)
 
     action = Column(String(255), nullable=False)      # "CREATE", "UPDATE", "LOGIN" vb.
-    changes = Column(Text, nullable=True)             # JSON diff veya açıklama
+    # Sadece değişen alanlar: {"alan": [eski, yeni]}; Postgres'te JSONB
+    changes = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
 
+    # Postgres'te tablo bu kolona göre aylık bölümlenir; DB'deki PK (id, created_at)
+    # olur (scripts.partition_audit_logs, app.services.audit_log_partitions)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Tenant'ın audit akışı en yeniden eskiye.
+    # Kayıt / kullanıcı / işlem filtreleri kendi index'lerinde eşitlik + zaman aralığı
+    # olarak aranır ("client 123'e kim dokundu" => index seek)
+    __table_args__ = (
+        Index("ix_audit_logs_tenant_created_at", tenant_id, created_at.desc(), id.desc()),
+        Index(
+            "ix_audit_logs_tenant_entity_created_at",
+            tenant_id, entity_type, entity_id, created_at.desc(), id.desc(),
+        ),
+        Index("ix_audit_logs_tenant_user_created_at", tenant_id, user_id, created_at.desc(), id.desc()),
+        Index("ix_audit_logs_tenant_action_created_at", tenant_id, action, created_at.desc(), id.desc()),
+    )
+
     tenant = relationship("Tenant", back_populates="audit_logs")
     user = relationship("User", back_populates="audit_logs")
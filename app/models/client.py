@@ -1,5 +1,5 @@
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -29,6 +29,11 @@ class Client(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Danışan listesi ada göre sıralı
+    __table_args__ = (
+        Index("ix_clients_tenant_name", tenant_id, first_name, last_name, id),
+    )
+
     tenant = relationship("Tenant", back_populates="clients")
     primary_practitioner = relationship("User", back_populates="primary_clients")
 
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -18,4 +18,9 @@ class ClientConsent(Base):
     document_url = Column(String(255), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Danışanın onay geçmişi; tabloda tenant_id yok, client_id üzerinden aranır
+    __table_args__ = (
+        Index("ix_client_consents_client_created_at", client_id, created_at.desc(), id.desc()),
+    )
+
     client = relationship("Client", back_populates="consents")
@@ -1,5 +1,5 @@
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -23,6 +23,13 @@ class Report(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Rapor listesi; danışan / uzman filtreleri kendi index'lerinde
+    __table_args__ = (
+        Index("ix_reports_tenant_created_at", tenant_id, created_at.desc(), id.desc()),
+        Index("ix_reports_tenant_client_created_at", tenant_id, client_id, created_at.desc(), id.desc()),
+        Index("ix_reports_tenant_practitioner_created_at", tenant_id, practitioner_id, created_at.desc(), id.desc()),
+    )
+
     tenant = relationship("Tenant", back_populates="reports")
     client = relationship("Client", back_populates="reports")
     practitioner = relationship("User", back_populates="reports")
@@ -0,0 +1,23 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime
+
+from app.database import Base
+
+
+class RevokedToken(Base):
+    """
+    Süresi dolmadan geçersiz kılınan token'lar (logout) ve kullanıcılar
+    (silinen, rolü / tenant'ı değişen).
+    Kayıt, ilgili token'ların en geç bitiş zamanına (expires_at) kadar tutulur.
+    """
+    __tablename__ = "revoked_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Logout edilen token'ın jti'si; kullanıcı bazlı iptalde boş
+    jti = Column(String(64), nullable=True, index=True)
+    # Kullanıcı bazlı iptalde kullanıcının ID'si; created_at'ten önce verilen token'ları geçersiz
+    user_id = Column(Integer, nullable=True, index=True)
+
+    expires_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
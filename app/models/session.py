@@ -6,6 +6,7 @@ from sqlalchemy import (
     DateTime,
     Boolean,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import relationship
 
@@ -32,6 +33,12 @@ class Session(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Seans listesi (tümü / danışan bazında), en yeniden eskiye
+    __table_args__ = (
+        Index("ix_sessions_tenant_occurred_at", tenant_id, occurred_at.desc(), id.desc()),
+        Index("ix_sessions_tenant_client_occurred_at", tenant_id, client_id, occurred_at.desc(), id.desc()),
+    )
+
     # relationships
     tenant = relationship("Tenant", back_populates="session")
     practitioner = relationship("User", back_populates="session")
@@ -7,6 +7,7 @@ from sqlalchemy import (
     DateTime,
     Boolean,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import relationship
 
@@ -27,6 +28,11 @@ class SessionNote(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Seansın notları; tabloda tenant_id yok, session_id üzerinden aranır
+    __table_args__ = (
+        Index("ix_session_notes_session_created_at", session_id, created_at.desc(), id.desc()),
+    )
+
     session = relationship("Session", back_populates="notes")
     author = relationship("User", back_populates="session_notes")
     ai_summaries = relationship("AISummary", back_populates="source_note")
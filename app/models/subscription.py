@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -22,5 +22,10 @@ class Subscription(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Abonelik geçmişi, en yeni başlangıçtan eskiye
+    __table_args__ = (
+        Index("ix_subscriptions_tenant_starts_at", tenant_id, starts_at.desc(), id.desc()),
+    )
+
     tenant = relationship("Tenant", back_populates="subscriptions")
     plan = relationship("SubscriptionPlan", back_populates="subscriptions")
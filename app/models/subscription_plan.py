@@ -18,6 +18,9 @@ class SubscriptionPlan(Base):
     max_practitioners = Column(Integer, nullable=True)
     max_clients = Column(Integer, nullable=True)
 
+    # AI iş kuyruğunda tenant'ın adil paylaştırma ağırlığı (2 => ağırlığı 1 olan tenant'ın iki katı iş)
+    ai_job_weight = Column(Integer, nullable=False, default=1, server_default="1")
+
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     subscriptions = relationship("Subscription", back_populates="plan")
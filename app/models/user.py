@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, false
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -17,11 +17,17 @@ class User(Base):
 
     role = Column(String(50), nullable=False, default="OWNER") # owner / practitioner / assistant vs.
     is_active = Column(Boolean, default=True, nullable=False)
+    # Tenant'lar arası /admin endpoint'leri; API'den değil, scripts.grant_system_admin ile verilir
+    is_system_admin = Column(Boolean, default=False, server_default=false(), nullable=False)
 
     last_login_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_users_tenant_id", tenant_id, id),
+    )
+
     tenant = relationship("Tenant", back_populates="users")
     practitioner_profile = relationship(
         "PractitionerProfile", back_populates="user", uselist=False
@@ -0,0 +1,99 @@
+# app/routers/admin.py
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.sql_instrumentation import slow_query_log
+from app.database import get_read_db
+from app.services.ai_job_queue_service import AiJobQueueService
+from app.services.ai_summary_cache_service import AiSummaryCacheService
+from app.services.auth_service import get_current_admin
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+)
+
+
+@router.get("/slow-queries")
+def list_slow_queries(
+    limit: int = Query(20, ge=1, le=200),
+    tenant_id: Optional[int] = None,
+    current_user: models.User = Depends(get_current_admin),
+):
+    """
+    Eşik süresini aşan sorguları normalize edilmiş ifadeye göre gruplar ve
+    toplam süreye göre en maliyetli olanları döner.
+
+    Filtreler:
+    - **tenant_id**: Sadece belirli bir tenant'ın isteklerinden gelen sorgular.
+    """
+    return slow_query_log.top(limit=limit, tenant_id=tenant_id)
+
+
+@router.get("/slow-queries/recent")
+def list_recent_slow_queries(
+    limit: int = Query(50, ge=1, le=1000),
+    current_user: models.User = Depends(get_current_admin),
+):
+    """
+    Ring buffer'daki en son yavaş sorgu kayıtlarını (yeniden eskiye) döner.
+    """
+    return slow_query_log.entries()[::-1][:limit]
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries(
+    current_user: models.User = Depends(get_current_admin),
+):
+    """
+    Yavaş sorgu kayıtlarını temizler.
+    """
+    slow_query_log.clear()
+
+
+@router.get("/ai-summary-cache")
+def ai_summary_cache_stats(
+    hours: int = Query(24, ge=1, le=24 * 90),
+    tenant_id: Optional[int] = None,
+    db: Session = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_admin),
+):
+    """
+    Son `hours` saatte tamamlanan AI işleri üzerinden tenant başına özet cache
+    isabet oranı (hits / lookups) ve cache'teki kayıt sayısı.
+
+    Filtreler:
+    - **tenant_id**: Sadece belirli bir tenant.
+    """
+    return AiSummaryCacheService.hit_rates(
+        db,
+        since=datetime.utcnow() - timedelta(hours=hours),
+        tenant_id=tenant_id,
+    )
+
+
+@router.get("/ai-job-queue")
+def ai_job_queue_stats(
+    hours: int = Query(24, ge=1, le=24 * 30),
+    tenant_id: Optional[int] = None,
+    db: Session = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_admin),
+):
+    """
+    AI iş kuyruğunun tenant ve öncelik (INTERACTIVE / BATCH) başına durumu:
+    son `hours` saatte başlayan işlerin kuyrukta bekleme süreleri (ortalama,
+    p50, p95, en fazla) ile şu an bekleyen iş sayısı ve en eski işin yaşı.
+
+    Filtreler:
+    - **tenant_id**: Sadece belirli bir tenant.
+    """
+    return AiJobQueueService.queue_stats(
+        db,
+        since=datetime.utcnow() - timedelta(hours=hours),
+        tenant_id=tenant_id,
+    )
@@ -1,12 +1,36 @@
 # app/routers/ai_jobs.py
 
-from typing import List
-from fastapi import APIRouter, Depends, status
+import asyncio
+import json
+from typing import List, Optional
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.requests import HTTPConnection
 
 from app import schemas, models
-from app.database import get_db
-from app.services.auth_service import get_current_user
+from app.core.config import settings
+from app.core.pagination import PageParams, paginated
+from app.database import get_async_db, get_db, get_read_db
+from app.services.auth_service import (
+    create_stream_token,
+    get_current_principal,
+    get_current_user,
+    get_stream_principal,
+)
+from app.services.ai_job_events import broker, load_job_event
 from app.services.ai_job_service import AiJobService
 
 router = APIRouter(
@@ -22,37 +46,191 @@ router = APIRouter(
 )
 def create_ai_job(
     job_in: schemas.AiJobCreate,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
     Yeni bir AI işi (Job) oluşturur.
+
+    Aynı girdi (tür, kaynak, model, prompt sürümü) için bekleyen / çalışan ya da
+    yakın zamanda tamamlanmış bir iş varsa yeni iş açılmaz; mevcut iş 200 ile döner.
+    Idempotency-Key başlığıyla tekrarlanan istekler de aynı işi döner.
     """
-    return AiJobService.create_job(
+    job, created = AiJobService.create_job(
         db=db,
         current_user=current_user,
         data=job_in,
+        idempotency_key=idempotency_key,
     )
+    if not created:
+        response.status_code = status.HTTP_200_OK
+    return job
 
 
 @router.get("/", response_model=List[schemas.AiJobOut])
 def list_ai_jobs(
-    db: Session = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
     Tenant'a ait tüm AI işlerini listeler.
     """
-    return AiJobService.list_jobs(
+    result = AiJobService.list_jobs(
         db=db,
         tenant_id=current_user.tenant_id,
+        cursor=page.cursor,
+        limit=page.limit,
+    )
+    return paginated(response, result)
+
+
+@router.post("/stream-token", response_model=schemas.AiJobStreamToken)
+async def create_ai_job_stream_token(principal=Depends(get_current_principal)):
+    """
+    /ai-jobs/events ve /ai-jobs/ws'e tarayıcıdan bağlanmak için kısa ömürlü
+    (AI_JOB_STREAM_TOKEN_EXPIRE_SECONDS), sadece bu iki endpoint'te geçerli token.
+
+    EventSource / WebSocket API'leri header gönderemediği için token URL'de
+    (?stream_token=) taşınır; URL'ler proxy ve erişim loglarına girebildiğinden
+    uzun ömürlü access token yerine bu token kullanılır. Token sadece bağlantı
+    kurulurken doğrulanır; süresi dolsa da açık bağlantı kapanmaz.
+    """
+    return schemas.AiJobStreamToken(
+        stream_token=create_stream_token(principal),
+        expires_in=settings.AI_JOB_STREAM_TOKEN_EXPIRE_SECONDS,
     )
 
 
+async def _authenticate_stream(
+    connection: HTTPConnection, stream_token: Optional[str], db: AsyncSession
+):
+    """
+    Authorization: Bearer header'ındaki access token, yoksa stream_token query
+    parametresi (POST /ai-jobs/stream-token). Query'de access token kabul edilmez.
+    """
+    scheme, _, token = connection.headers.get("authorization", "").partition(" ")
+    try:
+        if scheme.lower() == "bearer" and token:
+            return await get_current_principal(token=token, db=db)
+        if stream_token:
+            return get_stream_principal(stream_token)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    finally:
+        # Bağlantı saatlerce açık kalabilir; DB bağlantısı stream boyunca tutulmasın
+        await db.close()
+
+
+async def _initial_events(db: AsyncSession, tenant_id: int, job_id: Optional[int]) -> list:
+    if job_id is None:
+        return []
+    try:
+        snapshot = await load_job_event(db, tenant_id, job_id)
+    finally:
+        await db.close()
+    return [snapshot] if snapshot else []
+
+
+def _sse(item: dict) -> str:
+    return f"event: {item['event']}\ndata: {json.dumps(item, ensure_ascii=False)}\n\n"
+
+
+@router.get("/events")
+async def stream_ai_job_events(
+    request: Request,
+    job_id: Optional[int] = None,
+    stream_token: Optional[str] = Query(None, description="POST /ai-jobs/stream-token'dan alınır"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Tenant'ın AI işlerindeki durum değişikliklerini ve kısmi çıktıyı
+    Server-Sent Events olarak yayınlar (GET /ai-jobs/{id} ile polling yerine).
+
+    Olay türleri (`event:` alanı, `data:` JSON):
+    - **snapshot**: job_id verildiyse bağlanınca işin anlık durumu
+    - **status**: PENDING / RUNNING / COMPLETED (summary_id ile) / FAILED (error_message ile)
+    - **partial**: RUNNING işin o ana kadar üretilmiş çıktısı; MAX_PARTIAL_CHARS'tan uzunsa
+      ilk kısmı gönderilir ve `truncated: true` eklenir (tam çıktı iş bitince özetten okunur)
+    - **deleted**: iş silindi
+    - **resync**: olaylar kaçırılmış olabilir; durum REST ile yeniden çekilmeli
+    """
+    principal = await _authenticate_stream(request, stream_token, db)
+    tenant_id = principal.tenant_id
+    keepalive = settings.AI_JOB_EVENTS_KEEPALIVE_SECONDS
+
+    async def stream():
+        with broker.subscribe(tenant_id, job_id) as subscription:
+            yield "retry: 3000\n\n"
+            for item in await _initial_events(db, tenant_id, job_id):
+                yield _sse(item)
+            while True:
+                item = await subscription.get(timeout=keepalive)
+                yield ": ping\n\n" if item is None else _sse(item)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def ai_job_events_websocket(
+    websocket: WebSocket,
+    job_id: Optional[int] = None,
+    stream_token: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    /ai-jobs/events ile aynı olayları WebSocket üzerinden JSON mesajları olarak gönderir.
+    Olay yokken AI_JOB_EVENTS_KEEPALIVE_SECONDS'de bir {"event": "ping"} gelir.
+    """
+    try:
+        principal = await _authenticate_stream(websocket, stream_token, db)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    tenant_id = principal.tenant_id
+    keepalive = settings.AI_JOB_EVENTS_KEEPALIVE_SECONDS
+
+    await websocket.accept()
+    # İstemciden gelen mesajlar okunmaz; sadece bağlantının kapandığını fark etmek için
+    disconnected = asyncio.create_task(_wait_for_disconnect(websocket))
+    try:
+        with broker.subscribe(tenant_id, job_id) as subscription:
+            for item in await _initial_events(db, tenant_id, job_id):
+                await websocket.send_json(item)
+            while not disconnected.done():
+                next_event = asyncio.create_task(subscription.get(timeout=keepalive))
+                await asyncio.wait({next_event, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+                if not next_event.done():
+                    next_event.cancel()
+                    break
+                await websocket.send_json(next_event.result() or {"event": "ping"})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        disconnected.cancel()
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
 @router.get("/{job_id}", response_model=schemas.AiJobOut)
 def get_ai_job(
     job_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
@@ -1,11 +1,12 @@
 # app/routers/ai_summaries.py
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Response
 from sqlalchemy.orm import Session
 
 from app import schemas, models
-from app.database import get_db
+from app.core.pagination import PageParams, paginated
+from app.database import get_db, get_read_db
 from app.services.auth_service import get_current_user
 from app.services.ai_summary_service import AiSummaryService
 
@@ -38,8 +39,10 @@ def create_ai_summary(
 
 @router.get("/", response_model=List[schemas.AiSummaryOut])
 def list_ai_summaries(
+        response: Response,
         session_id: Optional[int] = None,
-        db: Session = Depends(get_db),
+        page: PageParams = Depends(),
+        db: Session = Depends(get_read_db),
         current_user: models.User = Depends(get_current_user),
 ):
     """
@@ -48,17 +51,20 @@ def list_ai_summaries(
     Filtreler:
     - **session_id**: Belirli bir seansa ait özetleri getirir.
     """
-    return AiSummaryService.list_summaries(
+    result = AiSummaryService.list_summaries(
         db=db,
         tenant_id=current_user.tenant_id,
         session_id=session_id,
+        cursor=page.cursor,
+        limit=page.limit,
     )
+    return paginated(response, result)
 
 
 @router.get("/{summary_id}", response_model=schemas.AiSummaryOut)
 def get_ai_summary(
         summary_id: int,
-        db: Session = Depends(get_db),
+        db: Session = Depends(get_read_db),
         current_user: models.User = Depends(get_current_user),
 ):
     """
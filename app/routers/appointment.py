@@ -1,13 +1,15 @@
 # app/routers/appointments.py
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models, schemas
-from app.database import get_db
-from app.services.auth_service import get_current_user
-from app.services.appointment_service import AppointmentService
+from app.core.pagination import PageParams, paginated
+from app.database import get_db, get_async_read_db
+from app.services.auth_service import Principal, get_current_principal, get_current_user
+from app.services.appointment_service import AppointmentService, AsyncAppointmentService
 
 router = APIRouter(
     prefix="/appointments",
@@ -39,37 +41,42 @@ def create_appointment(
     "/",
     response_model=List[schemas.AppointmentOut],
 )
-def list_appointments(
+async def list_appointments(
+    response: Response,
     practitioner_id: Optional[int] = None,
     client_id: Optional[int] = None,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Tenant'a ait randevuları listeler.
     İsteğe bağlı olarak 'practitioner_id' veya 'client_id' ile filtreleme yapılabilir.
     """
-    return AppointmentService.list_appointments(
+    result = await AsyncAppointmentService.list_appointments(
         db=db,
         tenant_id=current_user.tenant_id,
         practitioner_id=practitioner_id,
         client_id=client_id,
+        cursor=page.cursor,
+        limit=page.limit,
     )
+    return paginated(response, result)
 
 
 @router.get(
     "/{appointment_id}",
     response_model=schemas.AppointmentOut,
 )
-def get_appointment(
+async def get_appointment(
     appointment_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     ID ile tek bir randevunun detaylarını getirir.
     """
-    return AppointmentService.get_appointment(
+    return await AsyncAppointmentService.get_appointment(
         db=db,
         tenant_id=current_user.tenant_id,
         appointment_id=appointment_id,
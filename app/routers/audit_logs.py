@@ -1,13 +1,15 @@
 # app/routers/audit_logs.py
 
-from typing import List
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
 from app import schemas, models
-from app.database import get_db
+from app.core.pagination import DEFAULT_PAGE_LIMIT, PageParams, paginated
+from app.database import get_read_db
 from app.services.audit_log_service import AuditLogService
-from app.services.auth_service import get_current_user
+from app.services.auth_service import get_current_owner
 
 router = APIRouter(
     prefix="/audit-logs",
@@ -17,27 +19,70 @@ router = APIRouter(
 
 @router.get("/", response_model=List[schemas.AuditLogOut])
 def list_audit_logs(
-        db: Session = Depends(get_db),
-        current_user: models.User = Depends(get_current_user),
+        response: Response,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        since: Optional[datetime] = Query(None, description="Bu andan itibaren (dahil)"),
+        until: Optional[datetime] = Query(None, description="Bu ana kadar (hariç)"),
+        page: PageParams = Depends(),
+        db: Session = Depends(get_read_db),
+        current_user: models.User = Depends(get_current_owner),
 ):
     """
-    Tenant'a ait tüm denetim (audit) kayıtlarını listeler.
-    Genellikle sadece yöneticiler (Admin/Owner) tarafından görüntülenmelidir.
+    Tenant'a ait denetim (audit) kayıtlarını yeniden eskiye listeler.
+    İsteğe bağlı olarak kayıt türü / ID, kullanıcı, işlem ve zaman aralığı ile filtrelenir.
+    Kayıtlar danışan / kullanıcı verisinin değişikliklerini içerdiği için
+    sadece tenant sahibi (OWNER) görüntüleyebilir.
     """
-    # İsteğe bağlı rol kontrolü buraya eklenebilir:
-    # if current_user.role not in ["OWNER", "ADMIN"]: ...
+    result = AuditLogService.list_logs(
+        db=db,
+        tenant_id=current_user.tenant_id,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        user_id=user_id,
+        action=action,
+        since=since,
+        until=until,
+        cursor=page.cursor,
+        # Yeni API ve tablo büyük: sayfalamasız istekte de varsayılan limit uygulanır
+        limit=page.limit or DEFAULT_PAGE_LIMIT,
+    )
+    return paginated(response, result)
 
-    return AuditLogService.list_logs(
+
+@router.get(
+    "/entities/{entity_type}/{entity_id}",
+    response_model=List[schemas.AuditLogOut],
+)
+def get_entity_history(
+        entity_type: str,
+        entity_id: int,
+        response: Response,
+        page: PageParams = Depends(),
+        db: Session = Depends(get_read_db),
+        current_user: models.User = Depends(get_current_owner),
+):
+    """
+    Tek bir kaydın (ör. /entities/client/123) tüm değişiklik geçmişini getirir.
+    """
+    result = AuditLogService.get_entity_history(
         db=db,
-        tenant_id=current_user.tenant_id
+        tenant_id=current_user.tenant_id,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        cursor=page.cursor,
+        limit=page.limit or DEFAULT_PAGE_LIMIT,
     )
+    return paginated(response, result)
 
 
 @router.get("/{log_id}", response_model=schemas.AuditLogOut)
 def get_audit_log(
         log_id: int,
-        db: Session = Depends(get_db),
-        current_user: models.User = Depends(get_current_user),
+        db: Session = Depends(get_read_db),
+        current_user: models.User = Depends(get_current_owner),
 ):
     """
     Belirli bir denetim kaydının detaylarını getirir.
@@ -46,4 +91,4 @@ def get_audit_log(
         db=db,
         tenant_id=current_user.tenant_id,
         log_id=log_id,
-    )
\ No newline at end of file
+    )
@@ -1,15 +1,17 @@
 # app/routers/auth.py
 
-from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import schemas, models
 from app.core.config import settings
-from app.core.security import create_access_token
-from app.database import get_db
+from app.core.security import create_access_token, jwt_keys
+from app.database import get_db, get_async_db
 from app.services import auth_service
+from app.services.token_revocation_service import TokenRevocationService
 
 router = APIRouter(
     prefix="/auth",
@@ -37,14 +39,16 @@ def register(
 
 
 @router.post("/login", response_model=schemas.Token)
-def login(
+async def login(
         form_data: OAuth2PasswordRequestForm = Depends(),
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_db),
 ):
     """
     Kullanıcı girişi yapar ve JWT Access Token döner.
+    Şifre doğrulama ayrı bir bcrypt havuzunda yapılır; havuz doluysa
+    istek beklemeden 503 (Retry-After) ile reddedilir.
     """
-    user = auth_service.authenticate_user(db, form_data.username, form_data.password)
+    user = await auth_service.authenticate_user_async(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -68,6 +72,15 @@ def login(
     return schemas.Token(access_token=access_token, token_type="bearer")
 
 
+@router.get("/jwks")
+def jwks():
+    """
+    Token'ları kendi başına doğrulamak isteyen servisler için public key (JWKS).
+    Sadece asimetrik algoritmalarda (RS256, ES256...) dolu döner.
+    """
+    return jwt_keys.public_jwks()
+
+
 @router.get("/me", response_model=schemas.UserRead)
 def read_users_me(
         current_user: models.User = Depends(auth_service.get_current_user)
@@ -75,4 +88,22 @@ def read_users_me(
     """
     Giriş yapmış olan kullanıcının kendi bilgilerini döner.
     """
-    return current_user
\ No newline at end of file
+    return current_user
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+        token: str = Depends(auth_service.oauth2_scheme),
+        db: Session = Depends(get_db),
+):
+    """
+    Kullanılan token'ı süresi dolana kadar geçersiz kılar (iptal listesine ekler).
+    """
+    payload = auth_service.decode_token(token)
+    jti = payload.get("jti")
+    if jti is not None:
+        TokenRevocationService.revoke_token(
+            db,
+            jti=jti,
+            expires_at=datetime.utcfromtimestamp(payload["exp"]),
+        )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,11 +1,12 @@
 # app/routers/client_consents.py
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Response
 from sqlalchemy.orm import Session
 
 from app import schemas, models
-from app.database import get_db
+from app.core.pagination import PageParams, paginated
+from app.database import get_db, get_read_db
 from app.services.auth_service import get_current_user
 from app.services.client_consent_service import ClientConsentService
 
@@ -33,25 +34,30 @@ def create_consent(
 
 @router.get("/", response_model=List[schemas.ClientConsentOut])
 def list_consents(
+    response: Response,
     client_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    page: PageParams = Depends(),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
     Onay formlarını listeler.
     İsteğe bağlı olarak **client_id** ile filtreleme yapılabilir.
     """
-    return ClientConsentService.list_consents(
+    result = ClientConsentService.list_consents(
         db=db,
         tenant_id=current_user.tenant_id,
         client_id=client_id,
+        cursor=page.cursor,
+        limit=page.limit,
     )
+    return paginated(response, result)
 
 
 @router.get("/{consent_id}", response_model=schemas.ClientConsentOut)
 def get_consent(
     consent_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
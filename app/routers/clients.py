@@ -1,13 +1,15 @@
 # app/routers/clients.py
 
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import schemas, models
-from app.database import get_db
-from app.services.auth_service import get_current_user
-from app.services.client_service import ClientService
+from app.core.pagination import PageParams, paginated
+from app.database import get_db, get_async_read_db
+from app.services.auth_service import Principal, get_current_principal, get_current_user
+from app.services.client_service import ClientService, AsyncClientService
 
 router = APIRouter(
     prefix="/clients",
@@ -37,29 +39,34 @@ def create_client(
 
 
 @router.get("/", response_model=List[schemas.ClientOut])
-def list_clients(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+async def list_clients(
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Mevcut tenant'a ait tüm danışanları listeler.
     """
-    return ClientService.list_clients(
+    result = await AsyncClientService.list_clients(
         db=db,
-        tenant_id=current_user.tenant_id
+        tenant_id=current_user.tenant_id,
+        cursor=page.cursor,
+        limit=page.limit,
     )
+    return paginated(response, result)
 
 
 @router.get("/{client_id}", response_model=schemas.ClientOut)
-def get_client(
+async def get_client(
     client_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Belirli bir danışanın detaylarını getirir.
     """
-    return ClientService.get_client(
+    return await AsyncClientService.get_client(
         db=db,
         tenant_id=current_user.tenant_id,
         client_id=client_id
@@ -0,0 +1,43 @@
+# app/routers/exports.py
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+from app import schemas, models
+from app.database import read_session_factory
+from app.services.auth_service import get_current_user
+from app.services.export_service import ExportService, MEDIA_TYPES
+
+router = APIRouter(
+    prefix="/exports",
+    tags=["exports"],
+)
+
+
+@router.get("/{entity}")
+def export_entity(
+    entity: schemas.ExportEntity,
+    request: Request,
+    format: schemas.ExportFormat = schemas.ExportFormat.NDJSON,
+    current_user: models.User = Depends(get_current_user),
+):
+    """
+    Tenant'a ait tüm kayıtları dosya olarak dışa aktarır (satır satır akış).
+
+    - **entity**: clients, sessions, session-notes, audit-logs
+    - **format**: ndjson (varsayılan) veya csv
+    """
+    body = ExportService.stream(
+        session_factory=read_session_factory(request),
+        tenant_id=current_user.tenant_id,
+        entity=entity,
+        fmt=format,
+    )
+    filename = f"{entity.value}-{date.today().isoformat()}.{format.value}"
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,11 +1,12 @@
 # app/routers/practitioners.py
 
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Response
 from sqlalchemy.orm import Session
 
 from app import schemas, models
-from app.database import get_db
+from app.core.pagination import PageParams, paginated
+from app.database import get_db, get_read_db
 from app.services.auth_service import get_current_user
 from app.services.practitioner_service import PractitionerService
 
@@ -38,22 +39,27 @@ def create_practitioner_profile(
 
 @router.get("/", response_model=List[schemas.PractitionerProfileOut])
 def list_practitioners(
-    db: Session = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
     Mevcut tenant'a ait tüm uygulayıcı profillerini listeler.
     """
-    return PractitionerService.list_profiles(
+    result = PractitionerService.list_profiles(
         db=db,
         tenant_id=current_user.tenant_id,
+        cursor=page.cursor,
+        limit=page.limit,
     )
+    return paginated(response, result)
 
 
 @router.get("/{profile_id}", response_model=schemas.PractitionerProfileOut)
 def get_practitioner_profile(
     profile_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
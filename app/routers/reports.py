@@ -1,13 +1,15 @@
 # app/routers/reports.py
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import schemas, models
-from app.database import get_db
-from app.services.auth_service import get_current_user
-from app.services.report_service import ReportService
+from app.core.pagination import PageParams, paginated
+from app.database import get_db, get_async_read_db
+from app.services.auth_service import Principal, get_current_principal, get_current_user
+from app.services.report_service import ReportService, AsyncReportService
 
 router = APIRouter(
     prefix="/reports",
@@ -36,11 +38,13 @@ def create_report(
 
 
 @router.get("/", response_model=List[schemas.ReportOut])
-def list_reports(
+async def list_reports(
+        response: Response,
         client_id: Optional[int] = None,
         practitioner_id: Optional[int] = None,
-        db: Session = Depends(get_db),
-        current_user: models.User = Depends(get_current_user),
+        page: PageParams = Depends(),
+        db: AsyncSession = Depends(get_async_read_db),
+        current_user: Principal = Depends(get_current_principal),
 ):
     """
     Raporları listeler.
@@ -50,24 +54,27 @@ def list_reports(
     - **practitioner_id**: Sadece belirli bir uzmana ait raporları getirir.
     - Hiçbiri verilmezse, tenant altındaki tüm raporları getirir.
     """
-    return ReportService.list_reports(
+    result = await AsyncReportService.list_reports(
         db=db,
         tenant_id=current_user.tenant_id,
         client_id=client_id,
         practitioner_id=practitioner_id,
+        cursor=page.cursor,
+        limit=page.limit,
     )
+    return paginated(response, result)
 
 
 @router.get("/{report_id}", response_model=schemas.ReportOut)
-def get_report(
+async def get_report(
         report_id: int,
-        db: Session = Depends(get_db),
-        current_user: models.User = Depends(get_current_user),
+        db: AsyncSession = Depends(get_async_read_db),
+        current_user: Principal = Depends(get_current_principal),
 ):
     """
     ID ile tek bir raporun detaylarını getirir.
     """
-    return ReportService.get_report(
+    return await AsyncReportService.get_report(
         db=db,
         tenant_id=current_user.tenant_id,
         report_id=report_id,
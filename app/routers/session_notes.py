@@ -1,11 +1,12 @@
 # app/routers/session_notes.py
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Response
 from sqlalchemy.orm import Session
 
 from app import schemas, models
-from app.database import get_db
+from app.core.pagination import PageParams, paginated
+from app.database import get_db, get_read_db
 from app.services.auth_service import get_current_user
 from app.services.session_note_service import SessionNoteService
 
@@ -37,8 +38,10 @@ def create_session_note(
 
 @router.get("/", response_model=List[schemas.SessionNoteOut])
 def list_session_notes(
+        response: Response,
         session_id: Optional[int] = None,
-        db: Session = Depends(get_db),
+        page: PageParams = Depends(),
+        db: Session = Depends(get_read_db),
         current_user: models.User = Depends(get_current_user),
 ):
     """
@@ -48,17 +51,20 @@ def list_session_notes(
     - **session_id**: Eğer verilirse, sadece o seansa ait notlar döner.
     - Verilmezse, tenant'a ait tüm notlar döner.
     """
-    return SessionNoteService.list_notes(
+    result = SessionNoteService.list_notes(
         db=db,
         tenant_id=current_user.tenant_id,
         session_id=session_id,
+        cursor=page.cursor,
+        limit=page.limit,
     )
+    return paginated(response, result)
 
 
 @router.get("/{note_id}", response_model=schemas.SessionNoteOut)
 def get_session_note(
         note_id: int,
-        db: Session = Depends(get_db),
+        db: Session = Depends(get_read_db),
         current_user: models.User = Depends(get_current_user),
 ):
     """
@@ -1,13 +1,15 @@
 # app/routers/sessions.py
 
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import schemas, models
-from app.database import get_db
-from app.services.auth_service import get_current_user
-from app.services.session_service import SessionService
+from app.core.pagination import PageParams, paginated
+from app.database import get_db, get_async_read_db
+from app.services.auth_service import Principal, get_current_principal, get_current_user
+from app.services.session_service import SessionService, AsyncSessionService
 
 router = APIRouter(
     prefix="/sessions",
@@ -36,29 +38,34 @@ def create_session(
 
 
 @router.get("/", response_model=List[schemas.SessionOut])
-def list_sessions(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+async def list_sessions(
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Mevcut tenant'a ait tüm seansları listeler.
     """
-    return SessionService.list_sessions(
+    result = await AsyncSessionService.list_sessions(
         db=db,
         tenant_id=current_user.tenant_id,
+        cursor=page.cursor,
+        limit=page.limit,
     )
+    return paginated(response, result)
 
 
 @router.get("/{session_id}", response_model=schemas.SessionOut)
-def get_session(
+async def get_session(
     session_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     ID ile tek bir seansın detaylarını getirir.
     """
-    return SessionService.get_session(
+    return await AsyncSessionService.get_session(
         db=db,
         tenant_id=current_user.tenant_id,
         session_id=session_id,
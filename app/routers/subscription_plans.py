@@ -1,11 +1,12 @@
 # app/routers/subscription_plans.py
 
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Response
 from sqlalchemy.orm import Session
 
 from app import schemas, models
-from app.database import get_db
+from app.core.pagination import PageParams, paginated
+from app.database import get_db, get_read_db
 from app.services.auth_service import get_current_user
 from app.services.subscription_plan_service import SubscriptionPlanService
 
@@ -38,19 +39,26 @@ def create_subscription_plan(
 
 @router.get("/", response_model=List[schemas.SubscriptionPlanOut])
 def list_subscription_plans(
-    db: Session = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
     Sistemdeki tüm abonelik planlarını listeler.
     """
-    return SubscriptionPlanService.list_plans(db=db)
+    result = SubscriptionPlanService.list_plans(
+        db=db,
+        cursor=page.cursor,
+        limit=page.limit,
+    )
+    return paginated(response, result)
 
 
 @router.get("/{plan_id}", response_model=schemas.SubscriptionPlanOut)
 def get_subscription_plan(
     plan_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
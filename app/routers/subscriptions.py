@@ -1,11 +1,12 @@
 # app/routers/subscriptions.py
 
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Response
 from sqlalchemy.orm import Session
 
 from app import schemas, models
-from app.database import get_db
+from app.core.pagination import PageParams, paginated
+from app.database import get_db, get_read_db
 from app.services.auth_service import get_current_user
 from app.services.subscription_service import SubscriptionService
 
@@ -37,22 +38,27 @@ def create_subscription(
 
 @router.get("/", response_model=List[schemas.SubscriptionOut])
 def list_subscriptions(
-    db: Session = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
     Tenant'a ait tüm abonelikleri listeler.
     """
-    return SubscriptionService.list_subscriptions(
+    result = SubscriptionService.list_subscriptions(
         db=db,
         tenant_id=current_user.tenant_id,
+        cursor=page.cursor,
+        limit=page.limit,
     )
+    return paginated(response, result)
 
 
 @router.get("/{subscription_id}", response_model=schemas.SubscriptionOut)
 def get_subscription(
     subscription_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
@@ -1,11 +1,12 @@
 # app/routers/tenants.py
 
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Response
 from sqlalchemy.orm import Session
 
 from app import schemas, models
-from app.database import get_db
+from app.core.pagination import PageParams, paginated
+from app.database import get_db, get_read_db
 from app.services.auth_service import get_current_user
 from app.services.tenant_service import TenantService
 
@@ -38,18 +39,25 @@ def create_tenant(
 
 @router.get("/", response_model=List[schemas.TenantOut])
 def list_tenants(
-    db: Session = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
     Sistemdeki tüm tenant'ları listeler.
     """
-    return TenantService.list_tenants(db=db)
+    result = TenantService.list_tenants(
+        db=db,
+        cursor=page.cursor,
+        limit=page.limit,
+    )
+    return paginated(response, result)
 
 
 @router.get("/me", response_model=schemas.TenantOut)
 def get_my_tenant(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
@@ -64,7 +72,7 @@ def get_my_tenant(
 @router.get("/{tenant_id}", response_model=schemas.TenantOut)
 def get_tenant(
     tenant_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
@@ -1,12 +1,13 @@
 # app/routers/users.py
 
 from typing import List
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, status, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app import schemas, models
-from app.database import get_db
-from app.services.auth_service import get_current_user
+from app.core.pagination import PageParams, paginated
+from app.database import get_db, get_read_db
+from app.services.auth_service import get_current_owner, get_current_user
 from app.services.user_service import UserService
 
 router = APIRouter(
@@ -23,13 +24,12 @@ router = APIRouter(
 def create_user(
     user_in: schemas.UserCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: models.User = Depends(get_current_owner),
 ):
     """
-    Mevcut tenant altına yeni bir kullanıcı (personel/yönetici) oluşturur.
-    Sadece yetkili kullanıcılar erişebilir.
+    Mevcut tenant altına yeni bir kullanıcı (personel) oluşturur.
+    Sadece tenant sahibi (OWNER) erişebilir.
     """
-    # İleride buraya 'if current_user.role != "ADMIN"' gibi yetki kontrolleri eklenebilir.
     return UserService.create_user(
         db=db,
         current_user=current_user,
@@ -37,24 +37,51 @@ def create_user(
     )
 
 
+@router.post(
+    "/bulk",
+    response_model=schemas.UserBulkCreateResult,
+    status_code=status.HTTP_201_CREATED,
+)
+def bulk_create_users(
+    data: schemas.UserBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_owner),
+):
+    """
+    Mevcut tenant altına toplu kullanıcı ekler (klinik onboarding). Sadece OWNER.
+    Geçerli satırlar tek transaction'da oluşturulur; hatalı satırlar
+    sıra numarası (index) ve nedeniyle 'errors' listesinde döner.
+    """
+    return UserService.bulk_create_users(
+        db=db,
+        current_user=current_user,
+        data=data,
+    )
+
+
 @router.get("/", response_model=List[schemas.UserOut])
 def list_users(
-    db: Session = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
     Mevcut kullanıcının ait olduğu tenant'taki tüm kullanıcıları listeler.
     """
-    return UserService.list_users(
+    result = UserService.list_users(
         db=db,
         tenant_id=current_user.tenant_id,
+        cursor=page.cursor,
+        limit=page.limit,
     )
+    return paginated(response, result)
 
 
 @router.get("/{user_id}", response_model=schemas.UserOut)
 def get_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
@@ -76,6 +103,7 @@ def update_user(
 ):
     """
     Kullanıcı bilgilerini günceller (Tam güncelleme).
+    Başka kullanıcıları ve rolleri sadece OWNER güncelleyebilir; kimse kendi rolünü değiştiremez.
     """
     return UserService.update_user(
         db=db,
@@ -95,6 +123,7 @@ def partial_update_user(
 ):
     """
     Kullanıcı bilgilerini kısmi günceller (Örn: Sadece şifre veya rol).
+    Yetki kuralları PUT ile aynıdır.
     """
     return UserService.partial_update_user(
         db=db,
@@ -109,10 +138,10 @@ def partial_update_user(
 def delete_user(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: models.User = Depends(get_current_owner),
 ):
     """
-    Kullanıcıyı siler.
+    Kullanıcıyı siler. Sadece OWNER.
     """
     UserService.delete_user(
         db=db,
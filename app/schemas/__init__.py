@@ -78,6 +78,8 @@ from .ai_job import (
     AiJobCreate,
     AiJobUpdate,
     AiJobStatus,
+    AiJobPriority,
+    AiJobStreamToken,
 )
 
 from .ai_summary import (
@@ -104,10 +106,21 @@ from .tenant import (
 
 # 🔥 GÜNCELLENDİ: UserRegister EKLENDİ
 from .user import (
+    UserRole,
     UserOut,
     UserUpdate,
     UserBase,
     UserCreate,
     UserPartialUpdate,
     UserRegister,
-)
\ No newline at end of file
+    UserBulkCreate,
+    UserBulkRowError,
+    UserBulkCreateResult,
+)
+from .audit_log import (
+    AuditLogOut,
+)
+from .export import (
+    ExportEntity,
+    ExportFormat,
+)
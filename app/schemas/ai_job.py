@@ -19,6 +19,13 @@ class AiJobStatus(str, Enum):
     # DB enum ile birebir uyumlu olmalı
 
 
+class AiJobPriority(str, Enum):
+    # Kullanıcının beklediği işler; kuyrukta BATCH işlerin önüne geçer
+    INTERACTIVE = "INTERACTIVE"
+    # Toplu / geriye dönük (backfill) işler
+    BATCH = "BATCH"
+
+
 class AiJobBase(BaseModel):
     type: AiJobType
     input_ref_type: str
@@ -26,6 +33,7 @@ class AiJobBase(BaseModel):
     model_name: str | None = None
     prompt_version: str | None = None
     payload: dict[str, Any] | list[Any] | None = None
+    priority: AiJobPriority = AiJobPriority.INTERACTIVE
 
 
 class AiJobCreate(AiJobBase):
@@ -40,10 +48,17 @@ class AiJobUpdate(BaseModel):
     model_name: str | None = None
     prompt_version: str | None = None
     payload: dict[str, Any] | list[Any] | None = None
+    priority: AiJobPriority | None = None
     started_at: datetime | None = None
     finished_at: datetime | None = None
 
 
+class AiJobStreamToken(BaseModel):
+    # /ai-jobs/events ve /ai-jobs/ws'e ?stream_token= ile bağlanmak için
+    stream_token: str
+    expires_in: int
+
+
 class AiJobOut(AiJobBase):
     id: int
     tenant_id: int
@@ -52,6 +67,8 @@ class AiJobOut(AiJobBase):
     created_at: datetime
     started_at: datetime | None
     finished_at: datetime | None
+    # Sonuç AI özet cache'inden geldiyse True
+    cache_hit: bool | None = None
 
     class Config:
         from_attributes = True
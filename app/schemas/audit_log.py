@@ -0,0 +1,18 @@
+from datetime import datetime
+from pydantic import BaseModel
+from typing import Any
+
+
+class AuditLogOut(BaseModel):
+    id: int
+    tenant_id: int
+    user_id: int | None
+    entity_type: str | None
+    entity_id: int | None
+    action: str
+    # Sadece değişen alanlar: {"alan": [eski, yeni]}; silmede {"before": {...}}
+    changes: dict[str, Any] | list[Any] | None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class ExportEntity(str, Enum):
+    CLIENTS = "clients"
+    SESSIONS = "sessions"
+    SESSION_NOTES = "session-notes"
+    AUDIT_LOGS = "audit-logs"
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
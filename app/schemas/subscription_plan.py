@@ -9,6 +9,7 @@ class SubscriptionPlanBase(BaseModel):
     currency: str = "TRY"
     max_practitioners: int | None = None
     max_clients: int | None = None
+    ai_job_weight: int = 1
 
     @field_validator("monthly_price")
     @classmethod
@@ -24,6 +25,13 @@ class SubscriptionPlanBase(BaseModel):
             raise ValueError("limits must be >= 0")
         return v
 
+    @field_validator("ai_job_weight")
+    @classmethod
+    def validate_weight(cls, v):
+        if v is not None and v < 1:
+            raise ValueError("ai_job_weight must be >= 1")
+        return v
+
 
 class SubscriptionPlanCreate(SubscriptionPlanBase):
     pass
@@ -36,6 +44,7 @@ class SubscriptionPlanUpdate(BaseModel):
     currency: str | None = None
     max_practitioners: int | None = None
     max_clients: int | None = None
+    ai_job_weight: int | None = None
 
     @field_validator("monthly_price")
     @classmethod
@@ -51,6 +60,13 @@ class SubscriptionPlanUpdate(BaseModel):
             raise ValueError("limits must be >= 0")
         return v
 
+    @field_validator("ai_job_weight")
+    @classmethod
+    def validate_weight(cls, v):
+        if v is not None and v < 1:
+            raise ValueError("ai_job_weight must be >= 1")
+        return v
+
 
 class SubscriptionPlanOut(SubscriptionPlanBase):
     id: int
@@ -1,15 +1,29 @@
 # app/schemas/user.py
 
 from datetime import datetime
-from typing import Optional
+from enum import Enum
+from typing import List, Optional
 
 from pydantic import BaseModel, EmailStr, Field
 
+from app.core.config import settings
+
+
+class UserRole(str, Enum):
+    """
+    Tenant içi roller. Sistem yöneticiliği bir rol değildir; tenant API'leri
+    üzerinden verilemez.
+    """
+    OWNER = "OWNER"
+    PRACTITIONER = "PRACTITIONER"
+    ASSISTANT = "ASSISTANT"
+    STAFF = "STAFF"
+
 
 class UserBase(BaseModel):
     full_name: str
     email: EmailStr
-    role: str = "STAFF"  # Varsayılan rol, register ekranında gönderilmezse STAFF olur
+    role: UserRole = UserRole.STAFF  # Varsayılan rol, register ekranında gönderilmezse STAFF olur
     is_active: bool = True
 
 
@@ -44,7 +58,7 @@ class UserPartialUpdate(BaseModel):
     """
     full_name: Optional[str] = None
     email: Optional[EmailStr] = None
-    role: Optional[str] = None
+    role: Optional[UserRole] = None
     is_active: Optional[bool] = None
     password: Optional[str] = None
 
@@ -64,4 +78,25 @@ class UserOut(BaseModel):
     updated_at: Optional[datetime] = None
 
     class Config:
-        from_attributes = True  # Pydantic v2 uyumlu (eski adıyla orm_mode=True)
\ No newline at end of file
+        from_attributes = True  # Pydantic v2 uyumlu (eski adıyla orm_mode=True)
+
+
+class UserBulkCreate(BaseModel):
+    """
+    Toplu kullanıcı ekleme (klinik onboarding) isteği.
+    """
+    users: List[UserCreate] = Field(..., min_length=1, max_length=settings.USER_BULK_MAX_SIZE)
+
+
+class UserBulkRowError(BaseModel):
+    """
+    Eklenemeyen satır: isteğin users listesindeki sırası (index) ve nedeni.
+    """
+    index: int
+    email: EmailStr
+    detail: str
+
+
+class UserBulkCreateResult(BaseModel):
+    created: List[UserOut]
+    errors: List[UserBulkRowError]
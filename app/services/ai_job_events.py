@@ -0,0 +1,279 @@
+# app/services/ai_job_events.py
+
+import asyncio
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional, Set
+
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY payload'ı 8000 bayt ile sınırlı; kısmi çıktı bu uzunlukta (karakter) kesilir
+# ve olaya "truncated": true eklenir (tam çıktı iş bitince özetten okunur)
+MAX_PARTIAL_CHARS = 1500
+
+# db.info anahtarı: Postgres dışı veritabanlarında commit sonrası yayınlanacak olaylar
+_PENDING_KEY = "ai_job_events_pending"
+
+_installed = False
+
+
+def job_event(job, status: Optional[str] = None, kind: str = "status", **extra) -> dict:
+    """
+    İstemciye gönderilen olay: işin kimliği, durumu ve (varsa) hata / özet ID'si /
+    kısmi çıktı. `job` ORM nesnesi ya da worker'ın kiraladığı satır olabilir.
+    """
+    data = {
+        "event": kind,
+        "job_id": job.id,
+        "tenant_id": job.tenant_id,
+        "type": getattr(job.type, "value", job.type),
+        "status": getattr(status, "value", status) or getattr(job, "status", None),
+        "input_ref_type": job.input_ref_type,
+        "input_ref_id": job.input_ref_id,
+        "at": datetime.utcnow().isoformat(),
+    }
+    partial = extra.get("partial")
+    if partial is not None and len(partial) > MAX_PARTIAL_CHARS:
+        extra["partial"] = partial[:MAX_PARTIAL_CHARS]
+        extra["truncated"] = True
+    data.update((key, value) for key, value in extra.items() if value is not None)
+    return data
+
+
+def publish_job_events(db: Session, *events: dict) -> None:
+    """
+    Olayları, değişikliği yapan transaction'a bağlı olarak yayınlar; commit
+    edilmeyen değişiklik için olay gitmez.
+
+    - Postgres: pg_notify aynı transaction'da çalışır, commit'te tüm süreçlere
+      (API worker'ları) teslim edilir; her süreçteki dinleyici yerel broker'a aktarır
+    - Diğer veritabanları (geliştirme / SQLite): olaylar session'da tutulur ve
+      commit sonrası sadece bu süreçteki broker'a verilir
+    """
+    if not settings.AI_JOB_EVENTS_ENABLED or not events:
+        return
+    if db.get_bind().dialect.name == "postgresql":
+        for item in events:
+            db.execute(select(func.pg_notify(
+                settings.AI_JOB_EVENTS_CHANNEL,
+                json.dumps(item, ensure_ascii=False),
+            )))
+    else:
+        db.info.setdefault(_PENDING_KEY, []).extend(events)
+
+
+def _after_commit(session: Session) -> None:
+    for item in session.info.pop(_PENDING_KEY, ()):
+        broker.publish(item)
+
+
+def _after_soft_rollback(session: Session, _previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def install_event_hooks() -> None:
+    """
+    Postgres dışı veritabanlarında bekleyen olayların commit'te yayınlanmasını sağlar.
+    """
+    global _installed
+    if _installed:
+        return
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_soft_rollback", _after_soft_rollback)
+    _installed = True
+
+
+class Subscription:
+    """
+    Tek bir SSE / WebSocket bağlantısının olay kuyruğu.
+    Kuyruk dolarsa (yavaş istemci) en eski olay atılır ve istemciye "resync"
+    olayı gönderilir; istemci durumu REST ile yeniden çekmelidir.
+    """
+
+    def __init__(self, tenant_id: int, job_id: Optional[int], max_size: int):
+        self.tenant_id = tenant_id
+        self.job_id = job_id
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self._overflowed = False
+        self.dropped = 0
+
+    def offer(self, item: dict) -> bool:
+        if self.job_id is not None and item.get("job_id") not in (None, self.job_id):
+            return False
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+            self._overflowed = True
+        self._queue.put_nowait(item)
+        return True
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """
+        Sıradaki olayı döner; timeout dolarsa None (keepalive göndermek için).
+        """
+        if self._overflowed:
+            self._overflowed = False
+            return {"event": "resync", "reason": "overflow"}
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class AiJobEventBroker:
+    """
+    Süreç içi pub/sub: olayları tenant'a göre abonelere dağıtır.
+
+    Aboneler event loop'ta yaşar; publish herhangi bir thread'den (threadpool'daki
+    sync endpoint'ler, worker thread'leri) çağrılabilir.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self.published = 0
+        self.delivered = 0
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        self._loop = loop or asyncio.get_running_loop()
+
+    def stop(self) -> None:
+        self._loop = None
+
+    def publish(self, item: dict) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._dispatch(item)
+        else:
+            loop.call_soon_threadsafe(self._dispatch, item)
+
+    def _dispatch(self, item: dict) -> None:
+        self.published += 1
+        tenant_id = item.get("tenant_id")
+        with self._lock:
+            if tenant_id is None:
+                # Tenant'sız olaylar (resync) tüm abonelere gider
+                targets = [sub for subs in self._subscribers.values() for sub in subs]
+            else:
+                targets = list(self._subscribers.get(tenant_id, ()))
+        for sub in targets:
+            if sub.offer(item):
+                self.delivered += 1
+
+    @contextmanager
+    def subscribe(self, tenant_id: int, job_id: Optional[int] = None):
+        """
+        with bloğu boyunca tenant'ın (job_id verilirse sadece o işin) olaylarını alır.
+        """
+        sub = Subscription(tenant_id, job_id, self.queue_size)
+        if self._loop is None:
+            # Lifespan dışında (ör. testler) ilk abonenin loop'u kullanılır
+            self._loop = asyncio.get_running_loop()
+        with self._lock:
+            self._subscribers.setdefault(tenant_id, set()).add(sub)
+        try:
+            yield sub
+        finally:
+            with self._lock:
+                subs = self._subscribers.get(tenant_id)
+                if subs is not None:
+                    subs.discard(sub)
+                    if not subs:
+                        del self._subscribers[tenant_id]
+
+    def stats(self) -> dict:
+        with self._lock:
+            subscribers = sum(len(subs) for subs in self._subscribers.values())
+            dropped = sum(sub.dropped for subs in self._subscribers.values() for sub in subs)
+            tenants = len(self._subscribers)
+        return {
+            "subscribers": subscribers,
+            "tenants": tenants,
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": dropped,
+        }
+
+
+broker = AiJobEventBroker(queue_size=settings.AI_JOB_EVENTS_QUEUE_SIZE)
+
+
+async def load_job_event(db: AsyncSession, tenant_id: int, job_id: int) -> Optional[dict]:
+    """
+    İşin anlık durumu ("snapshot" olayı); abone olunduktan sonra gönderilir,
+    böylece abonelikten önce biten bir iş de kaçırılmaz.
+    """
+    job = (await db.execute(
+        select(models.AIJob).where(models.AIJob.id == job_id, models.AIJob.tenant_id == tenant_id)
+    )).scalars().first()
+    if job is None:
+        return None
+    return job_event(job, kind="snapshot", error_message=job.error_message)
+
+
+async def run_ai_job_event_listener(dsn: str, reconnect_seconds: float) -> None:
+    """
+    Lifespan içinde arka plan görevi olarak çalışır: Postgres'te
+    LISTEN AI_JOB_EVENTS_CHANNEL yapar ve gelen bildirimleri yerel broker'a verir.
+
+    Bağlantı koparsa reconnect_seconds sonra yeniden bağlanır; aradaki olaylar
+    kaçırılmış olabileceğinden tüm abonelere "resync" gönderilir.
+    """
+    import asyncpg
+
+    channel = settings.AI_JOB_EVENTS_CHANNEL
+
+    def _on_notify(_conn, _pid, _channel, payload):
+        try:
+            broker.publish(json.loads(payload))
+        except ValueError:
+            logger.warning("Invalid AI job event payload: %r", payload[:200])
+
+    connected_before = False
+    while True:
+        conn = None
+        try:
+            conn = await asyncpg.connect(dsn)
+            closed = asyncio.Event()
+            conn.add_termination_listener(lambda _conn: closed.set())
+            await conn.add_listener(channel, _on_notify)
+            if connected_before:
+                broker.publish({"event": "resync", "reason": "reconnect"})
+            connected_before = True
+            await closed.wait()
+            logger.warning("AI job event listener connection lost")
+        except asyncio.CancelledError:
+            if conn is not None and not conn.is_closed():
+                await conn.close()
+            raise
+        except Exception:
+            logger.exception("AI job event listener failed")
+        await asyncio.sleep(reconnect_seconds)
+
+
+def listener_dsn(async_database_url: str) -> str:
+    """
+    SQLAlchemy asyncpg URL'sinden asyncpg.connect'in kabul ettiği DSN.
+    """
+    return make_url(async_database_url).set(drivername="postgresql").render_as_string(
+        hide_password=False
+    )
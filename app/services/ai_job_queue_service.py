@@ -0,0 +1,589 @@
+# app/services/ai_job_queue_service.py
+
+import json
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import (
+    DateTime, Float, Integer, and_, case, cast, func, literal, or_, select, true, tuple_, update,
+)
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session as DbSession
+
+from app import models, schemas
+from app.core.config import settings
+from app.services.ai_job_events import job_event, publish_job_events
+from app.services.ai_provider import ModelOutput
+
+_jobs = models.AIJob.__table__
+
+PENDING = schemas.AiJobStatus.PENDING.value
+RUNNING = schemas.AiJobStatus.RUNNING.value
+COMPLETED = schemas.AiJobStatus.COMPLETED.value
+FAILED = schemas.AiJobStatus.FAILED.value
+
+INTERACTIVE = schemas.AiJobPriority.INTERACTIVE.value
+BATCH = schemas.AiJobPriority.BATCH.value
+
+# Ağırlığı plandan alınan abonelik durumları
+ACTIVE_SUBSCRIPTION_STATUSES = (
+    schemas.SubscriptionStatus.TRIALING.value,
+    schemas.SubscriptionStatus.ACTIVE.value,
+)
+
+# Grubunda aday sınırından az iş olan tenant'lar için üst sınır (tüm işleri aday)
+_NO_CUTOFF = (literal(datetime(9999, 12, 31), DateTime), literal(2 ** 31 - 1, Integer))
+
+# Worker'ın bir işi işlemek için ihtiyaç duyduğu kolonlar
+CLAIM_COLUMNS = (
+    _jobs.c.id,
+    _jobs.c.tenant_id,
+    _jobs.c.type,
+    _jobs.c.input_ref_type,
+    _jobs.c.input_ref_id,
+    _jobs.c.model_name,
+    _jobs.c.prompt_version,
+    _jobs.c.attempts,
+)
+
+
+def _pending_tenants():
+    """
+    Bekleyen işi olan tenant'lar (recursive CTE). Her adım pending index'inde
+    bir sonraki tenant_id'ye atlar (skip scan): maliyet bekleyen iş sayısına
+    değil, bekleyen işi olan tenant sayısına bağlıdır.
+    """
+    first = _jobs.alias("first_pending")
+    tenants = (
+        select(func.min(first.c.tenant_id).label("tenant_id"))
+        .where(first.c.status == PENDING)
+        .cte("pending_tenants", recursive=True)
+    )
+    following = _jobs.alias("next_pending")
+    next_tenant = (
+        select(func.min(following.c.tenant_id))
+        .where(following.c.status == PENDING, following.c.tenant_id > tenants.c.tenant_id)
+        .scalar_subquery()
+    )
+    return tenants.union_all(select(next_tenant).where(tenants.c.tenant_id.is_not(None)))
+
+
+def _fair_ranking(now: datetime, per_group: int):
+    """
+    Aday işlerin adil kuyruktaki yeri (sanal zaman):
+
+        (tenant'ın yakın zamanda aldığı iş sayısı + işin tenant ve öncelik içindeki sırası)
+        / tenant ağırlığı
+
+    "Yakın zamanda aldığı": son AI_JOB_FAIR_WINDOW_SECONDS içinde başlatılan ya da
+    hâlâ çalışan işleri. En küçük sanal zamanlı iş önce alınır: ağırlığı 2 olan
+    tenant ağırlığı 1 olana göre iki kat sık sıra alır; binlerce iş kuyruğa atan
+    bir tenant diğerlerinin işlerinin önüne geçemez. Kullanım sadece pencere
+    içinde sayıldığından boşta kalan tenant kredi biriktirmez.
+
+    Ağırlık tenant'ın aktif aboneliğinin planından (SubscriptionPlan.ai_job_weight)
+    gelir; aboneliği yoksa AI_JOB_DEFAULT_WEIGHT.
+
+    Sadece bekleyen işi olan ilk AI_JOB_FAIR_MAX_TENANTS tenant'ın her
+    (tenant, öncelik) grubundaki ilk `per_group` bekleyen işi sıralanır; kullanım
+    ve ağırlık tenant başına index aramalarıyla hesaplanır. Böylece claim'in
+    maliyeti backfill'in derinliğiyle büyümez.
+    """
+    tenants = _pending_tenants()
+    window_start = now - timedelta(seconds=settings.AI_JOB_FAIR_WINDOW_SECONDS)
+
+    recent = _jobs.alias("recent_jobs")
+    started_in_window = (
+        select(func.count())
+        .where(recent.c.tenant_id == tenants.c.tenant_id, recent.c.started_at >= window_start)
+        .scalar_subquery()
+    )
+    # Pencereden önce başlayıp hâlâ çalışan işler (sadece RUNNING satırların index'i)
+    running = _jobs.alias("running_jobs")
+    still_running = (
+        select(func.count())
+        .where(
+            running.c.status == RUNNING,
+            running.c.tenant_id == tenants.c.tenant_id,
+            running.c.started_at < window_start,
+        )
+        .scalar_subquery()
+    )
+    subscriptions = models.Subscription.__table__
+    plans = models.SubscriptionPlan.__table__
+    weight = (
+        select(func.max(plans.c.ai_job_weight))
+        .select_from(subscriptions.join(plans, plans.c.id == subscriptions.c.plan_id))
+        .where(
+            subscriptions.c.tenant_id == tenants.c.tenant_id,
+            subscriptions.c.status.in_(ACTIVE_SUBSCRIPTION_STATUSES),
+            subscriptions.c.starts_at <= now,
+            or_(subscriptions.c.ends_at.is_(None), subscriptions.c.ends_at > now),
+        )
+        .scalar_subquery()
+    )
+    shares = (
+        select(
+            tenants.c.tenant_id,
+            (started_in_window + still_running).label("used"),
+            func.coalesce(weight, settings.AI_JOB_DEFAULT_WEIGHT).label("weight"),
+        )
+        .where(tenants.c.tenant_id.is_not(None))
+        # Recursive CTE'yi erken durdurur (SQLite'ta satır tahmini için de gerekli)
+        .limit(settings.AI_JOB_FAIR_MAX_TENANTS)
+        .subquery("tenant_shares")
+    )
+
+    # Grubun per_group'uncu bekleyen işi: adaylar (created_at, id) bu değere kadar olanlar
+    priorities = (
+        select(literal(INTERACTIVE).label("priority"))
+        .union_all(select(literal(BATCH)))
+        .subquery("priorities")
+    )
+    head = _jobs.alias("head_jobs")
+
+    def nth_pending(column):
+        return (
+            select(column)
+            .where(
+                head.c.status == PENDING,
+                head.c.tenant_id == shares.c.tenant_id,
+                head.c.priority == priorities.c.priority,
+            )
+            .order_by(head.c.created_at, head.c.id)
+            .offset(per_group - 1)
+            .limit(1)
+            .scalar_subquery()
+        )
+
+    groups = (
+        select(
+            shares.c.tenant_id,
+            shares.c.used,
+            shares.c.weight,
+            priorities.c.priority,
+            func.coalesce(nth_pending(head.c.created_at), _NO_CUTOFF[0]).label("last_created_at"),
+            func.coalesce(nth_pending(head.c.id), _NO_CUTOFF[1]).label("last_id"),
+        )
+        .select_from(shares.join(priorities, true()))
+        .subquery("pending_groups")
+    )
+
+    candidates = _jobs.alias("candidate_jobs")
+    position = func.row_number().over(
+        partition_by=(candidates.c.tenant_id, candidates.c.priority),
+        order_by=(candidates.c.created_at, candidates.c.id),
+    )
+    virtual_time = cast(groups.c.used + position, Float) / groups.c.weight
+    return (
+        select(candidates.c.id, virtual_time.label("virtual_time"))
+        .select_from(groups.join(candidates, and_(
+            candidates.c.status == PENDING,
+            candidates.c.tenant_id == groups.c.tenant_id,
+            candidates.c.priority == groups.c.priority,
+            tuple_(candidates.c.created_at, candidates.c.id)
+            <= tuple_(groups.c.last_created_at, groups.c.last_id),
+        )))
+        .subquery("ranked")
+    )
+
+
+def _next_pending(limit: int, *columns, where=()):
+    """
+    Kuyruk sırasındaki ilk `limit` PENDING iş (FOR UPDATE SKIP LOCKED).
+
+    AI_JOB_SCHEDULER="fair": INTERACTIVE işler BATCH işlerden önce, kendi
+    içlerinde tenant'lar arasında ağırlıklı adil sırayla (bkz. _fair_ranking).
+    "fifo": sadece created_at sırası.
+    """
+    columns = columns or (_jobs.c.id,)
+    if settings.AI_JOB_SCHEDULER == "fifo":
+        return (
+            select(*columns)
+            .where(_jobs.c.status == PENDING, *where)
+            .order_by(_jobs.c.created_at, _jobs.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+    per_group = max(limit, settings.AI_JOB_FAIR_CANDIDATES_PER_GROUP)
+    ranked = _fair_ranking(datetime.utcnow(), per_group)
+    return (
+        select(*columns)
+        .select_from(_jobs.join(ranked, ranked.c.id == _jobs.c.id))
+        .where(_jobs.c.status == PENDING, *where)
+        .order_by(
+            case((_jobs.c.priority == BATCH, 1), else_=0),
+            ranked.c.virtual_time,
+            _jobs.c.created_at,
+            _jobs.c.id,
+        )
+        .limit(limit)
+        .with_for_update(skip_locked=True, of=_jobs)
+    )
+
+
+class AiJobInputError(Exception):
+    """
+    İşin girdisi bulunamadı / desteklenmiyor; tekrar denemenin anlamı yok.
+    """
+
+
+class AiJobQueueService:
+    """
+    AI işi kuyruğu: worker'ların iş alması (lease), kirayı uzatması ve
+    işi sonuçlandırması.
+
+    - İşler tek bir UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED)
+      ifadesiyle alınır; aynı işi iki worker alamaz, worker'lar birbirini beklemez
+    - Her iş worker_id ve lease_expires_at ile kiralanır; worker heartbeat ile
+      kirayı uzatır. Worker çökerse kira dolar ve iş tekrar kuyruğa döner
+    - Sonuç yazımı worker_id + RUNNING koşuluyla yapılır; kirasını kaybetmiş bir
+      worker başkasının aldığı işin üzerine yazamaz
+    """
+
+    @staticmethod
+    def claim_jobs(
+        db: DbSession,
+        worker_id: str,
+        limit: int,
+        lease_seconds: Optional[int] = None,
+    ) -> List[Row]:
+        """
+        Kuyruk sırasındaki ilk `limit` PENDING işi bu worker'a kiralar ve döner.
+        """
+        lease_seconds = lease_seconds or settings.AI_JOB_LEASE_SECONDS
+        now = datetime.utcnow()
+
+        pending = _next_pending(limit).scalar_subquery()
+        rows = db.execute(
+            update(_jobs)
+            .where(_jobs.c.id.in_(pending), _jobs.c.status == PENDING)
+            .values(
+                status=RUNNING,
+                worker_id=worker_id,
+                started_at=now,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                attempts=_jobs.c.attempts + 1,
+            )
+            .returning(*CLAIM_COLUMNS)
+        ).all()
+        publish_job_events(db, *(job_event(row, RUNNING, attempts=row.attempts) for row in rows))
+        db.commit()
+        return rows
+
+    @staticmethod
+    def claim_batch(
+        db: DbSession,
+        worker_id: str,
+        max_size: int,
+        max_wait_seconds: float,
+        lease_seconds: Optional[int] = None,
+    ) -> Optional[List[Row]]:
+        """
+        Kuyruk sırasındaki ilk PENDING işin model_name / prompt_version grubundan
+        en fazla `max_size` işi (yine kuyruk sırasıyla) bu worker'a kiralar
+        (tek model çağrısında işlenecek batch).
+
+        Grupta max_size'dan az iş varsa ve ilk iş henüz max_wait_seconds kadar
+        beklememişse grup dolması için atlanır ve sıradaki grup denenir; dolmakta
+        olan bir grup arkasındaki grupları bekletmez. Alınabilecek grup yoksa
+        boş liste, kuyrukta bekleyen iş yoksa None döner.
+        """
+        lease_seconds = lease_seconds or settings.AI_JOB_LEASE_SECONDS
+        model_key = func.coalesce(_jobs.c.model_name, "")
+        prompt_key = func.coalesce(_jobs.c.prompt_version, "")
+        now = datetime.utcnow()
+
+        filling = []
+        while True:
+            oldest = db.execute(_next_pending(
+                1, model_key.label("model_key"), prompt_key.label("prompt_key"), _jobs.c.created_at,
+                where=filling,
+            )).first()
+            if oldest is None:
+                db.rollback()
+                return [] if filling else None
+
+            same_group = (model_key == oldest.model_key, prompt_key == oldest.prompt_key)
+            if now - oldest.created_at >= timedelta(seconds=max_wait_seconds):
+                break
+            available = db.execute(
+                select(func.count()).select_from(
+                    select(_jobs.c.id)
+                    .where(_jobs.c.status == PENDING, *same_group)
+                    .limit(max_size)
+                    .subquery()
+                )
+            ).scalar()
+            if available >= max_size:
+                break
+            filling.append(or_(model_key != oldest.model_key, prompt_key != oldest.prompt_key))
+
+        batch = _next_pending(max_size, where=same_group).scalar_subquery()
+        rows = db.execute(
+            update(_jobs)
+            .where(_jobs.c.id.in_(batch), _jobs.c.status == PENDING)
+            .values(
+                status=RUNNING,
+                worker_id=worker_id,
+                started_at=now,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                attempts=_jobs.c.attempts + 1,
+            )
+            .returning(*CLAIM_COLUMNS)
+        ).all()
+        publish_job_events(db, *(job_event(row, RUNNING, attempts=row.attempts) for row in rows))
+        db.commit()
+        return rows
+
+    @staticmethod
+    def heartbeat(
+        db: DbSession,
+        worker_id: str,
+        job_ids: Iterable[int],
+        lease_seconds: Optional[int] = None,
+    ) -> Set[int]:
+        """
+        Worker'ın elindeki işlerin kirasını uzatır.
+        Hâlâ bu worker'a ait olan iş ID'lerini döner.
+        """
+        job_ids = list(job_ids)
+        if not job_ids:
+            return set()
+        lease_seconds = lease_seconds or settings.AI_JOB_LEASE_SECONDS
+        owned = db.execute(
+            update(_jobs)
+            .where(
+                _jobs.c.id.in_(job_ids),
+                _jobs.c.worker_id == worker_id,
+                _jobs.c.status == RUNNING,
+            )
+            .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=lease_seconds))
+            .returning(_jobs.c.id)
+        ).scalars().all()
+        db.commit()
+        return set(owned)
+
+    @staticmethod
+    def requeue_expired(db: DbSession, max_attempts: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Kirası dolmuş RUNNING işleri (worker çöktü / askıda kaldı) tekrar PENDING
+        yapar; deneme hakkı bitmişse FAILED olarak kapatır.
+        (tekrar kuyruğa alınan, başarısız sayılan) döner.
+        """
+        max_attempts = max_attempts or settings.AI_JOB_MAX_ATTEMPTS
+        now = datetime.utcnow()
+        expired = (_jobs.c.status == RUNNING, _jobs.c.lease_expires_at < now)
+
+        error = "Lease expired too many times."
+        requeued = db.execute(
+            update(_jobs)
+            .where(*expired, _jobs.c.attempts < max_attempts)
+            .values(status=PENDING, worker_id=None, lease_expires_at=None)
+            .returning(*CLAIM_COLUMNS)
+        ).all()
+        failed = db.execute(
+            update(_jobs)
+            .where(*expired, _jobs.c.attempts >= max_attempts)
+            .values(
+                status=FAILED,
+                finished_at=now,
+                lease_expires_at=None,
+                error_message=error,
+            )
+            .returning(*CLAIM_COLUMNS)
+        ).all()
+        publish_job_events(
+            db,
+            *(job_event(row, PENDING) for row in requeued),
+            *(job_event(row, FAILED, error_message=error) for row in failed),
+        )
+        db.commit()
+        return len(requeued), len(failed)
+
+    @staticmethod
+    def load_input(db: DbSession, job: Row) -> Tuple[str, int, Optional[int]]:
+        """
+        İşin kaynak metnini döner: (içerik, session_id, source_note_id).
+        """
+        if job.input_ref_type == "session":
+            session = db.execute(
+                select(models.Session.id).where(
+                    models.Session.id == job.input_ref_id,
+                    models.Session.tenant_id == job.tenant_id,
+                )
+            ).scalar()
+            if session is None:
+                raise AiJobInputError("Session not found.")
+            contents = db.execute(
+                select(models.SessionNote.content)
+                .where(models.SessionNote.session_id == session)
+                .order_by(models.SessionNote.created_at, models.SessionNote.id)
+            ).scalars().all()
+            if not contents:
+                raise AiJobInputError("Session has no notes.")
+            return "\n\n".join(contents), session, None
+
+        if job.input_ref_type == "session_note":
+            row = db.execute(
+                select(models.SessionNote.content, models.SessionNote.session_id)
+                .join(models.Session, models.Session.id == models.SessionNote.session_id)
+                .where(
+                    models.SessionNote.id == job.input_ref_id,
+                    models.Session.tenant_id == job.tenant_id,
+                )
+            ).first()
+            if row is None:
+                raise AiJobInputError("Session note not found.")
+            return row.content, row.session_id, job.input_ref_id
+
+        raise AiJobInputError(f"Unsupported input_ref_type: {job.input_ref_type}")
+
+    @staticmethod
+    def complete_job(
+        db: DbSession,
+        job: Row,
+        worker_id: str,
+        output: ModelOutput,
+        session_id: int,
+        source_note_id: Optional[int],
+        cache_hit: Optional[bool] = None,
+    ) -> bool:
+        """
+        İşi COMPLETED yapar ve AISummary kaydını aynı transaction'da yazar.
+        Kira kaybedilmişse (iş artık bu worker'da değilse) hiçbir şey yazmaz, False döner.
+        cache_hit: çıktı AI özet cache'inden geldiyse True, model çağrıldıysa False
+        (cache kapalıyken None).
+        """
+        owned = db.execute(
+            update(_jobs)
+            .where(
+                _jobs.c.id == job.id,
+                _jobs.c.worker_id == worker_id,
+                _jobs.c.status == RUNNING,
+            )
+            .values(
+                status=COMPLETED,
+                finished_at=datetime.utcnow(),
+                lease_expires_at=None,
+                error_message=None,
+                cache_hit=cache_hit,
+            )
+        ).rowcount
+        if owned != 1:
+            db.rollback()
+            return False
+
+        summary = models.AISummary(
+            tenant_id=job.tenant_id,
+            session_id=session_id,
+            source_note_id=source_note_id,
+            job_id=job.id,
+            summary_text=output.summary_text,
+            key_points=json.dumps(output.key_points, ensure_ascii=False),
+            risk_flags=json.dumps(output.risk_flags, ensure_ascii=False),
+        )
+        db.add(summary)
+        db.flush()
+        publish_job_events(db, job_event(job, COMPLETED, summary_id=summary.id))
+        db.commit()
+        return True
+
+    @staticmethod
+    def fail_job(
+        db: DbSession,
+        job: Row,
+        worker_id: str,
+        error: str,
+        retry: bool,
+        max_attempts: Optional[int] = None,
+    ) -> Optional[str]:
+        """
+        Hata alan işi, deneme hakkı varsa ve retry=True ise tekrar PENDING yapar,
+        aksi halde FAILED olarak kapatır. Yeni durumu döner (kira kaybedilmişse None).
+        """
+        max_attempts = max_attempts or settings.AI_JOB_MAX_ATTEMPTS
+        if retry and job.attempts < max_attempts:
+            values = dict(status=PENDING, worker_id=None, lease_expires_at=None)
+        else:
+            values = dict(status=FAILED, finished_at=datetime.utcnow(), lease_expires_at=None)
+
+        owned = db.execute(
+            update(_jobs)
+            .where(
+                _jobs.c.id == job.id,
+                _jobs.c.worker_id == worker_id,
+                _jobs.c.status == RUNNING,
+            )
+            .values(error_message=error[:2000], **values)
+        ).rowcount
+        if owned == 1:
+            publish_job_events(db, job_event(job, values["status"], error_message=error[:2000]))
+        db.commit()
+        return values["status"] if owned == 1 else None
+
+    @staticmethod
+    def queue_stats(
+        db: DbSession,
+        since: datetime,
+        tenant_id: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Tenant ve öncelik başına kuyruk metrikleri:
+        - `since`'ten bu yana başlatılan işlerin kuyrukta bekleme süresi
+          (created_at -> son denemenin started_at'i; ortalama, p50, p95, en fazla - sn)
+        - şu an bekleyen iş sayısı ve en eski bekleyen işin yaşı
+        """
+        now = datetime.utcnow()
+        stats: Dict[Tuple[int, str], dict] = {}
+
+        def entry(tenant: int, priority: str) -> dict:
+            return stats.setdefault((tenant, priority), {
+                "tenant_id": tenant,
+                "priority": priority,
+                "pending": 0,
+                "oldest_pending_seconds": None,
+                "waits": [],
+            })
+
+        pending_query = (
+            select(_jobs.c.tenant_id, _jobs.c.priority, func.count(), func.min(_jobs.c.created_at))
+            .where(_jobs.c.status == PENDING)
+            .group_by(_jobs.c.tenant_id, _jobs.c.priority)
+        )
+        started_query = (
+            select(_jobs.c.tenant_id, _jobs.c.priority, _jobs.c.created_at, _jobs.c.started_at)
+            .where(_jobs.c.started_at >= since)
+            .execution_options(yield_per=5000)
+        )
+        if tenant_id is not None:
+            pending_query = pending_query.where(_jobs.c.tenant_id == tenant_id)
+            started_query = started_query.where(_jobs.c.tenant_id == tenant_id)
+
+        for tenant, priority, count, oldest in db.execute(pending_query):
+            item = entry(tenant, priority)
+            item["pending"] = count
+            item["oldest_pending_seconds"] = round((now - oldest).total_seconds(), 3)
+        for tenant, priority, created_at, started_at in db.execute(started_query):
+            wait = (started_at - created_at).total_seconds()
+            entry(tenant, priority)["waits"].append(max(wait, 0.0))
+
+        result = []
+        for key in sorted(stats):
+            item = stats[key]
+            waits = sorted(item.pop("waits"))
+            item["started"] = len(waits)
+            item["wait_seconds"] = {
+                "avg": round(sum(waits) / len(waits), 3),
+                "p50": round(_percentile(waits, 0.50), 3),
+                "p95": round(_percentile(waits, 0.95), 3),
+                "max": round(waits[-1], 3),
+            } if waits else None
+            result.append(item)
+        return result
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
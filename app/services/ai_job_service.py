@@ -1,12 +1,22 @@
 # app/services/ai_job_service.py
 
-from typing import List
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
 from fastapi import HTTPException, status
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session as DbSession
 
 from app import models, schemas
+from app.core.config import settings
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
+from app.services.ai_job_events import job_event, publish_job_events
+from app.services.audit_diff import diff, snapshot
 from app.services.audit_log_service import AuditLogService
 
+# Keyset pagination sıralaması (yeniden eskiye, son kolon benzersiz)
+AI_JOB_LIST_ORDER = (models.AIJob.created_at, models.AIJob.id)
+
 
 class AiJobService:
     """
@@ -34,14 +44,144 @@ class AiJobService:
             )
         return job
 
+    @staticmethod
+    def _dedup_filter(tenant_id: int, data: schemas.AiJobCreate):
+        # ix_ai_jobs_dedup_inflight ile aynı ifadeler (NULL model / prompt eşit sayılır)
+        return (
+            models.AIJob.tenant_id == tenant_id,
+            models.AIJob.type == data.type,
+            models.AIJob.input_ref_type == data.input_ref_type,
+            models.AIJob.input_ref_id == data.input_ref_id,
+            func.coalesce(models.AIJob.model_name, "") == (data.model_name or ""),
+            func.coalesce(models.AIJob.prompt_version, "") == (data.prompt_version or ""),
+        )
+
+    @staticmethod
+    def _source_updated_at(data: schemas.AiJobCreate):
+        """
+        İşin girdisinin son değiştiği zaman (scalar subquery); worker'ın modele
+        verdiği metin (bkz. AiJobQueueService.load_input) neye bağlıysa o:
+        not özeti için notun, seans özeti için seanstaki notların en yenisi.
+        Bilinmeyen girdi türlerinde None.
+        """
+        note = models.SessionNote
+        changed_at = func.coalesce(note.updated_at, note.created_at)
+        if data.input_ref_type == "session_note":
+            return select(changed_at).where(note.id == data.input_ref_id).scalar_subquery()
+        if data.input_ref_type == "session":
+            return select(func.max(changed_at)).where(note.session_id == data.input_ref_id).scalar_subquery()
+        return None
+
+    @staticmethod
+    def _find_duplicate(
+        db: DbSession,
+        tenant_id: int,
+        data: schemas.AiJobCreate,
+    ) -> Optional[models.AIJob]:
+        """
+        Aynı girdi için bekleyen / çalışan ya da AI_JOB_DEDUP_WINDOW_SECONDS
+        içinde tamamlanmış işi döner. Tamamlanmış iş, girdisi iş bittikten sonra
+        değişmediyse (not düzeltilmediyse) kullanılır; aksi halde yeni iş açılır
+        (içerik aynıysa AI özet cache'i modeli yine çağırtmaz).
+        """
+        statuses = [schemas.AiJobStatus.PENDING, schemas.AiJobStatus.RUNNING]
+        condition = models.AIJob.status.in_(statuses)
+        source_updated_at = AiJobService._source_updated_at(data)
+        if settings.AI_JOB_DEDUP_WINDOW_SECONDS > 0 and source_updated_at is not None:
+            since = datetime.utcnow() - timedelta(seconds=settings.AI_JOB_DEDUP_WINDOW_SECONDS)
+            condition = or_(
+                condition,
+                and_(
+                    models.AIJob.status == schemas.AiJobStatus.COMPLETED,
+                    models.AIJob.finished_at >= since,
+                    models.AIJob.finished_at >= source_updated_at,
+                ),
+            )
+
+        return (
+            db.query(models.AIJob)
+            .filter(*AiJobService._dedup_filter(tenant_id, data), condition)
+            .order_by(models.AIJob.created_at.desc(), models.AIJob.id.desc())
+            .first()
+        )
+
+    @staticmethod
+    def _find_by_idempotency_key(
+        db: DbSession,
+        tenant_id: int,
+        idempotency_key: str,
+        data: schemas.AiJobCreate,
+    ) -> Optional[models.AIJob]:
+        job = (
+            db.query(models.AIJob)
+            .filter(
+                models.AIJob.tenant_id == tenant_id,
+                models.AIJob.idempotency_key == idempotency_key,
+            )
+            .first()
+        )
+        if job is None:
+            return None
+
+        same_request = (
+            job.type == data.type
+            and job.input_ref_type == data.input_ref_type
+            and job.input_ref_id == data.input_ref_id
+            and job.model_name == data.model_name
+            and job.prompt_version == data.prompt_version
+        )
+        if not same_request:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used with different parameters.",
+            )
+        return job
+
+    @staticmethod
+    def _promote(db: DbSession, job: models.AIJob, data: schemas.AiJobCreate) -> models.AIJob:
+        """
+        Kuyrukta bekleyen BATCH bir iş için INTERACTIVE istek gelirse (kullanıcı
+        backfill'deki bir özeti açtı) iş INTERACTIVE'e yükseltilir; kullanıcı
+        backfill'in bitmesini beklemez.
+        """
+        if (
+            data.priority == schemas.AiJobPriority.INTERACTIVE
+            and job.priority == schemas.AiJobPriority.BATCH
+            and job.status == schemas.AiJobStatus.PENDING
+        ):
+            job.priority = schemas.AiJobPriority.INTERACTIVE.value
+            db.commit()
+            db.refresh(job)
+        return job
+
     @staticmethod
     def create_job(
         db: DbSession,
         current_user: models.User,
         data: schemas.AiJobCreate,
-    ) -> models.AIJob: # ✅ Düzeltildi
+        idempotency_key: Optional[str] = None,
+    ) -> Tuple[models.AIJob, bool]:
+        """
+        Yeni bir AI işi oluşturur; (iş, yeni_mi) döner.
+
+        Aynı Idempotency-Key ile gelen tekrar istekleri ve aynı girdi için zaten
+        bekleyen / çalışan ya da yakın zamanda tamamlanmış bir iş varsa yeni iş
+        açılmaz, mevcut iş döner. Eşzamanlı iki istek yarışırsa ikincisi
+        ix_ai_jobs_dedup_inflight unique index'ine takılır ve ilkinin işini alır.
+        """
+        tenant_id = current_user.tenant_id
+
+        if idempotency_key:
+            existing = AiJobService._find_by_idempotency_key(db, tenant_id, idempotency_key, data)
+            if existing:
+                return existing, False
+
+        existing = AiJobService._find_duplicate(db, tenant_id, data)
+        if existing:
+            return AiJobService._promote(db, existing, data), False
+
         job = models.AIJob( # ✅ Düzeltildi
-            tenant_id=current_user.tenant_id,
+            tenant_id=tenant_id,
             type=data.type,
             status=schemas.AiJobStatus.PENDING,
             input_ref_type=data.input_ref_type,
@@ -49,9 +189,26 @@ class AiJobService:
             model_name=data.model_name,
             prompt_version=data.prompt_version,
             payload=data.payload,
+            priority=data.priority,
+            idempotency_key=idempotency_key,
         )
         db.add(job)
-        db.commit()
+        try:
+            db.flush()
+            publish_job_events(db, job_event(job, job.status))
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            existing = None
+            if idempotency_key:
+                existing = AiJobService._find_by_idempotency_key(db, tenant_id, idempotency_key, data)
+            existing = existing or AiJobService._find_duplicate(db, tenant_id, data)
+            if existing:
+                return existing, False
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A conflicting AI job already exists.",
+            )
         db.refresh(job)
 
         AuditLogService.log(
@@ -63,19 +220,55 @@ class AiJobService:
             changes=data.model_dump(),
         )
 
-        return job
+        return job, True
+
+    @staticmethod
+    def close_duplicate_inflight_jobs(db: DbSession) -> int:
+        """
+        ix_ai_jobs_dedup_inflight oluşturulmadan önce biriken çift işleri kapatır:
+        aynı girdi için bekleyen / çalışan işlerin en eskisi kalır, diğerleri FAILED olur.
+        Unique index mevcut veritabanına eklenebilsin diye scripts.migrate_schema çalıştırır.
+        """
+        inflight = [schemas.AiJobStatus.PENDING.value, schemas.AiJobStatus.RUNNING.value]
+        job = models.AIJob.__table__
+        older = job.alias("older")
+        has_older = (
+            select(older.c.id)
+            .where(
+                older.c.status.in_(inflight),
+                older.c.tenant_id == job.c.tenant_id,
+                older.c.type == job.c.type,
+                older.c.input_ref_type == job.c.input_ref_type,
+                older.c.input_ref_id == job.c.input_ref_id,
+                func.coalesce(older.c.model_name, "") == func.coalesce(job.c.model_name, ""),
+                func.coalesce(older.c.prompt_version, "") == func.coalesce(job.c.prompt_version, ""),
+                older.c.id < job.c.id,
+            )
+            .exists()
+        )
+        closed = db.execute(
+            update(job)
+            .where(job.c.status.in_(inflight), has_older)
+            .values(
+                status=schemas.AiJobStatus.FAILED.value,
+                finished_at=datetime.utcnow(),
+                lease_expires_at=None,
+                error_message="Duplicate of an earlier job.",
+            )
+        ).rowcount
+        db.commit()
+        return closed
 
     @staticmethod
     def list_jobs(
         db: DbSession,
         tenant_id: int,
-    ) -> List[models.AIJob]: # ✅ Düzeltildi
-        return (
-            db.query(models.AIJob) # ✅ Düzeltildi
-            .filter(models.AIJob.tenant_id == tenant_id)
-            .order_by(models.AIJob.created_at.desc())
-            .all()
-        )
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.AIJob]:
+        q = db.query(models.AIJob).filter(models.AIJob.tenant_id == tenant_id)
+        q = apply_keyset(q, AI_JOB_LIST_ORDER, cursor, limit, descending=True)
+        return build_page(q.all(), AI_JOB_LIST_ORDER, limit)
 
     @staticmethod
     def get_job(
@@ -103,13 +296,24 @@ class AiJobService:
             job_id=job_id,
         )
 
-        before = job.__dict__.copy()
         update_data = data.model_dump(exclude_unset=True)
 
         for field, value in update_data.items():
             setattr(job, field, value)
 
-        db.commit()
+        changes = diff(job)
+
+        try:
+            db.flush()
+            if changes:
+                publish_job_events(db, job_event(job, job.status, error_message=job.error_message))
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Another pending or running job exists for the same input.",
+            )
         db.refresh(job)
 
         AuditLogService.log(
@@ -118,10 +322,7 @@ class AiJobService:
             entity="ai_job",
             entity_id=job.id,
             action="UPDATE",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return job
@@ -138,8 +339,9 @@ class AiJobService:
             tenant_id=tenant_id,
             job_id=job_id,
         )
-        before = job.__dict__.copy()
+        before = snapshot(job)
 
+        publish_job_events(db, job_event(job, job.status, kind="deleted"))
         db.delete(job)
         db.commit()
 
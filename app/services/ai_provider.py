@@ -0,0 +1,141 @@
+# app/services/ai_provider.py
+
+import importlib
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class ModelRequest:
+    """
+    Bir AI işinin modele gönderilen girdisi.
+    """
+    job_type: str
+    content: str
+    model_name: Optional[str] = None
+    prompt_version: Optional[str] = None
+
+
+@dataclass
+class ModelOutput:
+    summary_text: str
+    key_points: List[str] = field(default_factory=list)
+    risk_flags: List[str] = field(default_factory=list)
+
+
+class ModelProvider:
+    """
+    Model sağlayıcı arayüzü. Worker her iş için generate çağırır;
+    hata fırlatırsa iş tekrar denenir (AI_JOB_MAX_ATTEMPTS'e kadar).
+
+    Toplu çıkarım açıkken (AI_BATCH_MAX_SIZE > 1) worker generate_batch çağırır;
+    varsayılan gerçekleme istekleri tek tek generate'e verir. Toplu API'si olan
+    sağlayıcılar bunu ezmelidir. Hata fırlatırsa batch'teki tüm işler tekrar denenir.
+
+    Yeni sağlayıcı: bu sınıftan türetip AI_PROVIDER="paket.modul:SinifAdi" verin.
+    """
+
+    name = "base"
+
+    def generate(self, request: ModelRequest) -> ModelOutput:
+        raise NotImplementedError
+
+    def generate_batch(self, requests: List[ModelRequest]) -> List[ModelOutput]:
+        """
+        İsteklerle aynı sırada, aynı sayıda çıktı döner.
+        """
+        return [self.generate(request) for request in requests]
+
+    def generate_streaming(
+        self,
+        request: ModelRequest,
+        on_partial: Callable[[str], None],
+    ) -> ModelOutput:
+        """
+        Çıktı üretilirken o ana kadarki metni on_partial ile bildirir (canlı ilerleme).
+        Akış desteklemeyen sağlayıcılarda generate'e düşer.
+        """
+        return self.generate(request)
+
+
+# Fake sağlayıcının "risk" olarak işaretlediği kelimeler
+_RISK_TERMS = ("intihar", "kendine zarar", "şiddet", "suicide", "self-harm")
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class FakeModelProvider(ModelProvider):
+    """
+    Ağ çağrısı yapmayan, deterministik yerel sağlayıcı (geliştirme, test, benchmark).
+    latency_seconds kadar bekleyerek uzak model çağrısını simüle eder; toplu
+    çağrıda her ek öğe için batch_item_latency_seconds eklenir (çağrı başına
+    sabit maliyet + öğe başına küçük maliyet).
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        latency_seconds: Optional[float] = None,
+        batch_item_latency_seconds: Optional[float] = None,
+    ):
+        if latency_seconds is None:
+            latency_seconds = settings.AI_FAKE_PROVIDER_LATENCY_MS / 1000
+        if batch_item_latency_seconds is None:
+            batch_item_latency_seconds = settings.AI_FAKE_PROVIDER_BATCH_ITEM_LATENCY_MS / 1000
+        self.latency_seconds = latency_seconds
+        self.batch_item_latency_seconds = batch_item_latency_seconds
+
+    def generate(self, request: ModelRequest) -> ModelOutput:
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+        return self._summarize(request)
+
+    def generate_batch(self, requests: List[ModelRequest]) -> List[ModelOutput]:
+        delay = self.latency_seconds + self.batch_item_latency_seconds * max(len(requests) - 1, 0)
+        if delay > 0:
+            time.sleep(delay)
+        return [self._summarize(request) for request in requests]
+
+    def generate_streaming(
+        self,
+        request: ModelRequest,
+        on_partial: Callable[[str], None],
+    ) -> ModelOutput:
+        # Gecikme cümlelere bölünür; her cümleden sonra o ana kadarki özet bildirilir
+        output = self._summarize(request)
+        sentences = output.key_points[:2] or [output.summary_text]
+        for i in range(len(sentences)):
+            if self.latency_seconds > 0:
+                time.sleep(self.latency_seconds / len(sentences))
+            on_partial(" ".join(sentences[:i + 1]))
+        return output
+
+    @staticmethod
+    def _summarize(request: ModelRequest) -> ModelOutput:
+        sentences = [s.strip() for s in _SENTENCE_END.split(request.content.strip()) if s.strip()]
+        lowered = request.content.lower()
+        return ModelOutput(
+            summary_text=" ".join(sentences[:2]) or "(boş içerik)",
+            key_points=sentences[:5],
+            risk_flags=[term for term in _RISK_TERMS if term in lowered],
+        )
+
+
+def get_model_provider(spec: Optional[str] = None) -> ModelProvider:
+    """
+    AI_PROVIDER ayarından sağlayıcı örneği oluşturur.
+    """
+    spec = spec or settings.AI_PROVIDER
+    if spec == FakeModelProvider.name:
+        return FakeModelProvider()
+
+    module_name, _, class_name = spec.partition(":")
+    if not class_name:
+        raise ValueError(f"AI_PROVIDER 'paket.modul:SinifAdi' biçiminde olmalı: {spec!r}")
+    provider_cls = getattr(importlib.import_module(module_name), class_name)
+    return provider_cls()
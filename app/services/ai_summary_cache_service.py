@@ -0,0 +1,176 @@
+# app/services/ai_summary_cache_service.py
+
+import hashlib
+import json
+import re
+import unicodedata
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session as DbSession
+
+from app import models
+from app.core.config import settings
+from app.services.ai_provider import ModelOutput
+
+_cache = models.AISummaryCache.__table__
+_jobs = models.AIJob.__table__
+
+_INLINE_SPACE = re.compile(r"[ \t\f\v\u00a0]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def normalize_content(content: str) -> str:
+    """
+    Anlamı değiştirmeyen farkları (Unicode biçimi, satır sonu, fazla boşluk /
+    boş satır) siler; yalnızca bunlarda farklı notlar aynı cache anahtarını alır.
+    Büyük / küçük harf korunur.
+    """
+    content = unicodedata.normalize("NFC", content).replace("\r\n", "\n").replace("\r", "\n")
+    lines = (_INLINE_SPACE.sub(" ", line).strip() for line in content.split("\n"))
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def cache_key(
+    job_type: str,
+    content: str,
+    model_name: Optional[str],
+    prompt_version: Optional[str],
+) -> str:
+    """
+    sha256(iş türü, model, prompt sürümü, normalize edilmiş içerik).
+    Model veya prompt sürümü değişince anahtar da değişir; eski kayıtlar eviction ile temizlenir.
+    """
+    digest = hashlib.sha256()
+    for part in (job_type, model_name or "", prompt_version or "", normalize_content(content)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+class AiSummaryCacheService:
+    """
+    İçerik adresli AI özet cache'i (ai_summary_cache).
+
+    - lookup isabette kaydın hit_count / last_used_at alanlarını tek UPDATE ile günceller
+    - store aynı anahtarı eşzamanlı yazan iki worker'dan ikincisini sessizce atlar
+    - evict TTL'i geçen ve tenant başına sınırı aşan (en uzun süredir kullanılmayan) kayıtları siler
+    """
+
+    @staticmethod
+    def lookup(db: DbSession, tenant_id: int, key: str) -> Optional[ModelOutput]:
+        row = db.execute(
+            update(_cache)
+            .where(_cache.c.tenant_id == tenant_id, _cache.c.cache_key == key)
+            .values(hit_count=_cache.c.hit_count + 1, last_used_at=datetime.utcnow())
+            .returning(_cache.c.summary_text, _cache.c.key_points, _cache.c.risk_flags)
+        ).first()
+        db.commit()
+        if row is None:
+            return None
+        return ModelOutput(
+            summary_text=row.summary_text,
+            key_points=json.loads(row.key_points) if row.key_points else [],
+            risk_flags=json.loads(row.risk_flags) if row.risk_flags else [],
+        )
+
+    @staticmethod
+    def store(db: DbSession, tenant_id: int, key: str, output: ModelOutput) -> bool:
+        """
+        Model çıktısını cache'e yazar. Anahtar zaten varsa (başka worker yazdı) False döner.
+        """
+        now = datetime.utcnow()
+        db.add(models.AISummaryCache(
+            tenant_id=tenant_id,
+            cache_key=key,
+            summary_text=output.summary_text,
+            key_points=json.dumps(output.key_points, ensure_ascii=False),
+            risk_flags=json.dumps(output.risk_flags, ensure_ascii=False),
+            created_at=now,
+            last_used_at=now,
+        ))
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return False
+        return True
+
+    @staticmethod
+    def evict(
+        db: DbSession,
+        ttl_days: Optional[int] = None,
+        max_entries_per_tenant: Optional[int] = None,
+    ) -> Tuple[int, int]:
+        """
+        (süresi dolduğu için, tenant sınırı aşıldığı için) silinen kayıt sayılarını döner.
+        """
+        ttl_days = settings.AI_SUMMARY_CACHE_TTL_DAYS if ttl_days is None else ttl_days
+        if max_entries_per_tenant is None:
+            max_entries_per_tenant = settings.AI_SUMMARY_CACHE_MAX_ENTRIES_PER_TENANT
+
+        expired = 0
+        if ttl_days > 0:
+            expired = db.execute(
+                delete(_cache).where(
+                    _cache.c.last_used_at < datetime.utcnow() - timedelta(days=ttl_days)
+                )
+            ).rowcount
+
+        trimmed = 0
+        if max_entries_per_tenant > 0:
+            ranked = select(
+                _cache.c.id,
+                func.row_number().over(
+                    partition_by=_cache.c.tenant_id,
+                    order_by=(_cache.c.last_used_at.desc(), _cache.c.id.desc()),
+                ).label("rank"),
+            ).subquery()
+            trimmed = db.execute(
+                delete(_cache).where(
+                    _cache.c.id.in_(
+                        select(ranked.c.id).where(ranked.c.rank > max_entries_per_tenant)
+                    )
+                )
+            ).rowcount
+
+        db.commit()
+        return expired, trimmed
+
+    @staticmethod
+    def hit_rates(
+        db: DbSession,
+        since: datetime,
+        tenant_id: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        `since`'ten bu yana tamamlanan işler üzerinden tenant başına cache isabet oranı
+        ve tenant'ın cache'teki kayıt sayısı.
+        """
+        hits = func.sum(case((_jobs.c.cache_hit.is_(True), 1), else_=0))
+        query = (
+            select(_jobs.c.tenant_id, func.count().label("lookups"), hits.label("hits"))
+            .where(_jobs.c.finished_at >= since, _jobs.c.cache_hit.is_not(None))
+            .group_by(_jobs.c.tenant_id)
+            .order_by(_jobs.c.tenant_id)
+        )
+        entries_query = select(_cache.c.tenant_id, func.count()).group_by(_cache.c.tenant_id)
+        if tenant_id is not None:
+            query = query.where(_jobs.c.tenant_id == tenant_id)
+            entries_query = entries_query.where(_cache.c.tenant_id == tenant_id)
+
+        entries = dict(db.execute(entries_query).all())
+        result = []
+        for row in db.execute(query):
+            hit_count = int(row.hits or 0)
+            result.append({
+                "tenant_id": row.tenant_id,
+                "lookups": row.lookups,
+                "hits": hit_count,
+                "misses": row.lookups - hit_count,
+                "hit_rate": round(hit_count / row.lookups, 4) if row.lookups else 0.0,
+                "entries": entries.get(row.tenant_id, 0),
+            })
+        return result
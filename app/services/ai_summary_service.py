@@ -5,7 +5,13 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session as DbSession
 
 from app import models, schemas
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
+from app.services.audit_diff import diff, snapshot
 from app.services.audit_log_service import AuditLogService
+from app.services.tenant_ownership import TenantOwnershipService
+
+# Keyset pagination sıralaması (yeniden eskiye, son kolon benzersiz)
+AI_SUMMARY_LIST_ORDER = (models.AISummary.created_at, models.AISummary.id)
 
 
 class AiSummaryService:
@@ -19,19 +25,11 @@ class AiSummaryService:
             tenant_id: int,
             session_id: int,
     ) -> None:
-        session = (
-            db.query(models.Session)  # ✅ Düzeltildi: Session
-            .filter(
-                models.Session.id == session_id,
-                models.Session.tenant_id == tenant_id,
-            )
-            .first()
+        TenantOwnershipService.ensure_in_tenant(
+            db,
+            tenant_id,
+            (models.Session, session_id, "Session not found for this tenant."),
         )
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Session not found for this tenant.",
-            )
 
     @staticmethod
     def _get_summary_with_tenant_check(
@@ -97,15 +95,18 @@ class AiSummaryService:
             db: DbSession,
             tenant_id: int,
             session_id: Optional[int] = None,
-    ) -> List[models.AISummary]:  # ✅ Düzeltildi
-        q = db.query(models.AISummary).filter(  # ✅ Düzeltildi
+            cursor: Optional[str] = None,
+            limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.AISummary]:
+        q = db.query(models.AISummary).filter(
             models.AISummary.tenant_id == tenant_id
         )
 
         if session_id is not None:
             q = q.filter(models.AISummary.session_id == session_id)
 
-        return q.order_by(models.AISummary.created_at.desc()).all()
+        q = apply_keyset(q, AI_SUMMARY_LIST_ORDER, cursor, limit, descending=True)
+        return build_page(q.all(), AI_SUMMARY_LIST_ORDER, limit)
 
     @staticmethod
     def get_summary(
@@ -140,12 +141,13 @@ class AiSummaryService:
                 session_id=data.session_id,
             )
 
-        before = summary.__dict__.copy()
         update_data = data.model_dump()
 
         for field, value in update_data.items():
             setattr(summary, field, value)
 
+        changes = diff(summary)
+
         db.commit()
         db.refresh(summary)
 
@@ -155,10 +157,7 @@ class AiSummaryService:
             entity="ai_summary",
             entity_id=summary.id,
             action="UPDATE",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return summary
@@ -186,11 +185,11 @@ class AiSummaryService:
                 session_id=update_data["session_id"],
             )
 
-        before = summary.__dict__.copy()
-
         for field, value in update_data.items():
             setattr(summary, field, value)
 
+        changes = diff(summary)
+
         db.commit()
         db.refresh(summary)
 
@@ -200,10 +199,7 @@ class AiSummaryService:
             entity="ai_summary",
             entity_id=summary.id,
             action="PATCH",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return summary
@@ -221,7 +217,7 @@ class AiSummaryService:
             summary_id=summary_id,
         )
 
-        before = summary.__dict__.copy()
+        before = snapshot(summary)
 
         db.delete(summary)
         db.commit()
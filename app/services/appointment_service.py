@@ -3,11 +3,18 @@
 from typing import List, Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models, schemas
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
+from app.services.audit_diff import diff, snapshot
 from app.services.audit_log_service import AuditLogService
 
+# Keyset pagination sıralaması (yeniden eskiye, son kolon benzersiz)
+APPOINTMENT_LIST_ORDER = (models.Appointment.starts_at, models.Appointment.id)
+
 
 class AppointmentService:
     """
@@ -95,7 +102,9 @@ class AppointmentService:
         tenant_id: int,
         practitioner_id: Optional[int] = None,
         client_id: Optional[int] = None,
-    ) -> List[models.Appointment]:
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.Appointment]:
         """
         Randevuları listeler. Practitioner veya Client bazlı filtreleme yapılabilir.
         """
@@ -107,7 +116,8 @@ class AppointmentService:
         if client_id is not None:
             q = q.filter(models.Appointment.client_id == client_id)
 
-        return q.order_by(models.Appointment.starts_at.desc()).all()
+        q = apply_keyset(q, APPOINTMENT_LIST_ORDER, cursor, limit, descending=True)
+        return build_page(q.all(), APPOINTMENT_LIST_ORDER, limit)
 
     @staticmethod
     def update_appointment(
@@ -122,12 +132,13 @@ class AppointmentService:
         """
         appt = AppointmentService._get_appointment_or_404(db, tenant_id, appointment_id)
 
-        before = appt.__dict__.copy()
         update_data = data.model_dump(exclude_unset=True)
 
         for field, value in update_data.items():
             setattr(appt, field, value)
 
+        changes = diff(appt)
+
         db.commit()
         db.refresh(appt)
 
@@ -137,10 +148,7 @@ class AppointmentService:
             entity="appointment",
             entity_id=appt.id,
             action="UPDATE",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return appt
@@ -189,7 +197,7 @@ class AppointmentService:
         Randevuyu siler.
         """
         appt = AppointmentService._get_appointment_or_404(db, tenant_id, appointment_id)
-        before = appt.__dict__.copy()
+        before = snapshot(appt)
 
         db.delete(appt)
         db.commit()
@@ -201,4 +209,57 @@ class AppointmentService:
             entity_id=appointment_id,
             action="DELETE",
             changes={"before": before},
-        )
\ No newline at end of file
+        )
+
+
+class AsyncAppointmentService:
+    """
+    AppointmentService'in okuma işlemleri için AsyncSession kullanan varyantı.
+    """
+
+    @staticmethod
+    async def get_appointment(
+        db: AsyncSession,
+        tenant_id: int,
+        appointment_id: int,
+    ) -> models.Appointment:
+        """
+        Tek bir randevuyu getirir. Bulamazsa 404 verir.
+        """
+        result = await db.execute(
+            select(models.Appointment).filter(
+                models.Appointment.id == appointment_id,
+                models.Appointment.tenant_id == tenant_id,
+            )
+        )
+        appt = result.scalars().first()
+        if not appt:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Appointment not found",
+            )
+        return appt
+
+    @staticmethod
+    async def list_appointments(
+        db: AsyncSession,
+        tenant_id: int,
+        practitioner_id: Optional[int] = None,
+        client_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.Appointment]:
+        """
+        Randevuları listeler. Practitioner veya Client bazlı filtreleme yapılabilir.
+        """
+        q = select(models.Appointment).filter(models.Appointment.tenant_id == tenant_id)
+
+        if practitioner_id is not None:
+            q = q.filter(models.Appointment.practitioner_id == practitioner_id)
+
+        if client_id is not None:
+            q = q.filter(models.Appointment.client_id == client_id)
+
+        q = apply_keyset(q, APPOINTMENT_LIST_ORDER, cursor, limit, descending=True)
+        result = await db.execute(q)
+        return build_page(result.scalars().all(), APPOINTMENT_LIST_ORDER, limit)
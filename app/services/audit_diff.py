@@ -0,0 +1,68 @@
+# app/services/audit_diff.py
+
+import enum
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Optional
+
+from sqlalchemy import inspect
+
+# Audit kaydına hiçbir zaman yazılmayan alanlar
+SENSITIVE_FIELDS = {"password_hash"}
+
+
+def jsonable(value: Any) -> Any:
+    """
+    Değeri JSON(B) kolonuna yazılabilir hale getirir (datetime, Decimal, Enum...).
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return jsonable(value.value)
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, dict):
+        return {str(k): jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [jsonable(v) for v in value]
+    return str(value)
+
+
+def snapshot(obj) -> dict:
+    """
+    Kaydın kolon değerleri (ilişkiler ve _sa_instance_state olmadan).
+    Silme kayıtlarında "before" olarak kullanılır.
+    """
+    return {
+        attr.key: jsonable(getattr(obj, attr.key))
+        for attr in inspect(obj).mapper.column_attrs
+        if attr.key not in SENSITIVE_FIELDS
+    }
+
+
+def diff(obj) -> Optional[dict]:
+    """
+    SQLAlchemy attribute history'sinden sadece değişen alanları döner:
+        {"phone": [eski, yeni], "status": [eski, yeni]}
+    History commit/flush ile sıfırlandığı için commit'ten ÖNCE çağrılmalıdır.
+    Değişen alan yoksa None döner.
+    """
+    state = inspect(obj)
+    changes = {}
+    for attr in state.mapper.column_attrs:
+        history = state.attrs[attr.key].history
+        if not history.has_changes():
+            continue
+        if attr.key in SENSITIVE_FIELDS:
+            # Değer yazılmaz, sadece değiştiği bilgisi tutulur
+            changes[attr.key] = "***"
+            continue
+        old = history.deleted[0] if history.deleted else None
+        new = history.added[0] if history.added else None
+        changes[attr.key] = [jsonable(old), jsonable(new)]
+    return changes or None
@@ -0,0 +1,87 @@
+# app/services/audit_log_archive.py
+
+import gzip
+import json
+import os
+from datetime import date, datetime
+from typing import Iterator, List, Optional
+
+from app.core.config import settings
+from app.services.audit_log_partitions import (
+    add_months,
+    archive_path,
+    month_start,
+    partition_month,
+    partition_name,
+)
+
+
+class AuditLogArchive:
+    """
+    Saklama süresi dolup arşivlenmiş audit log bölümlerini okur.
+
+    Her ay ayrı bir gzip'li JSON Lines dosyasıdır (audit_logs_y2024m01.jsonl.gz);
+    sorgu sadece istenen zaman aralığıyla kesişen ayların dosyalarını açar ve
+    satırları akış halinde filtreler (dosya belleğe alınmaz).
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or settings.AUDIT_LOG_ARCHIVE_DIR
+
+    def months(self) -> List[date]:
+        """
+        Arşivde bulunan aylar, eskiden yeniye.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        months = []
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".jsonl.gz"):
+                month = partition_month(filename[: -len(".jsonl.gz")])
+                if month is not None:
+                    months.append(month)
+        return sorted(months)
+
+    def iter_logs(
+        self,
+        tenant_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """
+        Filtrelere uyan arşiv kayıtlarını eskiden yeniye döner.
+        Zaman aralığı [start, end) şeklindedir; created_at datetime'a çevrilir.
+        """
+        filters = {
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "user_id": user_id,
+            "action": action,
+        }
+        filters = {k: v for k, v in filters.items() if v is not None}
+
+        for month in self.months():
+            # Aralıkla kesişmeyen aylar hiç açılmaz
+            if start is not None and add_months(month, 1) <= month_start(start.date()):
+                continue
+            if end is not None and datetime.combine(month, datetime.min.time()) >= end:
+                continue
+
+            path = archive_path(self.directory, partition_name(month))
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    row = json.loads(line)
+                    if row["tenant_id"] != tenant_id:
+                        continue
+                    if any(row.get(k) != v for k, v in filters.items()):
+                        continue
+                    row["created_at"] = datetime.fromisoformat(row["created_at"])
+                    if start is not None and row["created_at"] < start:
+                        continue
+                    if end is not None and row["created_at"] >= end:
+                        continue
+                    yield row
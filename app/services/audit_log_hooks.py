@@ -0,0 +1,139 @@
+# app/services/audit_log_hooks.py
+
+from contextlib import contextmanager
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.config import settings
+from app.services.audit_diff import diff, snapshot
+
+# db.info anahtarları
+_ACTOR_KEY = "audit_actor"            # (tenant_id, user_id)
+_PENDING_KEY = "audit_pending"        # flush sonrası yazılacak kayıtlar
+_SUPPRESSED_KEY = "audit_suppressed"  # True iken otomatik kayıt yapılmaz
+
+# Otomatik audit kaydı tutulan modeller ve entity_type değerleri
+# (servislerdeki AuditLogService.log çağrılarıyla aynı isimler)
+AUDITED_ENTITIES = {
+    models.User: "user",
+    models.Tenant: "tenant",
+    models.PractitionerProfile: "practitioner_profile",
+    models.Client: "client",
+    models.ClientConsent: "ClientConsent",
+    models.Appointment: "appointment",
+    models.Session: "session",
+    models.SessionNote: "session_note",
+    models.AIJob: "ai_job",
+    models.AISummary: "ai_summary",
+    models.Report: "report",
+    models.SubscriptionPlan: "subscription_plan",
+    models.Subscription: "subscription",
+}
+
+_installed = False
+
+
+def set_audit_actor(db: Session, user: models.User) -> None:
+    """
+    İsteği yapan kullanıcıyı session'a bağlar (get_current_user çağırır).
+    Otomatik audit kayıtları bu kullanıcı adına yazılır.
+    """
+    db.info[_ACTOR_KEY] = (user.tenant_id, user.id)
+
+
+def has_audit_actor(db: Session) -> bool:
+    return _ACTOR_KEY in db.info
+
+
+def is_unit_of_work_active(db: Session) -> bool:
+    """
+    Bu session'daki değişikliklerin audit kaydı flush hook'u ile, iş
+    transaction'ı içinde yazılıyorsa True döner.
+    """
+    return (
+        _installed
+        and settings.AUDIT_LOG_MODE == "transactional"
+        and has_audit_actor(db)
+    )
+
+
+@contextmanager
+def suppress_auto_audit(db: Session):
+    """
+    Blok içindeki flush'larda otomatik audit kaydı yapılmaz.
+    Kendi özet kaydını yazan toplu işlemler (ör. BULK_CREATE) için.
+    """
+    db.info[_SUPPRESSED_KEY] = True
+    try:
+        yield
+    finally:
+        db.info.pop(_SUPPRESSED_KEY, None)
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    if not is_unit_of_work_active(session) or session.info.get(_SUPPRESSED_KEY):
+        return
+
+    pending = session.info.setdefault(_PENDING_KEY, [])
+
+    for obj in session.new:
+        entity = AUDITED_ENTITIES.get(type(obj))
+        if entity:
+            # Değerler (ID, default'lar) flush'tan sonra okunur
+            pending.append((obj, entity, "CREATE", None))
+
+    for obj in session.dirty:
+        entity = AUDITED_ENTITIES.get(type(obj))
+        if entity and session.is_modified(obj, include_collections=False):
+            changes = diff(obj)
+            if changes:
+                pending.append((obj, entity, "UPDATE", changes))
+
+    for obj in session.deleted:
+        entity = AUDITED_ENTITIES.get(type(obj))
+        if entity:
+            pending.append((obj, entity, "DELETE", {"before": snapshot(obj)}))
+
+
+def _after_flush_postexec(session: Session, flush_context) -> None:
+    """
+    Yeni kayıtların ID'leri flush'tan sonra belli olur; audit satırları burada
+    eklenir. Session.commit temiz olana kadar flush ettiği için bu satırlar
+    aynı transaction'da, tek commit ile yazılır.
+    """
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+
+    tenant_id, user_id = session.info[_ACTOR_KEY]
+    session.add_all(
+        models.AuditLog(
+            tenant_id=tenant_id,
+            user_id=user_id,
+            entity_type=entity,
+            entity_id=inspect(obj).identity[0],
+            action=action,
+            changes=snapshot(obj) if action == "CREATE" else changes,
+        )
+        for obj, entity, action, changes in pending
+    )
+
+
+def _after_soft_rollback(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def install_audit_hooks() -> None:
+    """
+    Unit-of-work audit modunu (AUDIT_LOG_MODE=transactional) etkinleştirir:
+    tüm session'lara flush dinleyicilerini bir kez ekler.
+    """
+    global _installed
+    if _installed:
+        return
+    event.listen(Session, "before_flush", _before_flush)
+    event.listen(Session, "after_flush_postexec", _after_flush_postexec)
+    event.listen(Session, "after_soft_rollback", _after_soft_rollback)
+    _installed = True
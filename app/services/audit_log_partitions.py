@@ -0,0 +1,292 @@
+# app/services/audit_log_partitions.py
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import re
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import column, select, table, text
+from sqlalchemy.engine import Connection, Engine
+from starlette.concurrency import run_in_threadpool
+
+from app import models
+from app.core.config import settings
+from app.database import engine
+from app.services.audit_diff import jsonable
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "audit_logs"
+DEFAULT_PARTITION = "audit_logs_default"
+
+# audit_logs_y2024m01 => 2024-01 ayı [2024-01-01, 2024-02-01)
+_PARTITION_NAME = re.compile(r"^audit_logs_y(\d{4})m(\d{2})$")
+
+# Birden fazla API süreci aynı anda bölüm oluşturmasın / arşivlemesin
+_MAINTENANCE_LOCK_KEY = 0x61756474  # "audt"
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"audit_logs_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def is_partitioned(conn: Connection) -> bool:
+    """
+    audit_logs Postgres'te bölümlenmiş tablo (relkind = 'p') ise True.
+    Diğer veritabanlarında (SQLite ile geliştirme) her zaman False.
+    """
+    if conn.dialect.name != "postgresql":
+        return False
+    relkind = conn.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": PARENT_TABLE},
+    ).scalar()
+    return relkind == "p"
+
+
+def list_partitions(conn: Connection) -> List[Tuple[str, date]]:
+    """
+    Bağlı aylık bölümler (ad, ay başı), eskiden yeniye. Default bölüm dahil değildir.
+    """
+    names = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:name)"
+        ),
+        {"name": PARENT_TABLE},
+    ).scalars()
+    partitions = [(name, partition_month(name)) for name in names]
+    return sorted((p for p in partitions if p[1] is not None), key=lambda p: p[1])
+
+
+def has_default_partition(conn: Connection) -> bool:
+    return conn.execute(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_inherits "
+            "WHERE inhparent = to_regclass(:parent) AND inhrelid = to_regclass(:name))"
+        ),
+        {"parent": PARENT_TABLE, "name": DEFAULT_PARTITION},
+    ).scalar()
+
+
+def default_partition_months(conn: Connection) -> List[date]:
+    """
+    Default bölümde satırı olan aylar (aralık dışı kalmış kayıtlar), eskiden yeniye.
+    """
+    if not has_default_partition(conn):
+        return []
+    months = conn.execute(text(
+        f"SELECT DISTINCT date_trunc('month', created_at)::date FROM {DEFAULT_PARTITION}"
+    )).scalars()
+    return sorted(months)
+
+
+def create_partition(conn: Connection, month: date) -> str:
+    """
+    Ayın bölümünü oluşturur. Default bölümde o aya düşen satırlar varsa
+    Postgres bölümü eklemeyi reddeder (default'un kısıtı bozulur); bu durumda
+    default ayrılır, ayın satırları yeni bölüme taşınır ve default geri bağlanır.
+    DETACH üst tabloyu transaction sonuna kadar kilitler; bu arada gelen
+    yazmalar bekler.
+    """
+    name = partition_name(month)
+    start, end = month.isoformat(), add_months(month, 1).isoformat()
+    bounds = f"FOR VALUES FROM ('{start}') TO ('{end}')"
+    in_range = f"created_at >= '{start}' AND created_at < '{end}'"
+
+    stranded = has_default_partition(conn) and conn.execute(
+        text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_range})")
+    ).scalar()
+    if not stranded:
+        conn.execute(text(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} {bounds}"))
+        return name
+
+    conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}"))
+    conn.execute(text(f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} {bounds}"))
+    moved = conn.execute(
+        text(f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}")
+    ).rowcount
+    conn.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"))
+    conn.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
+    logger.warning("Moved %d audit log rows from %s to new partition %s", moved, DEFAULT_PARTITION, name)
+    return name
+
+
+def ensure_partitions(
+    bind: Optional[Engine] = None,
+    months_ahead: Optional[int] = None,
+    today: Optional[date] = None,
+) -> List[str]:
+    """
+    İçinde bulunulan ay ve sonraki months_ahead ay için bölümleri (yoksa) oluşturur.
+    Bakım aksadığı için default bölüme düşmüş geçmiş ayların bölümleri de açılır
+    ve satırları taşınır; böylece arşivleme (saklama süresi) onları da kapsar.
+    Tablo bölümlenmemişse (SQLite, henüz dönüştürülmemiş Postgres) hiçbir şey yapmaz.
+    Oluşturulan bölümlerin adlarını döner.
+
+    Her bölüm kendi transaction'ında oluşturulur; biri başarısız olursa
+    diğerleri yine oluşturulur. İşlem sonunda default bölümde hâlâ satır varsa
+    (ör. months_ahead'den ileri tarihli kayıtlar) hata loglanır.
+    """
+    bind = bind or engine
+    months_ahead = settings.AUDIT_LOG_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    current = month_start(today or datetime.utcnow().date())
+    last = add_months(current, months_ahead)
+
+    created = []
+    with bind.connect() as conn:
+        if not is_partitioned(conn):
+            return created
+        existing = {name for name, _ in list_partitions(conn)}
+        stranded = [m for m in default_partition_months(conn) if m <= last]
+    months = sorted(set(stranded) | {add_months(current, offset) for offset in range(months_ahead + 1)})
+
+    for month in months:
+        if partition_name(month) in existing:
+            continue
+        try:
+            with bind.begin() as conn:
+                created.append(create_partition(conn, month))
+        except Exception:
+            logger.exception("Could not create audit log partition %s", partition_name(month))
+    if created:
+        logger.info("Created audit log partitions: %s", ", ".join(created))
+
+    with bind.connect() as conn:
+        remaining = default_partition_months(conn)
+    if remaining:
+        logger.error(
+            "%s still holds audit log rows for %s; they are not archived until moved into monthly partitions",
+            DEFAULT_PARTITION, ", ".join(m.strftime("%Y-%m") for m in remaining),
+        )
+    return created
+
+
+def archive_path(archive_dir: str, name: str) -> str:
+    return os.path.join(archive_dir, f"{name}.jsonl.gz")
+
+
+def _export_partition(conn: Connection, name: str, path: str) -> int:
+    """
+    Bölümün satırlarını gzip'li JSON Lines dosyasına yazar (sunucu tarafı cursor ile).
+    Dosya önce .tmp olarak yazılır; yarım kalan arşiv okuyucuya görünmez.
+    """
+    tmp_path = path + ".tmp"
+    count = 0
+    # Kolon tipleri modelden alınır (changes JSON olarak çözülür)
+    partition = table(name, *(column(c.name, c.type) for c in models.AuditLog.__table__.columns))
+    result = conn.execution_options(yield_per=settings.EXPORT_BATCH_SIZE).execute(
+        select(partition).order_by(partition.c.id)
+    )
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        for row in result.mappings():
+            f.write(json.dumps(jsonable(dict(row)), ensure_ascii=False) + "\n")
+            count += 1
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return count
+
+
+def archive_expired_partitions(
+    bind: Optional[Engine] = None,
+    retention_months: Optional[int] = None,
+    archive_dir: Optional[str] = None,
+    today: Optional[date] = None,
+) -> List[str]:
+    """
+    Saklama süresini (retention_months) tamamen aşmış aylık bölümleri
+    arşiv dizinine sıkıştırılmış dosya olarak yazar, tablodan ayırır (DETACH) ve siler.
+
+    Dosya diske yazılıp fsync edilmeden bölüm silinmez; arşivleme yarıda
+    kalırsa bölüm tabloda durur ve bir sonraki çalışmada yeniden denenir.
+    """
+    bind = bind or engine
+    retention_months = settings.AUDIT_LOG_RETENTION_MONTHS if retention_months is None else retention_months
+    archive_dir = archive_dir or settings.AUDIT_LOG_ARCHIVE_DIR
+    if retention_months <= 0:
+        return []
+
+    # Bu aydan önceki bölümler saklanmaz
+    cutoff = add_months(month_start(today or datetime.utcnow().date()), -retention_months)
+
+    with bind.connect() as conn:
+        if not is_partitioned(conn):
+            return []
+        expired = [name for name, month in list_partitions(conn) if month < cutoff]
+
+    archived = []
+    os.makedirs(archive_dir, exist_ok=True)
+    for name in expired:
+        path = archive_path(archive_dir, name)
+        with bind.connect() as conn:
+            count = _export_partition(conn, name, path)
+        with bind.begin() as conn:
+            conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+            conn.execute(text(f"DROP TABLE {name}"))
+        logger.info("Archived audit log partition %s (%d rows) to %s", name, count, path)
+        archived.append(name)
+    return archived
+
+
+def run_audit_log_maintenance(bind: Optional[Engine] = None, archive: bool = True) -> dict:
+    """
+    Bölüm oluşturma ve (archive=True ise) arşivleme. Postgres advisory lock ile
+    aynı anda sadece bir süreç çalıştırır; kilit alınamazsa atlanır.
+    """
+    bind = bind or engine
+    result = {"created": [], "archived": [], "skipped": False}
+    if bind.dialect.name != "postgresql":
+        return result
+
+    with bind.connect() as lock_conn:
+        locked = lock_conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": _MAINTENANCE_LOCK_KEY}
+        ).scalar()
+        if not locked:
+            result["skipped"] = True
+            return result
+        try:
+            result["created"] = ensure_partitions(bind)
+            if archive:
+                result["archived"] = archive_expired_partitions(bind)
+        finally:
+            lock_conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": _MAINTENANCE_LOCK_KEY}
+            )
+            lock_conn.commit()
+    return result
+
+
+async def run_audit_log_maintainer(interval_seconds: float) -> None:
+    """
+    Lifespan içinde arka plan görevi olarak çalışır; bölüm oluşturma ve
+    arşivlemeyi interval_seconds aralıkla (threadpool'da) tekrarlar.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(run_audit_log_maintenance)
+        except Exception:
+            logger.exception("Audit log partition maintenance failed")
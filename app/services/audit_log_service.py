@@ -1,11 +1,20 @@
 # app/services/audit_log_service.py
 
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from app import models
+from app.core.config import settings
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
+from app.services.audit_diff import jsonable
+from app.services.audit_log_hooks import is_unit_of_work_active
+from app.services.audit_log_writer import audit_log_writer
+
+# Keyset pagination sıralaması (yeniden eskiye, son kolon benzersiz)
+AUDIT_LOG_LIST_ORDER = (models.AuditLog.created_at, models.AuditLog.id)
 
 
 class AuditLogService:
@@ -22,37 +31,108 @@ class AuditLogService:
         entity_id: int,
         action: str,
         changes: Optional[Dict[str, Any]] = None,
+        commit: bool = True,
     ) -> models.AuditLog:
         """
         Yeni bir audit log kaydı oluşturur.
         Sistem tarafından otomatik çağrılır, API üzerinden manuel tetiklenmez.
+
+        commit=False verilirse kayıt sadece session'a eklenir; çağıranın
+        transaction'ıyla birlikte commit edilir.
+        AUDIT_LOG_MODE=buffered iken (commit=True) kayıt arka plan yazıcısının
+        kuyruğuna atılır ve toplu INSERT ile yazılır; dönen nesnenin id'si boştur.
+        AUDIT_LOG_MODE=transactional iken (commit=True) değişiklik zaten iş
+        transaction'ında flush hook'u ile kaydedildiği için tekrar yazılmaz.
         """
+        if commit and is_unit_of_work_active(db):
+            return models.AuditLog(entity_type=entity, entity_id=entity_id, action=action)
 
-        log = models.AuditLog(
+        values = dict(
             tenant_id=user.tenant_id if user else None,
             user_id=user.id if user else None,
             entity_type=entity,
             entity_id=entity_id,
             action=action,
-            changes=changes,
+            changes=jsonable(changes),
+            created_at=datetime.utcnow(),
         )
+        log = models.AuditLog(**values)
+
+        if (
+            commit
+            and settings.AUDIT_LOG_MODE == "buffered"
+            and audit_log_writer.enqueue(values)
+        ):
+            return log
 
         db.add(log)
-        db.commit()
+        if commit:
+            db.commit()
         # Log kaydı sadece insert edildiği için refresh genellikle gerekmez, 
         # ancak ID'ye hemen ihtiyaç varsa eklenebilir.
         return log
 
     @staticmethod
-    def list_logs(db: Session, tenant_id: int) -> List[models.AuditLog]:
+    def list_logs(
+        db: Session,
+        tenant_id: int,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.AuditLog]:
         """
-        Bir tenant'a ait tüm audit loglarını, yeniden eskiye doğru listeler.
+        Bir tenant'a ait audit loglarını, yeniden eskiye doğru sayfa sayfa listeler.
+        Kayıt (entity_type / entity_id), kullanıcı, işlem ve zaman aralığı
+        [since, until) ile filtrelenebilir.
         """
-        return (
-            db.query(models.AuditLog)
-            .filter(models.AuditLog.tenant_id == tenant_id)
-            .order_by(models.AuditLog.created_at.desc())
-            .all()
+        q = db.query(models.AuditLog).filter(models.AuditLog.tenant_id == tenant_id)
+
+        if entity_type is not None:
+            q = q.filter(models.AuditLog.entity_type == entity_type)
+
+        if entity_id is not None:
+            q = q.filter(models.AuditLog.entity_id == entity_id)
+
+        if user_id is not None:
+            q = q.filter(models.AuditLog.user_id == user_id)
+
+        if action is not None:
+            q = q.filter(models.AuditLog.action == action)
+
+        # Bölümlenmiş tabloda (Postgres) zaman aralığı dışındaki aylar taranmaz
+        if since is not None:
+            q = q.filter(models.AuditLog.created_at >= since)
+
+        if until is not None:
+            q = q.filter(models.AuditLog.created_at < until)
+
+        q = apply_keyset(q, AUDIT_LOG_LIST_ORDER, cursor, limit, descending=True)
+        return build_page(q.all(), AUDIT_LOG_LIST_ORDER, limit)
+
+    @staticmethod
+    def get_entity_history(
+        db: Session,
+        tenant_id: int,
+        entity_type: str,
+        entity_id: int,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.AuditLog]:
+        """
+        Tek bir kaydın (ör. client 123) değişiklik geçmişi, yeniden eskiye.
+        """
+        return AuditLogService.list_logs(
+            db=db,
+            tenant_id=tenant_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            cursor=cursor,
+            limit=limit,
         )
 
     @staticmethod
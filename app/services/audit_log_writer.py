@@ -0,0 +1,221 @@
+# app/services/audit_log_writer.py
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+
+from app import models
+from app.core.config import settings
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+class AuditLogWriter:
+    """
+    Audit log kayıtlarını arka planda toplu yazan (write-behind) yazıcı.
+
+    - AuditLogService.log kayıtları commit etmek yerine kuyruğa atar
+    - Arka plan thread'i kuyruğu batch_size dolunca veya flush_interval
+      saniyede bir, tek bir çok satırlı INSERT ile yazar
+    - stop() çağrıldığında kuyrukta bekleyen tüm kayıtlar yazılır (lifespan)
+    - Yazılamayan batch max_attempts kez denenir, sonra ikiye bölünerek yazılır;
+      tek başına da yazılamayan satırlar (ör. kısıt ihlali) dead-letter dosyasına
+      gider. Böylece tek bozuk satır diğer kayıtları bekletmez.
+
+    Kuyruktaki kayıtlar sadece bellekte durur; süreç çökerse kaybolur.
+    Yazıcı çalışmıyorsa veya kuyruk doluysa enqueue False döner; çağıran
+    kaydı eskisi gibi kendi session'ıyla senkron yazar.
+    """
+
+    def __init__(
+        self,
+        bind: Engine,
+        batch_size: int,
+        flush_interval: float,
+        max_queue: int,
+        max_attempts: Optional[int] = None,
+        dead_letter_path: Optional[str] = None,
+    ):
+        self.bind = bind
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max(1, max_attempts or settings.AUDIT_LOG_WRITE_ATTEMPTS)
+        if dead_letter_path is None:
+            dead_letter_path = settings.AUDIT_LOG_DEAD_LETTER_PATH
+        self.dead_letter_path = dead_letter_path
+        self._queue: "queue.Queue[dict]" = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.enqueued = 0
+        self.written = 0
+        self.batches = 0
+        self.failures = 0
+        self.dead_lettered = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="audit-log-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Yeni kayıt kabulünü durdurur ve kuyruktakileri yazıp thread'i bitirir.
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+        # Durdurma anında kuyruğa girmiş olabilecek son kayıtlar
+        while True:
+            batch = self._drain()
+            if not batch:
+                break
+            self._write_with_retry(batch)
+
+    def enqueue(self, row: dict) -> bool:
+        if not self.running or self._stop.is_set():
+            return False
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            return False
+        with self._lock:
+            self.enqueued += 1
+        return True
+
+    def _take_batch(self, timeout: float) -> List[dict]:
+        batch = []
+        try:
+            batch.append(self._queue.get(timeout=timeout))
+        except queue.Empty:
+            return batch
+
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stop.is_set():
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain(self) -> List[dict]:
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: List[dict]) -> None:
+        # Tek ifade: INSERT INTO audit_logs (...) VALUES (...), (...), ...
+        with self.bind.begin() as conn:
+            conn.execute(insert(models.AuditLog.__table__).values(batch))
+        with self._lock:
+            self.written += len(batch)
+            self.batches += 1
+
+    def _write_with_retry(self, batch: List[dict]) -> None:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                self._write(batch)
+                return
+            except Exception:
+                with self._lock:
+                    self.failures += 1
+                logger.exception(
+                    "Audit log batch write failed (%d rows, attempt %d/%d)",
+                    len(batch), attempt, self.max_attempts,
+                )
+            # Kapanışta beklemeden bölmeye geçilir
+            if attempt < self.max_attempts and not self._stop.is_set():
+                time.sleep(self.flush_interval)
+        self._write_split(batch)
+
+    def _write_split(self, batch: List[dict]) -> None:
+        """
+        Batch'i ikiye bölüp parçaları birer kez yazmayı dener; yazılamayan
+        parça tek satıra inene kadar bölünür, o satır dead-letter'a gider.
+        """
+        if len(batch) == 1:
+            self._dead_letter(batch)
+            return
+        middle = len(batch) // 2
+        for part in (batch[:middle], batch[middle:]):
+            try:
+                self._write(part)
+            except Exception:
+                self._write_split(part)
+
+    def _dead_letter(self, rows: List[dict]) -> None:
+        with self._lock:
+            self.dead_lettered += len(rows)
+        logger.error("Dead-lettering %d audit log rows: %r", len(rows), rows)
+        if not self.dead_letter_path:
+            return
+        try:
+            directory = os.path.dirname(self.dead_letter_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+                for row in rows:
+                    f.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+        except OSError:
+            logger.exception("Audit log dead-letter write failed: %s", self.dead_letter_path)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = self._take_batch(timeout=self.flush_interval)
+            if batch:
+                self._write_with_retry(batch)
+
+        # Kapanış: kuyrukta kalanları yaz
+        while True:
+            batch = self._drain()
+            if not batch:
+                break
+            self._write_with_retry(batch)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "running": self.running,
+                "queued": self._queue.qsize(),
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "batches": self.batches,
+                "failures": self.failures,
+                "dead_lettered": self.dead_lettered,
+            }
+
+
+audit_log_writer = AuditLogWriter(
+    bind=engine,
+    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+    flush_interval=settings.AUDIT_LOG_FLUSH_INTERVAL_MS / 1000,
+    max_queue=settings.AUDIT_LOG_QUEUE_MAX_SIZE,
+)
@@ -1,22 +1,34 @@
 # app/services/auth_service.py
 
+from dataclasses import dataclass
+from datetime import timedelta
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
-from sqlalchemy.orm import Session
+from jose import JWTError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 from pydantic import ValidationError
 
 from app import models, schemas
 from app.core import security
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.executor import ExecutorSaturated
+from app.core.sql_instrumentation import set_request_user
 from app.core.utils import slugify
-from app.database import get_db
+from app.database import get_db, get_async_db
+from app.services.audit_log_hooks import set_audit_actor
+from app.services.token_revocation_service import revocation_list
 
 # Token URL'si auth router'ındaki login endpoint'ini işaret eder
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Sadece AI iş olayları stream'ine bağlanmak için verilen kısa ömürlü token'ların scope'u
+STREAM_TOKEN_SCOPE = "ai_job_events"
+
 
 def create_tenant_and_owner(db: Session, user_in: schemas.UserCreate) -> models.User:
     """
@@ -41,7 +53,7 @@ def create_tenant_and_owner(db: Session, user_in: schemas.UserCreate) -> models.
         email=user_in.email,
         full_name=user_in.full_name,
         password_hash=hashed_password,
-        role="OWNER",
+        role=schemas.UserRole.OWNER.value,
         is_active=True,
     )
     db.add(user)
@@ -65,6 +77,39 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[models
         return None
     if not security.verify_password(password, user.password_hash):
         return None
+
+    # BCRYPT_ROUNDS değiştiyse hash'i yeni maliyetle yenile (şifre elimizdeyken)
+    if security.needs_rehash(user.password_hash):
+        try:
+            user.password_hash = security.get_password_hash(password)
+            db.commit()
+        except ExecutorSaturated:
+            pass  # Bir sonraki login'de tekrar denenir
+    return user
+
+
+async def authenticate_user_async(
+        db: AsyncSession, email: str, password: str
+) -> Optional[models.User]:
+    """
+    authenticate_user'ın async karşılığı.
+    bcrypt sınırlı havuzda çalışır; havuz doluysa ExecutorSaturated fırlatır.
+    """
+    result = await db.execute(
+        select(models.User).filter(models.User.email == email)
+    )
+    user = result.scalars().first()
+    if not user:
+        return None
+    if not await security.verify_password_async(password, user.password_hash):
+        return None
+
+    if security.needs_rehash(user.password_hash):
+        try:
+            user.password_hash = await security.get_password_hash_async(password)
+            await db.commit()
+        except ExecutorSaturated:
+            pass  # Bir sonraki login'de tekrar denenir
     return user
 
 
@@ -76,49 +121,285 @@ def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
 
 
 # ==========================================
-#  MERKEZİ AUTH DEPENDENCY (BAĞIMLILIK)
+#  AKTİF KULLANICI CACHE'İ
 # ==========================================
-def get_current_user(
-        token: str = Depends(oauth2_scheme),
-        db: Session = Depends(get_db),
-) -> models.User:
+# Her korumalı istekte kullanıcıyı DB'den çekmemek için aktif kullanıcıların
+# kolon değerleri bellekte tutulur. Cache süreç içidir; diğer worker'lar
+# güncellemeyi en geç AUTH_USER_CACHE_TTL_SECONDS sonra görür.
+user_cache = TTLCache(
+    max_size=settings.AUTH_USER_CACHE_MAX_SIZE,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+
+# Şifre hash'i cache'e alınmaz; gerekirse erişildiğinde DB'den yüklenir
+_CACHED_USER_FIELDS = tuple(
+    attr.key
+    for attr in models.User.__mapper__.column_attrs
+    if attr.key != "password_hash"
+)
+
+
+def invalidate_cached_user(user_id: int) -> None:
     """
-    Tüm korumalı endpoint'lerde kullanılan dependency.
-    JWT Token'ı doğrular ve ilgili kullanıcıyı veritabanından çeker.
+    Kullanıcı güncellendiğinde / pasifleştirildiğinde / silindiğinde çağrılır.
+    """
+    user_cache.invalidate(user_id)
+
+
+def _cache_user(user: Optional[models.User]) -> None:
+    if user is not None and user.is_active:
+        user_cache.set(
+            user.id,
+            {key: getattr(user, key) for key in _CACHED_USER_FIELDS},
+        )
+
+
+def _user_from_cache(user_id: int) -> Optional[models.User]:
+    """
+    Cache'teki değerlerden DB'ye gitmeden detached bir User nesnesi kurar.
+    Çağıran, nesneyi merge(load=False) ile kendi session'ına bağlar.
     """
-    credentials_exception = HTTPException(
+    if not user_cache.enabled:
+        return None
+    # Başka bir worker'da pasifleştirilen kullanıcı, TTL dolmadan da DB'den kontrol edilir
+    if revocation_list.is_user_revoked(user_id):
+        user_cache.invalidate(user_id)
+        return None
+    values = user_cache.get(user_id)
+    if values is None:
+        return None
+    user = models.User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
+# ==========================================
+#  MERKEZİ AUTH DEPENDENCY (BAĞIMLILIK)
+# ==========================================
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def decode_token(token: str, scope: Optional[str] = None) -> dict:
+    """
+    JWT Token'ı doğrular ve payload'ını döner.
+    Logout ile iptal edilmiş (jti) token'lar reddedilir. Token'ın scope claim'i
+    `scope` ile aynı olmalıdır: access token'larda scope yoktur, stream
+    token'ları da sadece stream bağlantısında geçerlidir.
+    """
+    credentials_exception = _credentials_exception()
+
     try:
-        # Token decode işlemi (Ayarlar config'den)
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        # Token decode işlemi (önceden yüklenmiş anahtar + doğrulanmış token cache'i)
+        payload = security.decode_access_token(token)
 
-        user_id: str = payload.get("sub")
-        if user_id is None:
+        if payload.get("sub") is None or payload.get("scope") != scope:
             raise credentials_exception
 
     except (JWTError, ValidationError):
         raise credentials_exception
 
-    # Kullanıcıyı bul
+    if revocation_list.is_token_revoked(payload.get("jti")):
+        raise credentials_exception
+
+    return payload
+
+
+def _get_user_id_from_token(token: str) -> int:
+    """
+    JWT Token'ı doğrular ve içindeki kullanıcı ID'sini (sub) döner.
+    """
+    payload = decode_token(token)
+
     try:
-        user_id_int = int(user_id)
+        return int(payload["sub"])
     except ValueError:
-        raise credentials_exception
+        raise _credentials_exception()
 
-    user = db.query(models.User).filter(models.User.id == user_id_int).first()
 
+def _ensure_active_user(user: Optional[models.User]) -> models.User:
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
 
-    return user
\ No newline at end of file
+    # Yavaş sorgu kayıtlarının tenant/kullanıcı ile etiketlenmesi için
+    set_request_user(user.tenant_id, user.id)
+    return user
+
+
+def get_current_user(
+        token: str = Depends(oauth2_scheme),
+        db: Session = Depends(get_db),
+) -> models.User:
+    """
+    Tüm korumalı endpoint'lerde kullanılan dependency.
+    JWT Token'ı doğrular ve ilgili kullanıcıyı (önce cache'ten) getirir.
+
+    Okuma endpoint'lerinde de bilerek primary (get_db) kullanılır:
+    - yazan endpoint'ler aynı session'ı paylaşır; audit aktörü o session'a bağlanır
+    - yetki kararı (is_active, rol, tenant) replica gecikmesiyle eski veriye dayanmamalı
+    Cache isabetinde SELECT atılmaz; primary'ye gitmeyen okuma için get_current_principal.
+    """
+    user_id = _get_user_id_from_token(token)
+
+    cached = _user_from_cache(user_id)
+    if cached is not None:
+        # SELECT atmadan isteğin session'ına bağlanır (lazy load'lar çalışır)
+        user = _ensure_active_user(db.merge(cached, load=False))
+    else:
+        # Kullanıcıyı bul
+        user = db.query(models.User).filter(models.User.id == user_id).first()
+        _cache_user(user)
+        user = _ensure_active_user(user)
+
+    # Endpoint aynı session'ı kullanır; otomatik audit kayıtları bu kullanıcı adına
+    set_audit_actor(db, user)
+    return user
+
+
+async def get_current_user_async(
+        token: str = Depends(oauth2_scheme),
+        db: AsyncSession = Depends(get_async_db),
+) -> models.User:
+    """
+    get_current_user'ın async endpoint'ler için olan karşılığı.
+    Kullanıcıyı AsyncSession ile, threadpool'u meşgul etmeden çeker.
+    """
+    user_id = _get_user_id_from_token(token)
+
+    cached = _user_from_cache(user_id)
+    if cached is not None:
+        return _ensure_active_user(await db.merge(cached, load=False))
+
+    result = await db.execute(
+        select(models.User).filter(models.User.id == user_id)
+    )
+    user = result.scalars().first()
+    _cache_user(user)
+
+    return _ensure_active_user(user)
+
+
+# ==========================================
+#  CLAIMS-ONLY (STATELESS) AUTH
+# ==========================================
+@dataclass(frozen=True)
+class Principal:
+    """
+    JWT claim'lerinden kurulan hafif kullanıcı temsili.
+    Okuma endpoint'lerinin kullandığı alanları (id, tenant_id, role) taşır.
+    """
+    id: int
+    tenant_id: int
+    role: str
+    jti: Optional[str] = None
+    issued_at: Optional[float] = None
+
+
+def _principal_from_claims(payload: dict) -> Optional[Principal]:
+    """
+    tenant_id / role claim'i olmayan (eski) token'lar için None döner.
+    """
+    try:
+        return Principal(
+            id=int(payload["sub"]),
+            tenant_id=int(payload["tenant_id"]),
+            role=payload["role"],
+            jti=payload.get("jti"),
+            issued_at=payload.get("iat"),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+async def get_current_principal(
+        token: str = Depends(oauth2_scheme),
+        db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Okuma ağırlıklı endpoint'ler için dependency.
+
+    AUTH_STATELESS_READS açıksa kullanıcı DB'den çekilmez; imzalı claim'lerden
+    bir Principal kurulur. Logout edilen token'lar, pasif / silinen kullanıcılar ve
+    rolü / tenant'ı değişmeden önce verilmiş token'lar periyodik yenilenen iptal
+    listesiyle reddedilir.
+    Kapalıysa (veya claim'ler eksikse) get_current_user_async'e düşer.
+    """
+    if settings.AUTH_STATELESS_READS:
+        principal = _principal_from_claims(decode_token(token))
+        if principal is not None:
+            if revocation_list.is_user_revoked(principal.id, principal.issued_at):
+                raise _credentials_exception()
+            set_request_user(principal.tenant_id, principal.id)
+            return principal
+
+    return await get_current_user_async(token=token, db=db)
+
+
+def create_stream_token(principal) -> str:
+    """
+    /ai-jobs/events ve /ai-jobs/ws için URL'de taşınabilecek kısa ömürlü token.
+    Uzun ömürlü access token query string'e (ve proxy / erişim loglarına) girmez.
+    """
+    data = {
+        "sub": str(principal.id),
+        "tenant_id": principal.tenant_id,
+        "role": principal.role,
+        "scope": STREAM_TOKEN_SCOPE,
+    }
+    issued_at = getattr(principal, "issued_at", None)
+    if issued_at is not None:
+        # Claim'leri aldığı access token iptal edilirse stream token'ı da geçersiz olsun
+        data["iat"] = issued_at
+    return security.create_access_token(
+        data=data,
+        expires_delta=timedelta(seconds=settings.AI_JOB_STREAM_TOKEN_EXPIRE_SECONDS),
+    )
+
+
+def get_stream_principal(token: str) -> Principal:
+    """
+    Stream token'ını doğrular; DB'ye gitmeden claim'lerden Principal kurar.
+    Pasif / silinen kullanıcılar iptal listesiyle reddedilir.
+    """
+    principal = _principal_from_claims(decode_token(token, scope=STREAM_TOKEN_SCOPE))
+    if principal is None or revocation_list.is_user_revoked(principal.id, principal.issued_at):
+        raise _credentials_exception()
+    set_request_user(principal.tenant_id, principal.id)
+    return principal
+
+
+def get_current_owner(
+        current_user: models.User = Depends(get_current_user),
+) -> models.User:
+    """
+    Sadece tenant sahibinin (role=OWNER) yapabileceği işlemler için
+    (kullanıcı ekleme / silme, rol değiştirme).
+    """
+    if current_user.role != schemas.UserRole.OWNER.value:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only the tenant owner can manage users",
+        )
+    return current_user
+
+
+def get_current_admin(
+        current_user: models.User = Depends(get_current_user),
+) -> models.User:
+    """
+    Sadece sistem yöneticilerinin (is_system_admin) erişebileceği, tenant'lar
+    arası bilgi gösteren endpoint'ler için. Tenant rolleri (OWNER dahil) yetmez.
+    """
+    if not current_user.is_system_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions",
+        )
+    return current_user
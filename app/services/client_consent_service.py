@@ -6,7 +6,13 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from app import models, schemas
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
+from app.services.audit_diff import diff, snapshot
 from app.services.audit_log_service import AuditLogService
+from app.services.tenant_ownership import TenantOwnershipService
+
+# Keyset pagination sıralaması (yeniden eskiye, son kolon benzersiz)
+CONSENT_LIST_ORDER = (models.ClientConsent.created_at, models.ClientConsent.id)
 
 
 class ClientConsentService:
@@ -19,24 +25,15 @@ class ClientConsentService:
         db: Session,
         tenant_id: int,
         client_id: int
-    ) -> models.Client:
+    ) -> None:
         """
         Belirtilen danışanın tenant içinde olup olmadığını doğrular.
         """
-        client = (
-            db.query(models.Client)
-            .filter(
-                models.Client.id == client_id,
-                models.Client.tenant_id == tenant_id,
-            )
-            .first()
+        TenantOwnershipService.ensure_in_tenant(
+            db,
+            tenant_id,
+            (models.Client, client_id, "Client not found for this tenant."),
         )
-        if not client:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Client not found for this tenant."
-            )
-        return client
 
     @staticmethod
     def _get_consent_with_tenant_check(
@@ -108,7 +105,9 @@ class ClientConsentService:
         db: Session,
         tenant_id: int,
         client_id: Optional[int] = None,
-    ) -> List[models.ClientConsent]:
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.ClientConsent]:
         """
         Tenant'a ait onay formlarını listeler.
         client_id verilirse sadece o danışanın formları döner.
@@ -122,7 +121,8 @@ class ClientConsentService:
         if client_id is not None:
             q = q.filter(models.ClientConsent.client_id == client_id)
 
-        return q.order_by(models.ClientConsent.created_at.desc()).all()
+        q = apply_keyset(q, CONSENT_LIST_ORDER, cursor, limit, descending=True)
+        return build_page(q.all(), CONSENT_LIST_ORDER, limit)
 
     @staticmethod
     def get_consent(
@@ -153,7 +153,6 @@ class ClientConsentService:
         )
 
         update_data = data.model_dump(exclude_unset=True)
-        before = consent.__dict__.copy()
 
         # Eğer client_id değişiyorsa tenant kontrolü tekrar yapılmalı
         if "client_id" in update_data:
@@ -164,6 +163,8 @@ class ClientConsentService:
         for k, v in update_data.items():
             setattr(consent, k, v)
 
+        changes = diff(consent)
+
         db.commit()
         db.refresh(consent)
 
@@ -173,10 +174,7 @@ class ClientConsentService:
             entity="ClientConsent",
             entity_id=consent.id,
             action="UPDATE",
-            changes={
-                "before": before,
-                "after": update_data
-            },
+            changes=changes,
         )
 
         return consent
@@ -194,7 +192,7 @@ class ClientConsentService:
         consent = ClientConsentService._get_consent_with_tenant_check(
             db, tenant_id, consent_id
         )
-        before = consent.__dict__.copy()
+        before = snapshot(consent)
 
         db.delete(consent)
         db.commit()
@@ -1,14 +1,21 @@
 # app/services/client_service.py
 
-from typing import List
+from typing import List, Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models, schemas
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
+from app.services.audit_diff import diff, snapshot
 from app.services.audit_log_service import AuditLogService
 
+# Keyset pagination sıralaması (son kolon benzersiz olmalı)
+CLIENT_LIST_ORDER = (models.Client.first_name, models.Client.last_name, models.Client.id)
+
 
 class ClientService:
     """
@@ -55,16 +62,18 @@ class ClientService:
         return client
 
     @staticmethod
-    def list_clients(db: Session, tenant_id: int) -> List[models.Client]:
+    def list_clients(
+        db: Session,
+        tenant_id: int,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.Client]:
         """
-        Tenant'a ait tüm danışanları isim sırasına göre listeler.
+        Tenant'a ait danışanları isim sırasına göre sayfa sayfa listeler.
         """
-        return (
-            db.query(models.Client)
-            .filter(models.Client.tenant_id == tenant_id)
-            .order_by(models.Client.first_name, models.Client.last_name)
-            .all()
-        )
+        q = db.query(models.Client).filter(models.Client.tenant_id == tenant_id)
+        q = apply_keyset(q, CLIENT_LIST_ORDER, cursor, limit)
+        return build_page(q.all(), CLIENT_LIST_ORDER, limit)
 
     @staticmethod
     def get_client(db: Session, tenant_id: int, client_id: int) -> models.Client:
@@ -98,12 +107,13 @@ class ClientService:
         Danışan bilgilerini günceller (Tam güncelleme - PUT).
         """
         client = ClientService.get_client(db, tenant_id, client_id)
-        before = client.__dict__.copy()
 
         # Tüm alanları güncelle
         for field, value in data.model_dump().items():
             setattr(client, field, value)
 
+        changes = diff(client)
+
         try:
             db.commit()
         except IntegrityError:
@@ -121,10 +131,7 @@ class ClientService:
             entity="client",
             entity_id=client.id,
             action="UPDATE",
-            changes={
-                "before": before,
-                "after": data.model_dump(),
-            },
+            changes=changes,
         )
 
         return client
@@ -141,13 +148,14 @@ class ClientService:
         Danışan bilgilerini kısmi olarak günceller (PATCH).
         """
         client = ClientService.get_client(db, tenant_id, client_id)
-        before = client.__dict__.copy()
 
         update_data = data.model_dump(exclude_unset=True)
 
         for field, value in update_data.items():
             setattr(client, field, value)
 
+        changes = diff(client)
+
         try:
             db.commit()
         except IntegrityError:
@@ -165,10 +173,7 @@ class ClientService:
             entity="client",
             entity_id=client.id,
             action="PATCH",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return client
@@ -184,7 +189,7 @@ class ClientService:
         Bir danışanı siler.
         """
         client = ClientService.get_client(db, tenant_id, client_id)
-        before = client.__dict__.copy()
+        before = snapshot(client)
 
         db.delete(client)
         db.commit()
@@ -196,4 +201,48 @@ class ClientService:
             entity_id=client.id,
             action="DELETE",
             changes={"before": before},
-        )
\ No newline at end of file
+        )
+
+
+class AsyncClientService:
+    """
+    ClientService'in okuma (listeleme/detay) işlemleri için AsyncSession
+    kullanan varyantı. Async endpoint'ler threadpool'a düşmeden çalışır.
+    """
+
+    @staticmethod
+    async def list_clients(
+        db: AsyncSession,
+        tenant_id: int,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.Client]:
+        """
+        Tenant'a ait danışanları isim sırasına göre sayfa sayfa listeler.
+        """
+        q = select(models.Client).filter(models.Client.tenant_id == tenant_id)
+        result = await db.execute(apply_keyset(q, CLIENT_LIST_ORDER, cursor, limit))
+        return build_page(result.scalars().all(), CLIENT_LIST_ORDER, limit)
+
+    @staticmethod
+    async def get_client(
+        db: AsyncSession,
+        tenant_id: int,
+        client_id: int,
+    ) -> models.Client:
+        """
+        ID'ye göre tek bir danışan detayını getirir.
+        """
+        result = await db.execute(
+            select(models.Client).filter(
+                models.Client.id == client_id,
+                models.Client.tenant_id == tenant_id,
+            )
+        )
+        client = result.scalars().first()
+        if not client:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Client not found",
+            )
+        return client
@@ -0,0 +1,136 @@
+# app/services/export_service.py
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Iterator, List
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.core.config import settings
+
+MEDIA_TYPES = {
+    schemas.ExportFormat.NDJSON: "application/x-ndjson",
+    schemas.ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+_EXPORT_TABLES = {
+    schemas.ExportEntity.CLIENTS: models.Client.__table__,
+    schemas.ExportEntity.SESSIONS: models.Session.__table__,
+    schemas.ExportEntity.SESSION_NOTES: models.SessionNote.__table__,
+    schemas.ExportEntity.AUDIT_LOGS: models.AuditLog.__table__,
+}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} JSON'a çevrilemez")
+
+
+def _csv_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    # JSON kolonları (ör. audit_logs.changes) Python repr'i yerine JSON olarak yazılır
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return value
+
+
+class ExportService:
+    """
+    Tenant verilerini satır satır dışa aktarır (NDJSON / CSV).
+
+    ORM nesnesi ve Pydantic modeli oluşturulmaz; satırlar sunucu tarafı
+    cursor'dan (yield_per) EXPORT_BATCH_SIZE'lık parçalar halinde okunur ve
+    yazılır. Böylece bellek kullanımı tenant büyüklüğünden bağımsız kalır.
+    """
+
+    @staticmethod
+    def columns(entity: schemas.ExportEntity) -> List[str]:
+        return [c.name for c in _EXPORT_TABLES[entity].columns]
+
+    @staticmethod
+    def _query(entity: schemas.ExportEntity, tenant_id: int) -> Select:
+        table = _EXPORT_TABLES[entity]
+
+        if entity == schemas.ExportEntity.SESSION_NOTES:
+            # Notlarda tenant_id yok; seans üzerinden filtrelenir
+            sessions = models.Session.__table__
+            stmt = (
+                select(table)
+                .join(sessions, sessions.c.id == table.c.session_id)
+                .where(sessions.c.tenant_id == tenant_id)
+            )
+        else:
+            stmt = select(table).where(table.c.tenant_id == tenant_id)
+
+        return stmt.order_by(table.c.id)
+
+    @staticmethod
+    def iter_rows(db: Session, tenant_id: int, entity: schemas.ExportEntity) -> Iterator[dict]:
+        """
+        Tenant'a ait kayıtları sunucu tarafı cursor ile tek tek döner.
+        """
+        result = db.execute(
+            ExportService._query(entity, tenant_id),
+            execution_options={"yield_per": settings.EXPORT_BATCH_SIZE},
+        )
+        for row in result.mappings():
+            yield row
+
+    @staticmethod
+    def _ndjson_chunks(rows: Iterator[dict]) -> Iterator[str]:
+        batch = []
+        for row in rows:
+            batch.append(json.dumps(dict(row), default=_json_default, ensure_ascii=False))
+            if len(batch) >= settings.EXPORT_BATCH_SIZE:
+                yield "\n".join(batch) + "\n"
+                batch = []
+        if batch:
+            yield "\n".join(batch) + "\n"
+
+    @staticmethod
+    def _csv_chunks(rows: Iterator[dict], fieldnames: List[str]) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fieldnames)
+
+        count = 0
+        for row in rows:
+            writer.writerow([_csv_value(row[name]) for name in fieldnames])
+            count += 1
+            if count >= settings.EXPORT_BATCH_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+                count = 0
+        yield buffer.getvalue()
+
+    @staticmethod
+    def stream(
+        session_factory,
+        tenant_id: int,
+        entity: schemas.ExportEntity,
+        fmt: schemas.ExportFormat,
+    ) -> Iterator[str]:
+        """
+        StreamingResponse gövdesi.
+        Yanıt gönderilirken request dependency'leri kapanmış olacağı için
+        session burada açılır ve akış bitince (veya istemci koparsa) kapanır.
+        """
+        db = session_factory()
+        try:
+            rows = ExportService.iter_rows(db, tenant_id, entity)
+            if fmt == schemas.ExportFormat.CSV:
+                yield from ExportService._csv_chunks(rows, ExportService.columns(entity))
+            else:
+                yield from ExportService._ndjson_chunks(rows)
+        finally:
+            db.close()
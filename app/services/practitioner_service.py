@@ -1,13 +1,19 @@
 # app/services/practitioner_service.py
 
-from typing import List
+from typing import List, Optional
 
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app import models, schemas
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
+from app.services.audit_diff import diff, snapshot
 from app.services.audit_log_service import AuditLogService
+from app.services.tenant_ownership import TenantOwnershipService
+
+# Keyset pagination sıralaması
+PROFILE_LIST_ORDER = (models.PractitionerProfile.id,)
 
 
 class PractitionerService:
@@ -21,24 +27,15 @@ class PractitionerService:
             db: Session,
             tenant_id: int,
             user_id: int,
-    ) -> models.User:
+    ) -> None:
         """
         Belirtilen kullanıcının, belirtilen tenant'a ait olup olmadığını doğrular.
         """
-        user = (
-            db.query(models.User)
-            .filter(
-                models.User.id == user_id,
-                models.User.tenant_id == tenant_id,
-            )
-            .first()
+        TenantOwnershipService.ensure_in_tenant(
+            db,
+            tenant_id,
+            (models.User, user_id, "User not found for this tenant."),
         )
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="User not found for this tenant.",
-            )
-        return user
 
     @staticmethod
     def _get_profile_with_tenant_check(
@@ -130,16 +127,22 @@ class PractitionerService:
         return profile
 
     @staticmethod
-    def list_profiles(db: Session, tenant_id: int) -> List[models.PractitionerProfile]:
+    def list_profiles(
+        db: Session,
+        tenant_id: int,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.PractitionerProfile]:
         """
-        Tenant'a ait tüm uygulayıcı profillerini listeler.
+        Tenant'a ait uygulayıcı profillerini sayfa sayfa listeler.
         """
-        return (
+        q = (
             db.query(models.PractitionerProfile)
             .join(models.User, models.User.id == models.PractitionerProfile.user_id)
             .filter(models.User.tenant_id == tenant_id)
-            .all()
         )
+        q = apply_keyset(q, PROFILE_LIST_ORDER, cursor, limit)
+        return build_page(q.all(), PROFILE_LIST_ORDER, limit)
 
     @staticmethod
     def get_profile(
@@ -174,7 +177,6 @@ class PractitionerService:
             profile_id=profile_id,
         )
 
-        before = profile.__dict__.copy()
         update_data = data.model_dump()
 
         # Eğer user_id değiştirilmek isteniyorsa güvenlik kontrolü
@@ -189,6 +191,8 @@ class PractitionerService:
         for field, value in update_data.items():
             setattr(profile, field, value)
 
+        changes = diff(profile)
+
         try:
             db.commit()
         except IntegrityError:
@@ -206,10 +210,7 @@ class PractitionerService:
             entity="practitioner_profile",
             entity_id=profile.id,
             action="UPDATE",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return profile
@@ -232,8 +233,6 @@ class PractitionerService:
         )
         update_data = data.model_dump(exclude_unset=True)
 
-        before = profile.__dict__.copy()
-
         # user_id değişiyorsa güvenlik kontrolü
         new_user_id = update_data.get("user_id", profile.user_id)
         if new_user_id != profile.user_id:
@@ -246,6 +245,8 @@ class PractitionerService:
         for field, value in update_data.items():
             setattr(profile, field, value)
 
+        changes = diff(profile)
+
         try:
             db.commit()
         except IntegrityError:
@@ -263,10 +264,7 @@ class PractitionerService:
             entity="practitioner_profile",
             entity_id=profile.id,
             action="PATCH",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return profile
@@ -286,7 +284,7 @@ class PractitionerService:
             tenant_id=tenant_id,
             profile_id=profile_id,
         )
-        before = profile.__dict__.copy()
+        before = snapshot(profile)
 
         db.delete(profile)
         db.commit()
@@ -3,10 +3,18 @@
 from typing import List, Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models, schemas
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
+from app.services.audit_diff import diff, snapshot
 from app.services.audit_log_service import AuditLogService
+from app.services.tenant_ownership import TenantOwnershipService
+
+# Keyset pagination sıralaması (yeniden eskiye, son kolon benzersiz)
+REPORT_LIST_ORDER = (models.Report.created_at, models.Report.id)
 
 
 class ReportService:
@@ -16,50 +24,22 @@ class ReportService:
     """
 
     @staticmethod
-    def _ensure_client_in_tenant(
+    def _ensure_references_in_tenant(
             db: Session,
             tenant_id: int,
-            client_id: int,
-    ) -> None:
-        """
-        Belirtilen danışanın, belirtilen tenant'a ait olup olmadığını doğrular.
-        """
-        client = (
-            db.query(models.Client)
-            .filter(
-                models.Client.id == client_id,
-                models.Client.tenant_id == tenant_id,
-            )
-            .first()
-        )
-        if not client:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Client not found for this tenant.",
-            )
-
-    @staticmethod
-    def _ensure_practitioner_in_tenant(
-            db: Session,
-            tenant_id: int,
-            practitioner_id: int,
+            client_id: Optional[int] = None,
+            practitioner_id: Optional[int] = None,
     ) -> None:
         """
-        Belirtilen uygulayıcının (Practitioner), belirtilen tenant'a ait olup olmadığını doğrular.
+        Danışan ve uygulayıcının (Practitioner) tenant'a ait olduğunu tek sorguda doğrular.
+        None verilen id'ler kontrol edilmez.
         """
-        practitioner = (
-            db.query(models.User)
-            .filter(
-                models.User.id == practitioner_id,
-                models.User.tenant_id == tenant_id,
-            )
-            .first()
+        TenantOwnershipService.ensure_in_tenant(
+            db,
+            tenant_id,
+            (models.Client, client_id, "Client not found for this tenant."),
+            (models.User, practitioner_id, "Practitioner not found for this tenant."),
         )
-        if not practitioner:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Practitioner not found for this tenant.",
-            )
 
     @staticmethod
     def _get_report_with_tenant_check(
@@ -97,14 +77,10 @@ class ReportService:
         tenant_id = current_user.tenant_id
 
         # Tenant kontrolü (Client ve Practitioner)
-        ReportService._ensure_client_in_tenant(
+        ReportService._ensure_references_in_tenant(
             db=db,
             tenant_id=tenant_id,
             client_id=data.client_id,
-        )
-        ReportService._ensure_practitioner_in_tenant(
-            db=db,
-            tenant_id=tenant_id,
             practitioner_id=data.practitioner_id,
         )
 
@@ -140,7 +116,9 @@ class ReportService:
             tenant_id: int,
             client_id: Optional[int] = None,
             practitioner_id: Optional[int] = None,
-    ) -> List[models.Report]:
+            cursor: Optional[str] = None,
+            limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.Report]:
         """
         Tenant'a ait raporları listeler.
         İsteğe bağlı olarak client_id ve practitioner_id ile filtreleme yapılabilir.
@@ -153,7 +131,8 @@ class ReportService:
         if practitioner_id is not None:
             q = q.filter(models.Report.practitioner_id == practitioner_id)
 
-        return q.order_by(models.Report.created_at.desc()).all()
+        q = apply_keyset(q, REPORT_LIST_ORDER, cursor, limit, descending=True)
+        return build_page(q.all(), REPORT_LIST_ORDER, limit)
 
     @staticmethod
     def get_report(
@@ -188,23 +167,20 @@ class ReportService:
         )
 
         # İlişkili kayıtların tenant kontrolü
-        ReportService._ensure_client_in_tenant(
+        ReportService._ensure_references_in_tenant(
             db=db,
             tenant_id=tenant_id,
             client_id=data.client_id,
-        )
-        ReportService._ensure_practitioner_in_tenant(
-            db=db,
-            tenant_id=tenant_id,
             practitioner_id=data.practitioner_id,
         )
 
-        before = report.__dict__.copy()
         update_data = data.model_dump()
 
         for field, value in update_data.items():
             setattr(report, field, value)
 
+        changes = diff(report)
+
         db.commit()
         db.refresh(report)
 
@@ -214,10 +190,7 @@ class ReportService:
             entity="report",
             entity_id=report.id,
             action="UPDATE",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return report
@@ -244,25 +217,20 @@ class ReportService:
         new_client_id = update_data.get("client_id", report.client_id)
         new_practitioner_id = update_data.get("practitioner_id", report.practitioner_id)
 
-        if new_client_id != report.client_id:
-            ReportService._ensure_client_in_tenant(
-                db=db,
-                tenant_id=tenant_id,
-                client_id=new_client_id,
-            )
-
-        if new_practitioner_id != report.practitioner_id:
-            ReportService._ensure_practitioner_in_tenant(
-                db=db,
-                tenant_id=tenant_id,
-                practitioner_id=new_practitioner_id,
-            )
-
-        before = report.__dict__.copy()
+        ReportService._ensure_references_in_tenant(
+            db=db,
+            tenant_id=tenant_id,
+            client_id=new_client_id if new_client_id != report.client_id else None,
+            practitioner_id=(
+                new_practitioner_id if new_practitioner_id != report.practitioner_id else None
+            ),
+        )
 
         for field, value in update_data.items():
             setattr(report, field, value)
 
+        changes = diff(report)
+
         db.commit()
         db.refresh(report)
 
@@ -272,10 +240,7 @@ class ReportService:
             entity="report",
             entity_id=report.id,
             action="PATCH",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return report
@@ -295,7 +260,7 @@ class ReportService:
             tenant_id=tenant_id,
             report_id=report_id,
         )
-        before = report.__dict__.copy()
+        before = snapshot(report)
 
         db.delete(report)
         db.commit()
@@ -307,4 +272,58 @@ class ReportService:
             entity_id=report_id,
             action="DELETE",
             changes={"before": before},
-        )
\ No newline at end of file
+        )
+
+
+class AsyncReportService:
+    """
+    ReportService'in okuma işlemleri için AsyncSession kullanan varyantı.
+    """
+
+    @staticmethod
+    async def list_reports(
+            db: AsyncSession,
+            tenant_id: int,
+            client_id: Optional[int] = None,
+            practitioner_id: Optional[int] = None,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.Report]:
+        """
+        Tenant'a ait raporları listeler.
+        İsteğe bağlı olarak client_id ve practitioner_id ile filtreleme yapılabilir.
+        """
+        q = select(models.Report).filter(models.Report.tenant_id == tenant_id)
+
+        if client_id is not None:
+            q = q.filter(models.Report.client_id == client_id)
+
+        if practitioner_id is not None:
+            q = q.filter(models.Report.practitioner_id == practitioner_id)
+
+        q = apply_keyset(q, REPORT_LIST_ORDER, cursor, limit, descending=True)
+        result = await db.execute(q)
+        return build_page(result.scalars().all(), REPORT_LIST_ORDER, limit)
+
+    @staticmethod
+    async def get_report(
+            db: AsyncSession,
+            tenant_id: int,
+            report_id: int,
+    ) -> models.Report:
+        """
+        Tek bir raporu detaylarıyla getirir.
+        """
+        result = await db.execute(
+            select(models.Report).filter(
+                models.Report.id == report_id,
+                models.Report.tenant_id == tenant_id,
+            )
+        )
+        report = result.scalars().first()
+        if not report:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Report not found.",
+            )
+        return report
@@ -5,7 +5,13 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session as DbSession
 
 from app import models, schemas
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
+from app.services.audit_diff import diff, snapshot
 from app.services.audit_log_service import AuditLogService
+from app.services.tenant_ownership import TenantOwnershipService
+
+# Keyset pagination sıralaması (yeniden eskiye, son kolon benzersiz)
+NOTE_LIST_ORDER = (models.SessionNote.created_at, models.SessionNote.id)
 
 
 class SessionNoteService:
@@ -14,44 +20,22 @@ class SessionNoteService:
     """
 
     @staticmethod
-    def _ensure_session_in_tenant(
-            db: DbSession,
-            tenant_id: int,
-            session_id: int,
-    ) -> None:
-        session = (
-            db.query(models.Session)  # ✅ Düzeltildi: Session
-            .filter(
-                models.Session.id == session_id,
-                models.Session.tenant_id == tenant_id,
-            )
-            .first()
-        )
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Session not found for this tenant.",
-            )
-
-    @staticmethod
-    def _ensure_author_in_tenant(
+    def _ensure_references_in_tenant(
             db: DbSession,
             tenant_id: int,
-            author_id: int,
+            session_id: Optional[int] = None,
+            author_id: Optional[int] = None,
     ) -> None:
-        user = (
-            db.query(models.User)
-            .filter(
-                models.User.id == author_id,
-                models.User.tenant_id == tenant_id,
-            )
-            .first()
+        """
+        Seans ve yazarın (user) tenant'a ait olduğunu tek sorguda doğrular.
+        None verilen id'ler kontrol edilmez.
+        """
+        TenantOwnershipService.ensure_in_tenant(
+            db,
+            tenant_id,
+            (models.Session, session_id, "Session not found for this tenant."),
+            (models.User, author_id, "Author (user) not found for this tenant."),
         )
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Author (user) not found for this tenant.",
-            )
 
     @staticmethod
     def _get_note_with_tenant_check(
@@ -85,15 +69,11 @@ class SessionNoteService:
             data: schemas.SessionNoteCreate,
     ) -> models.SessionNote:  # ✅ Düzeltildi
         tenant_id = current_user.tenant_id
-        SessionNoteService._ensure_session_in_tenant(
-            db=db,
-            tenant_id=tenant_id,
-            session_id=data.session_id,
-        )
         author_id = data.author_id or current_user.id
-        SessionNoteService._ensure_author_in_tenant(
+        SessionNoteService._ensure_references_in_tenant(
             db=db,
             tenant_id=tenant_id,
+            session_id=data.session_id,
             author_id=author_id,
         )
 
@@ -125,11 +105,13 @@ class SessionNoteService:
             db: DbSession,
             tenant_id: int,
             session_id: Optional[int] = None,
-    ) -> List[models.SessionNote]:  # ✅ Düzeltildi
+            cursor: Optional[str] = None,
+            limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.SessionNote]:
         q = (
-            db.query(models.SessionNote)  # ✅ Düzeltildi
+            db.query(models.SessionNote)
             .join(
-                models.Session,  # ✅ Düzeltildi
+                models.Session,
                 models.Session.id == models.SessionNote.session_id,
             )
             .filter(models.Session.tenant_id == tenant_id)
@@ -138,7 +120,8 @@ class SessionNoteService:
         if session_id is not None:
             q = q.filter(models.SessionNote.session_id == session_id)
 
-        return q.order_by(models.SessionNote.created_at.desc()).all()
+        q = apply_keyset(q, NOTE_LIST_ORDER, cursor, limit, descending=True)
+        return build_page(q.all(), NOTE_LIST_ORDER, limit)
 
     @staticmethod
     def get_note(
@@ -169,21 +152,13 @@ class SessionNoteService:
         new_session_id = data.session_id
         new_author_id = data.author_id or note.author_id
 
-        if new_session_id is not None and new_session_id != note.session_id:
-            SessionNoteService._ensure_session_in_tenant(
-                db=db,
-                tenant_id=tenant_id,
-                session_id=new_session_id,
-            )
-
-        if new_author_id != note.author_id:
-            SessionNoteService._ensure_author_in_tenant(
-                db=db,
-                tenant_id=tenant_id,
-                author_id=new_author_id,
-            )
+        SessionNoteService._ensure_references_in_tenant(
+            db=db,
+            tenant_id=tenant_id,
+            session_id=new_session_id if new_session_id != note.session_id else None,
+            author_id=new_author_id if new_author_id != note.author_id else None,
+        )
 
-        before = note.__dict__.copy()
         update_data = data.model_dump()
 
         for field, value in update_data.items():
@@ -191,6 +166,8 @@ class SessionNoteService:
                 value = new_author_id
             setattr(note, field, value)
 
+        changes = diff(note)
+
         db.commit()
         db.refresh(note)
 
@@ -200,10 +177,7 @@ class SessionNoteService:
             entity="session_note",
             entity_id=note.id,
             action="UPDATE",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return note
@@ -226,22 +200,18 @@ class SessionNoteService:
         new_session_id = update_data.get("session_id", note.session_id)
         new_author_id = update_data.get("author_id", note.author_id)
 
-        SessionNoteService._ensure_session_in_tenant(
+        SessionNoteService._ensure_references_in_tenant(
             db=db,
             tenant_id=tenant_id,
             session_id=new_session_id,
-        )
-        SessionNoteService._ensure_author_in_tenant(
-            db=db,
-            tenant_id=tenant_id,
             author_id=new_author_id,
         )
 
-        before = note.__dict__.copy()
-
         for field, value in update_data.items():
             setattr(note, field, value)
 
+        changes = diff(note)
+
         db.commit()
         db.refresh(note)
 
@@ -251,10 +221,7 @@ class SessionNoteService:
             entity="session_note",
             entity_id=note.id,
             action="PATCH",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return note
@@ -271,7 +238,7 @@ class SessionNoteService:
             tenant_id=tenant_id,
             note_id=note_id,
         )
-        before = note.__dict__.copy()
+        before = snapshot(note)
 
         db.delete(note)
         db.commit()
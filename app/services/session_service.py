@@ -3,11 +3,19 @@
 from typing import List, Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as DbSession
 # Çakışmayı önlemek için sqlalchemy Session'a alias verdik
 
 from app import models, schemas
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
+from app.services.audit_diff import diff, snapshot
 from app.services.audit_log_service import AuditLogService
+from app.services.tenant_ownership import TenantOwnershipService
+
+# Keyset pagination sıralaması (yeniden eskiye, son kolon benzersiz)
+SESSION_LIST_ORDER = (models.Session.occurred_at, models.Session.id)
 
 
 class SessionService:
@@ -16,62 +24,24 @@ class SessionService:
     """
 
     @staticmethod
-    def _ensure_practitioner_and_client_in_tenant(
+    def _ensure_references_in_tenant(
         db: DbSession,
         tenant_id: int,
         practitioner_id: int,
         client_id: int,
-    ):
-        practitioner = (
-            db.query(models.User)
-            .filter(
-                models.User.id == practitioner_id,
-                models.User.tenant_id == tenant_id,
-            )
-            .first()
-        )
-        if not practitioner:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Practitioner not found for this tenant.",
-            )
-
-        client = (
-            db.query(models.Client)
-            .filter(
-                models.Client.id == client_id,
-                models.Client.tenant_id == tenant_id,
-            )
-            .first()
-        )
-        if not client:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Client not found for this tenant.",
-            )
-
-    @staticmethod
-    def _ensure_appointment_in_tenant_if_provided(
-        db: DbSession,
-        tenant_id: int,
         appointment_id: Optional[int],
     ):
-        if appointment_id is None:
-            return
-
-        appointment = (
-            db.query(models.Appointment)
-            .filter(
-                models.Appointment.id == appointment_id,
-                models.Appointment.tenant_id == tenant_id,
-            )
-            .first()
+        """
+        Practitioner, client ve (verildiyse) appointment'ın tenant'a ait
+        olduğunu tek sorguda doğrular.
+        """
+        TenantOwnershipService.ensure_in_tenant(
+            db,
+            tenant_id,
+            (models.User, practitioner_id, "Practitioner not found for this tenant."),
+            (models.Client, client_id, "Client not found for this tenant."),
+            (models.Appointment, appointment_id, "Appointment not found for this tenant."),
         )
-        if not appointment:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Appointment not found for this tenant.",
-            )
 
     @staticmethod
     def create_session(
@@ -83,15 +53,11 @@ class SessionService:
         practitioner_id = data.practitioner_id or current_user.id
         client_id = data.client_id
 
-        SessionService._ensure_practitioner_and_client_in_tenant(
+        SessionService._ensure_references_in_tenant(
             db=db,
             tenant_id=tenant_id,
             practitioner_id=practitioner_id,
             client_id=client_id,
-        )
-        SessionService._ensure_appointment_in_tenant_if_provided(
-            db=db,
-            tenant_id=tenant_id,
             appointment_id=data.appointment_id,
         )
 
@@ -127,13 +93,12 @@ class SessionService:
     def list_sessions(
         db: DbSession,
         tenant_id: int,
-    ) -> List[models.Session]: # ✅ Düzeltildi
-        return (
-            db.query(models.Session) # ✅ Düzeltildi
-            .filter(models.Session.tenant_id == tenant_id)
-            .order_by(models.Session.occurred_at.desc())
-            .all()
-        )
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.Session]:
+        q = db.query(models.Session).filter(models.Session.tenant_id == tenant_id)
+        q = apply_keyset(q, SESSION_LIST_ORDER, cursor, limit, descending=True)
+        return build_page(q.all(), SESSION_LIST_ORDER, limit)
 
     @staticmethod
     def get_session(
@@ -166,24 +131,21 @@ class SessionService:
     ) -> models.Session: # ✅ Düzeltildi
         session = SessionService.get_session(db, tenant_id, session_id)
 
-        SessionService._ensure_practitioner_and_client_in_tenant(
+        SessionService._ensure_references_in_tenant(
             db=db,
             tenant_id=tenant_id,
             practitioner_id=data.practitioner_id,
             client_id=data.client_id,
-        )
-        SessionService._ensure_appointment_in_tenant_if_provided(
-            db=db,
-            tenant_id=tenant_id,
             appointment_id=data.appointment_id,
         )
 
-        before = session.__dict__.copy()
         update_data = data.model_dump()
 
         for field, value in update_data.items():
             setattr(session, field, value)
 
+        changes = diff(session)
+
         db.commit()
         db.refresh(session)
 
@@ -193,10 +155,7 @@ class SessionService:
             entity="session",
             entity_id=session.id,
             action="UPDATE",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return session
@@ -216,23 +175,19 @@ class SessionService:
         client_id = update_data.get("client_id", session.client_id)
         appointment_id = update_data.get("appointment_id", session.appointment_id)
 
-        SessionService._ensure_practitioner_and_client_in_tenant(
+        SessionService._ensure_references_in_tenant(
             db=db,
             tenant_id=tenant_id,
             practitioner_id=practitioner_id,
             client_id=client_id,
-        )
-        SessionService._ensure_appointment_in_tenant_if_provided(
-            db=db,
-            tenant_id=tenant_id,
             appointment_id=appointment_id,
         )
 
-        before = session.__dict__.copy()
-
         for field, value in update_data.items():
             setattr(session, field, value)
 
+        changes = diff(session)
+
         db.commit()
         db.refresh(session)
 
@@ -242,10 +197,7 @@ class SessionService:
             entity="session",
             entity_id=session.id,
             action="PATCH",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return session
@@ -258,7 +210,7 @@ class SessionService:
         current_user: models.User,
     ) -> None:
         session = SessionService.get_session(db, tenant_id, session_id)
-        before = session.__dict__.copy()
+        before = snapshot(session)
 
         db.delete(session)
         db.commit()
@@ -270,4 +222,42 @@ class SessionService:
             entity_id=session_id,
             action="DELETE",
             changes={"before": before},
-        )
\ No newline at end of file
+        )
+
+
+class AsyncSessionService:
+    """
+    SessionService'in okuma işlemleri için AsyncSession kullanan varyantı.
+    """
+
+    @staticmethod
+    async def list_sessions(
+        db: AsyncSession,
+        tenant_id: int,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.Session]:
+        q = select(models.Session).filter(models.Session.tenant_id == tenant_id)
+        q = apply_keyset(q, SESSION_LIST_ORDER, cursor, limit, descending=True)
+        result = await db.execute(q)
+        return build_page(result.scalars().all(), SESSION_LIST_ORDER, limit)
+
+    @staticmethod
+    async def get_session(
+        db: AsyncSession,
+        tenant_id: int,
+        session_id: int,
+    ) -> models.Session:
+        result = await db.execute(
+            select(models.Session).filter(
+                models.Session.id == session_id,
+                models.Session.tenant_id == tenant_id,
+            )
+        )
+        session = result.scalars().first()
+        if not session:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Session not found.",
+            )
+        return session
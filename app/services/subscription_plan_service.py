@@ -1,14 +1,19 @@
 # app/services/subscription_plan_service.py
 
-from typing import List
+from typing import List, Optional
 
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app import models, schemas
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
+from app.services.audit_diff import diff, snapshot
 from app.services.audit_log_service import AuditLogService
 
+# Keyset pagination sıralaması (fiyata göre artan, son kolon benzersiz)
+PLAN_LIST_ORDER = (models.SubscriptionPlan.monthly_price, models.SubscriptionPlan.id)
+
 
 class SubscriptionPlanService:
     """
@@ -75,15 +80,16 @@ class SubscriptionPlanService:
         return plan
 
     @staticmethod
-    def list_plans(db: Session) -> List[models.SubscriptionPlan]:
+    def list_plans(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.SubscriptionPlan]:
         """
-        Tüm abonelik planlarını fiyata göre artan sırada listeler.
+        Abonelik planlarını fiyata göre artan sırada listeler.
         """
-        return (
-            db.query(models.SubscriptionPlan)
-            .order_by(models.SubscriptionPlan.monthly_price.asc())
-            .all()
-        )
+        q = apply_keyset(db.query(models.SubscriptionPlan), PLAN_LIST_ORDER, cursor, limit)
+        return build_page(q.all(), PLAN_LIST_ORDER, limit)
 
     @staticmethod
     def get_plan(db: Session, plan_id: int) -> models.SubscriptionPlan:
@@ -104,12 +110,13 @@ class SubscriptionPlanService:
         """
         plan = SubscriptionPlanService._get_plan_or_404(db, plan_id)
 
-        before = plan.__dict__.copy()
         update_data = data.model_dump()
 
         for field, value in update_data.items():
             setattr(plan, field, value)
 
+        changes = diff(plan)
+
         try:
             db.commit()
         except IntegrityError:
@@ -127,7 +134,7 @@ class SubscriptionPlanService:
             entity="subscription_plan",
             entity_id=plan.id,
             action="UPDATE",
-            changes={"before": before, "after": update_data},
+            changes=changes,
         )
 
         return plan
@@ -143,13 +150,14 @@ class SubscriptionPlanService:
         Abonelik planını kısmi olarak günceller (PATCH).
         """
         plan = SubscriptionPlanService._get_plan_or_404(db, plan_id)
-        before = plan.__dict__.copy()
 
         update_data = data.model_dump(exclude_unset=True)
 
         for field, value in update_data.items():
             setattr(plan, field, value)
 
+        changes = diff(plan)
+
         try:
             db.commit()
         except IntegrityError:
@@ -167,7 +175,7 @@ class SubscriptionPlanService:
             entity="subscription_plan",
             entity_id=plan.id,
             action="PATCH",
-            changes={"before": before, "after": update_data},
+            changes=changes,
         )
 
         return plan
@@ -183,7 +191,7 @@ class SubscriptionPlanService:
         Dikkat: Bu plana bağlı aktif abonelikler varsa veritabanı kısıtlaması nedeniyle hata alabilirsiniz.
         """
         plan = SubscriptionPlanService._get_plan_or_404(db, plan_id)
-        before = plan.__dict__.copy()
+        before = snapshot(plan)
 
         db.delete(plan)
         db.commit()
@@ -1,13 +1,18 @@
 # app/services/subscription_service.py
 
-from typing import List
+from typing import List, Optional
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from app import models, schemas
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
+from app.services.audit_diff import diff, snapshot
 from app.services.audit_log_service import AuditLogService
 
+# Keyset pagination sıralaması (yeniden eskiye, son kolon benzersiz)
+SUBSCRIPTION_LIST_ORDER = (models.Subscription.starts_at, models.Subscription.id)
+
 
 class SubscriptionService:
     """
@@ -100,16 +105,15 @@ class SubscriptionService:
     def list_subscriptions(
         db: Session,
         tenant_id: int,
-    ) -> List[models.Subscription]:
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.Subscription]:
         """
-        Tenant'a ait tüm abonelik geçmişini listeler.
+        Tenant'a ait abonelik geçmişini sayfa sayfa listeler.
         """
-        return (
-            db.query(models.Subscription)
-            .filter(models.Subscription.tenant_id == tenant_id)
-            .order_by(models.Subscription.starts_at.desc())
-            .all()
-        )
+        q = db.query(models.Subscription).filter(models.Subscription.tenant_id == tenant_id)
+        q = apply_keyset(q, SUBSCRIPTION_LIST_ORDER, cursor, limit, descending=True)
+        return build_page(q.all(), SUBSCRIPTION_LIST_ORDER, limit)
 
     @staticmethod
     def get_subscription(
@@ -148,12 +152,13 @@ class SubscriptionService:
         if data.plan_id != sub.plan_id:
             SubscriptionService._ensure_plan_exists(db=db, plan_id=data.plan_id)
 
-        before = sub.__dict__.copy()
         update_data = data.model_dump()
 
         for field, value in update_data.items():
             setattr(sub, field, value)
 
+        changes = diff(sub)
+
         db.commit()
         db.refresh(sub)
 
@@ -163,10 +168,7 @@ class SubscriptionService:
             entity="subscription",
             entity_id=sub.id,
             action="UPDATE",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return sub
@@ -189,8 +191,6 @@ class SubscriptionService:
         )
         update_data = data.model_dump(exclude_unset=True)
 
-        before = sub.__dict__.copy()
-
         if "plan_id" in update_data:
             SubscriptionService._ensure_plan_exists(
                 db=db, plan_id=update_data["plan_id"]
@@ -199,6 +199,8 @@ class SubscriptionService:
         for field, value in update_data.items():
             setattr(sub, field, value)
 
+        changes = diff(sub)
+
         db.commit()
         db.refresh(sub)
 
@@ -208,10 +210,7 @@ class SubscriptionService:
             entity="subscription",
             entity_id=sub.id,
             action="PATCH",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return sub
@@ -231,7 +230,7 @@ class SubscriptionService:
             tenant_id=tenant_id,
             subscription_id=subscription_id,
         )
-        before = sub.__dict__.copy()
+        before = snapshot(sub)
 
         db.delete(sub)
         db.commit()
@@ -0,0 +1,68 @@
+# app/services/tenant_ownership.py
+
+from typing import Optional, Tuple, Type
+
+from fastapi import HTTPException, status
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.database import Base
+
+# Doğrulanmış (tenant_id, tablo, id) üçlüleri db.info altında bu anahtarla tutulur
+_CACHE_KEY = "tenant_ownership"
+
+# (model, id, hata mesajı); id None ise kontrol atlanır
+OwnershipCheck = Tuple[Type[Base], Optional[int], str]
+
+
+class TenantOwnershipService:
+    """
+    Referans verilen kayıtların (user, client, session, appointment...) tenant'a
+    ait olup olmadığını doğrular.
+
+    - Bir çağrıdaki tüm id'ler tek bir UNION ALL sorgusuyla kontrol edilir
+    - Doğrulanan id'ler DB session'ında (istek boyunca) cache'lenir; aynı
+      istekte tekrar kontrol edilen id'ler için sorgu atılmaz
+    """
+
+    @staticmethod
+    def ensure_in_tenant(db: Session, tenant_id: int, *checks: OwnershipCheck) -> None:
+        """
+        Kontrolleri verilen sırayla değerlendirir; tenant'a ait olmayan ilk
+        kayıt için 400 döner.
+
+        Örnek:
+            TenantOwnershipService.ensure_in_tenant(
+                db, tenant_id,
+                (models.User, practitioner_id, "Practitioner not found for this tenant."),
+                (models.Client, client_id, "Client not found for this tenant."),
+            )
+        """
+        checks = [c for c in checks if c[1] is not None]
+        if not checks:
+            return
+
+        verified = db.info.setdefault(_CACHE_KEY, set())
+
+        pending = {}
+        for model, object_id, _ in checks:
+            key = (tenant_id, model.__tablename__, object_id)
+            if key not in verified:
+                pending.setdefault(model, set()).add(object_id)
+
+        if pending:
+            selects = [
+                select(literal(model.__tablename__).label("kind"), model.id.label("id"))
+                .where(model.tenant_id == tenant_id, model.id.in_(ids))
+                for model, ids in pending.items()
+            ]
+            stmt = selects[0] if len(selects) == 1 else union_all(*selects)
+            for kind, object_id in db.execute(stmt):
+                verified.add((tenant_id, kind, object_id))
+
+        for model, object_id, detail in checks:
+            if (tenant_id, model.__tablename__, object_id) not in verified:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=detail,
+                )
@@ -6,9 +6,14 @@ from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
 from app import models, schemas
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
 from app.core.utils import slugify
+from app.services.audit_diff import diff, snapshot
 from app.services.audit_log_service import AuditLogService
 
+# Keyset pagination sıralaması (yeniden eskiye, son kolon benzersiz)
+TENANT_LIST_ORDER = (models.Tenant.created_at, models.Tenant.id)
+
 
 class TenantService:
     """
@@ -75,15 +80,16 @@ class TenantService:
         return tenant
 
     @staticmethod
-    def list_tenants(db: Session) -> List[models.Tenant]:
+    def list_tenants(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.Tenant]:
         """
-        Sistemdeki tüm tenant'ları listeler (En yeniden eskiye).
+        Sistemdeki tenant'ları listeler (En yeniden eskiye).
         """
-        return (
-            db.query(models.Tenant)
-            .order_by(models.Tenant.created_at.desc())
-            .all()
-        )
+        q = apply_keyset(db.query(models.Tenant), TENANT_LIST_ORDER, cursor, limit, descending=True)
+        return build_page(q.all(), TENANT_LIST_ORDER, limit)
 
     @staticmethod
     def get_tenant(db: Session, tenant_id: int) -> models.Tenant:
@@ -104,8 +110,6 @@ class TenantService:
         """
         tenant = TenantService._get_tenant_or_404(db, tenant_id)
 
-        before = tenant.__dict__.copy()
-
         slug = data.slug or tenant.slug or slugify(data.name)
 
         tenant.name = data.name
@@ -116,6 +120,8 @@ class TenantService:
             data.is_active if data.is_active is not None else tenant.is_active
         )
 
+        changes = diff(tenant)
+
         try:
             db.commit()
         except IntegrityError:
@@ -133,10 +139,7 @@ class TenantService:
             entity="tenant",
             entity_id=tenant.id,
             action="UPDATE",
-            changes={
-                "before": before,
-                "after": data.model_dump(),
-            },
+            changes=changes,
         )
 
         return tenant
@@ -154,8 +157,6 @@ class TenantService:
         tenant = TenantService._get_tenant_or_404(db, tenant_id)
         update_data = data.model_dump(exclude_unset=True)
 
-        before = tenant.__dict__.copy()
-
         # İsim değiştiyse ve slug manuel verilmediyse, slug'ı güncelle
         if "name" in update_data and "slug" not in update_data:
             update_data["slug"] = slugify(update_data["name"])
@@ -163,6 +164,8 @@ class TenantService:
         for field, value in update_data.items():
             setattr(tenant, field, value)
 
+        changes = diff(tenant)
+
         try:
             db.commit()
         except IntegrityError:
@@ -180,10 +183,7 @@ class TenantService:
             entity="tenant",
             entity_id=tenant.id,
             action="PATCH",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return tenant
@@ -198,7 +198,7 @@ class TenantService:
         Tenant'ı siler.
         """
         tenant = TenantService._get_tenant_or_404(db, tenant_id)
-        before = tenant.__dict__.copy()
+        before = snapshot(tenant)
 
         db.delete(tenant)
         db.commit()
@@ -0,0 +1,202 @@
+# app/services/token_revocation_service.py
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app import models
+from app.core.config import settings
+from app.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """
+    İptal edilmiş token (jti) ve kullanıcı ID'lerinin bellekteki kopyası.
+
+    - DB'den periyodik olarak tamamen yenilenir (replace)
+    - Bu süreçte yapılan iptaller (logout, pasifleştirme) anında eklenir;
+      yenileme sırasında kaybolmamaları için başlangıçtan sonraki eklemeler korunur
+    - Pasif kullanıcıların tüm token'ları, iptal edilen (silinen, rolü / tenant'ı
+      değişen) kullanıcıların ise iptal anından önce verilmiş token'ları geçersizdir
+    """
+
+    def __init__(self):
+        self._jtis = frozenset()
+        self._user_ids = frozenset()
+        # user_id -> epoch saniye; bu andan önce verilmiş (iat) token'lar geçersiz
+        self._issued_before = {}
+        # (monotonic zaman, tür, değer) — son yenilemeden bu yana yerel eklemeler
+        self._recent = []
+        self._lock = threading.Lock()
+        self.refreshed_at: Optional[datetime] = None
+
+    def is_token_revoked(self, jti: Optional[str]) -> bool:
+        return jti is not None and jti in self._jtis
+
+    def is_user_revoked(self, user_id: int, issued_at: Optional[float] = None) -> bool:
+        """
+        issued_at verilmezse (iat'siz token, token'sız kontrol) kullanıcı adına
+        herhangi bir iptal olması yeterlidir.
+        """
+        if user_id in self._user_ids:
+            return True
+        cutoff = self._issued_before.get(user_id)
+        return cutoff is not None and (issued_at is None or issued_at < cutoff)
+
+    def add_token(self, jti: str) -> None:
+        with self._lock:
+            self._jtis = self._jtis | {jti}
+            self._recent.append((time.monotonic(), "jti", jti))
+
+    def add_user(self, user_id: int) -> None:
+        with self._lock:
+            self._user_ids = self._user_ids | {user_id}
+            self._recent.append((time.monotonic(), "user", user_id))
+
+    def add_user_cutoff(self, user_id: int, cutoff: float) -> None:
+        with self._lock:
+            self._issued_before = _merge_cutoffs(self._issued_before, [(user_id, cutoff)])
+            self._recent.append((time.monotonic(), "cutoff", (user_id, cutoff)))
+
+    def discard_user(self, user_id: int) -> None:
+        with self._lock:
+            self._user_ids = self._user_ids - {user_id}
+            self._recent = [r for r in self._recent if r[1:] != ("user", user_id)]
+
+    def replace(
+        self,
+        jtis: Iterable[str],
+        user_ids: Iterable[int],
+        started_at: float,
+        user_cutoffs: Iterable[Tuple[int, float]] = (),
+    ) -> None:
+        """
+        DB'den okunan listeyle değiştirir; okuma başladıktan sonra yapılan
+        yerel eklemeler korunur.
+        """
+        jtis, user_ids = set(jtis), set(user_ids)
+        with self._lock:
+            self._recent = [r for r in self._recent if r[0] >= started_at]
+            cutoffs = list(user_cutoffs)
+            for _, kind, value in self._recent:
+                if kind == "cutoff":
+                    cutoffs.append(value)
+                else:
+                    (jtis if kind == "jti" else user_ids).add(value)
+            self._jtis = frozenset(jtis)
+            self._user_ids = frozenset(user_ids)
+            self._issued_before = _merge_cutoffs({}, cutoffs)
+            self.refreshed_at = datetime.utcnow()
+
+    def stats(self) -> dict:
+        return {
+            "revoked_tokens": len(self._jtis),
+            "revoked_users": len(self._user_ids | self._issued_before.keys()),
+            "refreshed_at": self.refreshed_at,
+        }
+
+
+def _merge_cutoffs(current: dict, cutoffs: Iterable[Tuple[int, float]]) -> dict:
+    """
+    Kullanıcı başına en geç iptal anını tutan yeni bir sözlük döner.
+    """
+    merged = dict(current)
+    for user_id, cutoff in cutoffs:
+        merged[user_id] = max(cutoff, merged.get(user_id, cutoff))
+    return merged
+
+
+def _epoch(value: datetime) -> float:
+    # DB'deki zamanlar naive UTC
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+revocation_list = RevocationList()
+
+
+class TokenRevocationService:
+
+    @staticmethod
+    def revoke_token(
+        db: Session,
+        jti: str,
+        expires_at: datetime,
+    ) -> None:
+        """
+        Tek bir token'ı (logout) süresi dolana kadar geçersiz kılar.
+        """
+        db.add(models.RevokedToken(jti=jti, expires_at=expires_at))
+        db.commit()
+        revocation_list.add_token(jti)
+
+    @staticmethod
+    def revoke_user(db: Session, user_id: int) -> None:
+        """
+        Kullanıcının (silinen, rolü / tenant'ı değişen) o ana kadar verilmiş tüm
+        token'larını geçersiz kılar; sonra alınan token'lar geçerlidir.
+        Kayıt, o ana kadar verilmiş en uzun ömürlü token'ın süresi kadar tutulur.
+        """
+        now = datetime.utcnow()
+        expires_at = now + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+        db.add(models.RevokedToken(jti=None, user_id=user_id, expires_at=expires_at, created_at=now))
+        db.commit()
+        revocation_list.add_user_cutoff(user_id, _epoch(now))
+
+    @staticmethod
+    def refresh(db: Session) -> None:
+        """
+        İptal listesini DB'den yeniden yükler:
+        - Süresi dolmamış revoked_tokens kayıtları (jti / kullanıcı)
+        - Pasif (is_active=False) kullanıcılar
+        Süresi dolmuş kayıtlar bu sırada temizlenir.
+        """
+        started_at = time.monotonic()
+        now = datetime.utcnow()
+
+        db.query(models.RevokedToken).filter(
+            models.RevokedToken.expires_at <= now
+        ).delete(synchronize_session=False)
+        db.commit()
+
+        rows = db.query(
+            models.RevokedToken.jti, models.RevokedToken.user_id, models.RevokedToken.created_at,
+        ).all()
+        inactive = db.query(models.User.id).filter(models.User.is_active.is_(False)).all()
+
+        revocation_list.replace(
+            jtis=(jti for jti, _, _ in rows if jti is not None),
+            user_ids=[user_id for (user_id,) in inactive],
+            started_at=started_at,
+            user_cutoffs=[
+                (user_id, _epoch(created_at)) for _, user_id, created_at in rows if user_id is not None
+            ],
+        )
+
+
+def refresh_revocation_list() -> None:
+    db = SessionLocal()
+    try:
+        TokenRevocationService.refresh(db)
+    finally:
+        db.close()
+
+
+async def run_revocation_refresher(interval_seconds: float) -> None:
+    """
+    Lifespan içinde arka plan görevi olarak çalışır; iptal listesini
+    interval_seconds aralıkla (threadpool'da) yeniler.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(refresh_revocation_list)
+        except Exception:
+            logger.exception("Token revocation list refresh failed")
@@ -1,14 +1,22 @@
 # app/services/user_service.py
 
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
 from app import models, schemas
+from app.core.pagination import DEFAULT_PAGE_LIMIT, Page, apply_keyset, build_page
+from app.services.audit_diff import diff, snapshot
 from app.services.audit_log_service import AuditLogService
-from app.core.security import get_password_hash
+from app.services.audit_log_hooks import suppress_auto_audit
+from app.services.auth_service import invalidate_cached_user
+from app.services.token_revocation_service import TokenRevocationService, revocation_list
+from app.core.security import get_password_hash, get_password_hashes
+
+# Keyset pagination sıralaması
+USER_LIST_ORDER = (models.User.id,)
 
 
 class UserService:
@@ -39,11 +47,63 @@ class UserService:
         return user
 
     @staticmethod
-    def list_users(db: Session, tenant_id: int) -> List[models.User]:
+    def _check_update_permission(
+        user: models.User,
+        current_user: models.User,
+        new_role: Optional[str],
+    ) -> None:
+        """
+        Kullanıcı kendi bilgilerini güncelleyebilir; başka kullanıcıları ve
+        rolleri sadece OWNER değiştirebilir. Kimse kendi rolünü değiştiremez
+        (son OWNER'ın kendini düşürmesi / rol yükseltme).
+        """
+        is_owner = current_user.role == schemas.UserRole.OWNER.value
+        if user.id != current_user.id and not is_owner:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only the tenant owner can update other users.",
+            )
+        if new_role is None or new_role == user.role:
+            return
+        if user.id == current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You cannot change your own role.",
+            )
+        if not is_owner:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only the tenant owner can change roles.",
+            )
+
+    @staticmethod
+    def _sync_revocation(db: Session, user: models.User, changes: Optional[dict]) -> None:
         """
-        Tenant'a ait tüm kullanıcıları listeler.
+        Pasifleştirilen kullanıcının token'larını bu süreçte hemen geçersiz kılar
+        (diğer süreçler iptal listesini periyodik yenilemeyle görür).
+        Rolü / tenant'ı değişen kullanıcının önceki token'ları da iptal edilir;
+        claims-only okumalar eski rol / tenant claim'iyle devam edemez.
         """
-        return db.query(models.User).filter(models.User.tenant_id == tenant_id).all()
+        if user.is_active:
+            revocation_list.discard_user(user.id)
+        else:
+            revocation_list.add_user(user.id)
+        if changes and ("role" in changes or "tenant_id" in changes):
+            TokenRevocationService.revoke_user(db, user.id)
+
+    @staticmethod
+    def list_users(
+        db: Session,
+        tenant_id: int,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_LIMIT,
+    ) -> Page[models.User]:
+        """
+        Tenant'a ait kullanıcıları sayfa sayfa listeler.
+        """
+        q = db.query(models.User).filter(models.User.tenant_id == tenant_id)
+        q = apply_keyset(q, USER_LIST_ORDER, cursor, limit)
+        return build_page(q.all(), USER_LIST_ORDER, limit)
 
     @staticmethod
     def get_user(db: Session, tenant_id: int, user_id: int) -> models.User:
@@ -71,7 +131,7 @@ class UserService:
             email=data.email,
             password_hash=password_hash,
             full_name=data.full_name,
-            role=data.role,
+            role=data.role.value,
             is_active=data.is_active,
         )
 
@@ -97,13 +157,106 @@ class UserService:
             changes={
                 "email": data.email,
                 "full_name": data.full_name,
-                "role": data.role,
+                "role": data.role.value,
                 "is_active": data.is_active,
             },
         )
 
         return user
 
+    @staticmethod
+    def bulk_create_users(
+        db: Session,
+        current_user: models.User,
+        data: schemas.UserBulkCreate,
+    ) -> schemas.UserBulkCreateResult:
+        """
+        Birden çok kullanıcıyı tek seferde oluşturur (klinik onboarding).
+
+        - Tüm satırlar önce doğrulanır (istek içinde tekrar eden / sistemde
+          zaten kayıtlı email); hatalı satırlar atlanır ve errors'ta döner
+        - Geçerli satırların şifreleri bcrypt havuzunda paralel hashlenir
+        - Kullanıcılar ve tek bir BULK_CREATE audit kaydı tek transaction'da yazılır
+        """
+        tenant_id = current_user.tenant_id
+        rows = data.users
+
+        # Email sistem genelinde benzersiz; mevcut olanlar tek sorguda bulunur
+        existing = {
+            email
+            for (email,) in db.query(models.User.email).filter(
+                models.User.email.in_({row.email for row in rows})
+            )
+        }
+
+        errors = []
+        valid = []
+        seen = set()
+        for index, row in enumerate(rows):
+            if row.email in existing:
+                detail = "User with this email already exists."
+            elif row.email in seen:
+                detail = "Duplicate email in request."
+            else:
+                seen.add(row.email)
+                valid.append(row)
+                continue
+            errors.append(
+                schemas.UserBulkRowError(index=index, email=row.email, detail=detail)
+            )
+
+        if not valid:
+            return schemas.UserBulkCreateResult(created=[], errors=errors)
+
+        password_hashes = get_password_hashes(row.password for row in valid)
+
+        users = [
+            models.User(
+                tenant_id=tenant_id,
+                email=row.email,
+                password_hash=password_hash,
+                full_name=row.full_name,
+                role=row.role.value,
+                is_active=row.is_active,
+            )
+            for row, password_hash in zip(valid, password_hashes)
+        ]
+        db.add_all(users)
+
+        try:
+            # Tek özet kaydı yazılır; satır başına otomatik audit kaydı yapılmaz
+            with suppress_auto_audit(db):
+                # ID'ler audit kaydı için flush ile alınır (commit değil)
+                db.flush()
+                # Yanıt commit'ten önce kurulur: commit nesneleri expire eder ve
+                # her kullanıcı için ayrı SELECT atılırdı
+                created = [schemas.UserOut.model_validate(u) for u in users]
+                AuditLogService.log(
+                    db=db,
+                    user=current_user,
+                    entity="user",
+                    entity_id=None,
+                    action="BULK_CREATE",
+                    changes={
+                        "count": len(users),
+                        "users": [
+                            {"id": u.id, "email": u.email, "role": u.role}
+                            for u in users
+                        ],
+                    },
+                    commit=False,
+                )
+                db.commit()
+        except IntegrityError:
+            # Doğrulamadan sonra aynı email'le eşzamanlı kayıt yapılmış olabilir
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Some users were created concurrently; please retry.",
+            )
+
+        return schemas.UserBulkCreateResult(created=created, errors=errors)
+
     @staticmethod
     def update_user(
         db: Session,
@@ -116,18 +269,19 @@ class UserService:
         Kullanıcı bilgilerini günceller (Tam güncelleme).
         """
         user = UserService._get_user_in_tenant_or_404(db, tenant_id, user_id)
-
-        before = user.__dict__.copy()
+        UserService._check_update_permission(user, current_user, data.role.value)
 
         user.full_name = data.full_name
         user.email = data.email
-        user.role = data.role
+        user.role = data.role.value
         user.is_active = data.is_active
 
         # Eğer yeni şifre gönderildiyse hashleyerek güncelle
         if data.password:
             user.password_hash = get_password_hash(data.password)
 
+        changes = diff(user)
+
         try:
             db.commit()
         except IntegrityError:
@@ -137,7 +291,10 @@ class UserService:
                 detail="User with this email already exists in this tenant.",
             )
 
+        # Auth cache'teki eski rol / aktiflik bilgisini düşür
+        invalidate_cached_user(user.id)
         db.refresh(user)
+        UserService._sync_revocation(db, user, changes)
 
         AuditLogService.log(
             db=db,
@@ -145,10 +302,7 @@ class UserService:
             entity="user",
             entity_id=user.id,
             action="UPDATE",
-            changes={
-                "before": before,
-                "after": data.model_dump(exclude={"password"}),
-            },
+            changes=changes,
         )
 
         return user
@@ -165,9 +319,8 @@ class UserService:
         Kullanıcı bilgilerini kısmi günceller.
         """
         user = UserService._get_user_in_tenant_or_404(db, tenant_id, user_id)
-        update_data = data.model_dump(exclude_unset=True)
-
-        before = user.__dict__.copy()
+        update_data = data.model_dump(exclude_unset=True, mode="json")
+        UserService._check_update_permission(user, current_user, update_data.get("role"))
 
         for field, value in update_data.items():
             if field == "password" and value:
@@ -175,6 +328,8 @@ class UserService:
             else:
                 setattr(user, field, value)
 
+        changes = diff(user)
+
         try:
             db.commit()
         except IntegrityError:
@@ -184,7 +339,10 @@ class UserService:
                 detail="User with this email already exists in this tenant.",
             )
 
+        # Auth cache'teki eski rol / aktiflik bilgisini düşür
+        invalidate_cached_user(user.id)
         db.refresh(user)
+        UserService._sync_revocation(db, user, changes)
 
         AuditLogService.log(
             db=db,
@@ -192,10 +350,7 @@ class UserService:
             entity="user",
             entity_id=user.id,
             action="PATCH",
-            changes={
-                "before": before,
-                "after": update_data,
-            },
+            changes=changes,
         )
 
         return user
@@ -219,10 +374,13 @@ class UserService:
                 detail="You cannot delete your own account.",
             )
 
-        before = user.__dict__.copy()
+        before = snapshot(user)
 
         db.delete(user)
         db.commit()
+        invalidate_cached_user(user_id)
+        # Claims-only auth'ta silinen kullanıcının token'ları da geçersiz olmalı
+        TokenRevocationService.revoke_user(db, user_id)
 
         AuditLogService.log(
             db=db,
@@ -0,0 +1,423 @@
+# app/worker.py
+"""
+AI işlerini (AIJob) çalıştıran worker süreci:
+
+    python -m app.worker --concurrency 8
+
+Birden fazla süreç / makinede aynı anda çalıştırılabilir; işler
+FOR UPDATE SKIP LOCKED ile paylaştırılır (bkz. AiJobQueueService).
+Şemayı değiştirmez; önce scripts.migrate_schema çalıştırılmış olmalıdır.
+"""
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.services.ai_job_events import job_event, publish_job_events
+from app.services.ai_job_queue_service import PENDING, RUNNING, AiJobInputError, AiJobQueueService
+from app.services.ai_provider import ModelProvider, ModelRequest, get_model_provider
+from app.services.ai_summary_cache_service import AiSummaryCacheService, cache_key
+
+logger = logging.getLogger(__name__)
+
+
+class AiJobWorker:
+    """
+    Tek süreçteki worker havuzu.
+
+    - Kiralama döngüsü boş slot kadar işi tek sorguda alır ve thread havuzuna verir;
+      batch_size > 1 ise her slot aynı model / prompt sürümündeki işlerden oluşan
+      bir batch'i tek model çağrısıyla işler
+    - Heartbeat döngüsü eldeki işlerin kirasını uzatır ve kirası dolmuş
+      (başka worker'ı çökmüş) işleri tekrar kuyruğa alır
+    - Girdisi AI özet cache'inde bulunan işler model çağrılmadan tamamlanır;
+      cache eviction'ı da heartbeat döngüsünde aralıklarla çalışır
+    - stop() yeni iş almayı bırakır, eldeki işlerin bitmesini bekler
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        provider: Optional[ModelProvider] = None,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        heartbeat_interval: Optional[float] = None,
+        worker_id: Optional[str] = None,
+        use_cache: Optional[bool] = None,
+        batch_size: Optional[int] = None,
+        batch_max_wait: Optional[float] = None,
+    ):
+        self.session_factory = session_factory
+        self.provider = provider or get_model_provider()
+        self.concurrency = concurrency or settings.AI_WORKER_CONCURRENCY
+        self.poll_interval = (
+            settings.AI_WORKER_POLL_INTERVAL_MS / 1000 if poll_interval is None else poll_interval
+        )
+        self.heartbeat_interval = heartbeat_interval or settings.AI_JOB_HEARTBEAT_SECONDS
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.use_cache = settings.AI_SUMMARY_CACHE_ENABLED if use_cache is None else use_cache
+        self.batch_size = batch_size or settings.AI_BATCH_MAX_SIZE
+        self.batch_max_wait = (
+            settings.AI_BATCH_MAX_WAIT_MS / 1000 if batch_max_wait is None else batch_max_wait
+        )
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix="ai-worker",
+        )
+        self._slots = threading.Semaphore(self.concurrency)
+        self._stop = threading.Event()
+        self._idle = threading.Event()
+        self._lock = threading.Lock()
+        self._in_flight = set()
+        self._batch_filling = False
+        self._threads = []
+
+        self.claimed = 0
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.lost_leases = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evicted = 0
+        self.batches = 0
+        self.batched_jobs = 0
+
+    # --- Yaşam döngüsü ---
+    def start(self) -> None:
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._claim_loop, name="ai-worker-claim", daemon=True),
+            threading.Thread(target=self._heartbeat_loop, name="ai-worker-heartbeat", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info("AI worker %s started (concurrency=%d)", self.worker_id, self.concurrency)
+
+    def stop(self) -> None:
+        """
+        Yeni iş almayı durdurur ve eldeki işlerin bitmesini bekler.
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._executor.shutdown(wait=True)
+        logger.info("AI worker %s stopped", self.worker_id)
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Kuyrukta iş kalmayıp eldeki işler bitene kadar bekler (benchmark / test için).
+        """
+        return self._idle.wait(timeout)
+
+    # --- Döngüler ---
+    def _claim_loop(self) -> None:
+        while not self._stop.is_set():
+            # En az bir slot boşalana kadar bekle, sonra boş olanların hepsini doldur
+            if not self._slots.acquire(timeout=self.poll_interval):
+                continue
+            free = 1
+            while free < self.concurrency and self._slots.acquire(blocking=False):
+                free += 1
+
+            try:
+                units = self._claim(free)
+            except Exception:
+                logger.exception("AI job claim failed")
+                units = []
+
+            for _ in range(free - len(units)):
+                self._slots.release()
+
+            if not units:
+                with self._lock:
+                    if not self._in_flight and not self._batch_filling:
+                        self._idle.set()
+                self._stop.wait(self.poll_interval)
+                continue
+
+            self._idle.clear()
+            for jobs in units:
+                self._executor.submit(self._run_unit, jobs)
+
+    def _claim(self, slots: int) -> list:
+        """
+        Her boş slot için bir iş listesi döner: batch kapalıyken tek işlik listeler,
+        açıkken aynı model / prompt sürümündeki en fazla batch_size işten oluşan batch'ler.
+        """
+        db = self.session_factory()
+        self._batch_filling = False
+        try:
+            if self.batch_size <= 1:
+                units = [[job] for job in AiJobQueueService.claim_jobs(db, self.worker_id, slots)]
+            else:
+                units = []
+                for _ in range(slots):
+                    batch = AiJobQueueService.claim_batch(
+                        db, self.worker_id, self.batch_size, self.batch_max_wait,
+                    )
+                    if not batch:
+                        # [] => bekleyen işler var ama hiçbir grubun batch'i henüz dolmadı
+                        self._batch_filling = batch is not None and not units
+                        break
+                    units.append(batch)
+        finally:
+            db.close()
+        with self._lock:
+            for jobs in units:
+                self._in_flight.update(job.id for job in jobs)
+                self.claimed += len(jobs)
+        return units
+
+    def _heartbeat_loop(self) -> None:
+        evict_interval = settings.AI_SUMMARY_CACHE_EVICT_INTERVAL_SECONDS
+        next_evict = time.monotonic()
+        while not self._stop.wait(self.heartbeat_interval):
+            db = self.session_factory()
+            try:
+                with self._lock:
+                    job_ids = set(self._in_flight)
+                owned = AiJobQueueService.heartbeat(db, self.worker_id, job_ids)
+                if job_ids - owned:
+                    logger.warning("Lost lease on AI jobs %s", sorted(job_ids - owned))
+                requeued, failed = AiJobQueueService.requeue_expired(db)
+                if requeued or failed:
+                    logger.warning("Expired AI job leases: %d requeued, %d failed", requeued, failed)
+                if self.use_cache and evict_interval > 0 and time.monotonic() >= next_evict:
+                    next_evict = time.monotonic() + evict_interval
+                    expired, trimmed = AiSummaryCacheService.evict(db)
+                    with self._lock:
+                        self.cache_evicted += expired + trimmed
+            except Exception:
+                logger.exception("AI job heartbeat failed")
+            finally:
+                db.close()
+
+    # --- İş ---
+    def _run_unit(self, jobs) -> None:
+        db = self.session_factory()
+        try:
+            if self.batch_size <= 1:
+                self._process(db, jobs[0])
+            else:
+                self._process_batch(db, jobs)
+        except Exception:
+            logger.exception("AI jobs %s crashed", [job.id for job in jobs])
+        finally:
+            db.close()
+            with self._lock:
+                self._in_flight.difference_update(job.id for job in jobs)
+            self._slots.release()
+
+    def _load(self, db, job) -> tuple:
+        """
+        İşin girdisini yükler ve cache'e bakar:
+        (içerik, session_id, source_note_id, cache anahtarı, cache'teki çıktı ya da None).
+        """
+        content, session_id, source_note_id = AiJobQueueService.load_input(db, job)
+        key = cached = None
+        if self.use_cache:
+            key = cache_key(job.type, content, job.model_name, job.prompt_version)
+            cached = AiSummaryCacheService.lookup(db, job.tenant_id, key)
+        return content, session_id, source_note_id, key, cached
+
+    @staticmethod
+    def _request(job, content: str) -> ModelRequest:
+        return ModelRequest(
+            job_type=job.type,
+            content=content,
+            model_name=job.model_name,
+            prompt_version=job.prompt_version,
+        )
+
+    def _process(self, db, job) -> None:
+        try:
+            content, session_id, source_note_id, key, output = self._load(db, job)
+            cache_hit = None if key is None else output is not None
+            # Okuma transaction'ı model çağrısı boyunca açık kalmasın
+            db.rollback()
+            if output is None:
+                request = self._request(job, content)
+                if settings.AI_JOB_EVENTS_ENABLED:
+                    output = self.provider.generate_streaming(request, self._partial_publisher(db, job))
+                else:
+                    output = self.provider.generate(request)
+        except AiJobInputError as exc:
+            db.rollback()
+            self._record_failure(db, job, str(exc), retry=False)
+            return
+        except Exception as exc:
+            db.rollback()
+            self._record_error(db, job, exc)
+            return
+
+        self._finish(db, job, output, session_id, source_note_id, key, cache_hit)
+
+    @staticmethod
+    def _partial_publisher(db, job):
+        """
+        Model çıktısı üretilirken o ana kadarki metni "partial" olayı olarak yayınlar;
+        en fazla AI_JOB_EVENTS_PARTIAL_INTERVAL_MS'de bir (aradakiler atlanır,
+        her olay o ana kadarki metnin tamamını taşır).
+        """
+        interval = settings.AI_JOB_EVENTS_PARTIAL_INTERVAL_MS / 1000
+        last_sent = [float("-inf")]
+
+        def on_partial(text: str) -> None:
+            now = time.monotonic()
+            if now - last_sent[0] < interval:
+                return
+            last_sent[0] = now
+            try:
+                publish_job_events(db, job_event(job, RUNNING, kind="partial", partial=text))
+                db.commit()
+            except Exception:
+                db.rollback()
+                logger.warning("Could not publish partial output for AI job %s", job.id, exc_info=True)
+
+        return on_partial
+
+    def _process_batch(self, db, jobs) -> None:
+        """
+        Cache'te olmayan işleri tek generate_batch çağrısıyla işler ve çıktıları
+        her işin kendi AISummary kaydına dağıtır. Girdisi okunamayan iş batch'ten
+        düşer; model çağrısı hata verirse batch'teki tüm işler tekrar denenir.
+        """
+        pending = []
+        for job in jobs:
+            try:
+                content, session_id, source_note_id, key, output = self._load(db, job)
+            except AiJobInputError as exc:
+                db.rollback()
+                self._record_failure(db, job, str(exc), retry=False)
+                continue
+            except Exception as exc:
+                db.rollback()
+                self._record_error(db, job, exc)
+                continue
+            if output is not None:
+                self._finish(db, job, output, session_id, source_note_id, key, cache_hit=True)
+            else:
+                pending.append((job, content, session_id, source_note_id, key))
+        # Okuma transaction'ı model çağrısı boyunca açık kalmasın
+        db.rollback()
+        if not pending:
+            return
+
+        try:
+            outputs = self.provider.generate_batch(
+                [self._request(job, content) for job, content, *_ in pending]
+            )
+            if len(outputs) != len(pending):
+                raise RuntimeError(f"provider returned {len(outputs)} outputs for {len(pending)} requests")
+        except Exception as exc:
+            db.rollback()
+            for job, *_ in pending:
+                self._record_error(db, job, exc)
+            return
+
+        with self._lock:
+            self.batches += 1
+            self.batched_jobs += len(pending)
+        for (job, _content, session_id, source_note_id, key), output in zip(pending, outputs):
+            cache_hit = None if key is None else False
+            self._finish(db, job, output, session_id, source_note_id, key, cache_hit)
+
+    def _finish(self, db, job, output, session_id, source_note_id, key, cache_hit) -> None:
+        if not AiJobQueueService.complete_job(
+            db, job, self.worker_id, output, session_id, source_note_id, cache_hit=cache_hit,
+        ):
+            with self._lock:
+                self.lost_leases += 1
+            return
+
+        if cache_hit is False:
+            try:
+                AiSummaryCacheService.store(db, job.tenant_id, key, output)
+            except Exception:
+                db.rollback()
+                logger.exception("Could not store AI summary cache entry for job %s", job.id)
+        with self._lock:
+            self.completed += 1
+            if cache_hit:
+                self.cache_hits += 1
+            elif cache_hit is False:
+                self.cache_misses += 1
+
+    def _record_error(self, db, job, exc: Exception) -> None:
+        logger.warning("AI job %s failed (attempt %d): %s", job.id, job.attempts, exc)
+        self._record_failure(db, job, f"{type(exc).__name__}: {exc}", retry=True)
+
+    def _record_failure(self, db, job, error: str, retry: bool) -> None:
+        status = AiJobQueueService.fail_job(db, job, self.worker_id, error, retry=retry)
+        with self._lock:
+            if status is None:
+                self.lost_leases += 1
+            elif status == PENDING:
+                self.retried += 1
+            else:
+                self.failed += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "worker_id": self.worker_id,
+                "concurrency": self.concurrency,
+                "in_flight": len(self._in_flight),
+                "claimed": self.claimed,
+                "completed": self.completed,
+                "failed": self.failed,
+                "retried": self.retried,
+                "lost_leases": self.lost_leases,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "cache_evicted": self.cache_evicted,
+                "batch_size": self.batch_size,
+                "batches": self.batches,
+                "batched_jobs": self.batched_jobs,
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI job worker")
+    parser.add_argument("--concurrency", type=int, default=settings.AI_WORKER_CONCURRENCY)
+    parser.add_argument("--provider", default=settings.AI_PROVIDER)
+    parser.add_argument("--batch-size", type=int, default=settings.AI_BATCH_MAX_SIZE)
+    parser.add_argument("--no-cache", action="store_true", help="AI özet cache'ini kullanma")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+
+    worker = AiJobWorker(
+        provider=get_model_provider(args.provider),
+        concurrency=args.concurrency,
+        use_cache=False if args.no_cache else None,
+        batch_size=args.batch_size,
+    )
+    stopping = threading.Event()
+
+    def _handle_signal(signum, _frame):
+        logger.info("Received signal %d, finishing in-flight jobs", signum)
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
+    worker.start()
+    while not stopping.wait(1):
+        pass
+    worker.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Toplu model çıkarımında (AI_BATCH_MAX_SIZE) batch boyutuna göre iş/saniye ölçümü.
+
+Fake sağlayıcı çağrı başına sabit bir gecikme (--latency-ms) ve batch'teki her ek
+öğe için küçük bir gecikme (--item-latency-ms) ile simüle edilir; yerel / uzak
+modellerde olduğu gibi sabit maliyet batch'e yayıldıkça öğe başı maliyet düşer.
+İşler --groups farklı prompt sürümüne dağıtılır; batch'ler sadece aynı model +
+prompt sürümündeki işlerden oluşur. Her tur sonunda her işin tam bir kez
+tamamlandığı kontrol edilir.
+
+    python -m scripts.bench_ai_batching --jobs 500 --batch-sizes 1,4,16,32 --latency-ms 50
+"""
+
+import argparse
+import tempfile
+import time
+
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app import models, schemas
+from app.database import Base
+from app.services.ai_provider import FakeModelProvider
+from app.worker import AiJobWorker
+from scripts.bench_ai_worker import build_engine, reset, seed
+
+
+def assign_groups(Session, groups: int) -> None:
+    """
+    İşleri sırayla v1..vN prompt sürümlerine dağıtır (kuyrukta gruplar iç içe geçer).
+    """
+    with Session() as db:
+        ids = db.execute(select(models.AIJob.id).order_by(models.AIJob.id)).scalars().all()
+        db.connection().execute(
+            update(models.AIJob.__table__)
+            .where(models.AIJob.__table__.c.id == bindparam("job_id"))
+            .values(prompt_version=bindparam("version")),
+            [{"job_id": job_id, "version": f"v{i % groups + 1}"} for i, job_id in enumerate(ids)],
+        )
+        db.commit()
+
+
+def run(Session, batch_size: int, concurrency: int, provider: FakeModelProvider, jobs: int):
+    worker = AiJobWorker(
+        session_factory=Session,
+        provider=provider,
+        concurrency=concurrency,
+        poll_interval=0.01,
+        worker_id=f"bench-batch-{batch_size}",
+        use_cache=False,
+        batch_size=batch_size,
+        batch_max_wait=0,
+    )
+    start = time.perf_counter()
+    worker.start()
+    worker.wait_until_idle()
+    elapsed = time.perf_counter() - start
+    worker.stop()
+
+    stats = worker.stats()
+    with Session() as db:
+        summaries = db.execute(select(func.count()).select_from(models.AISummary)).scalar()
+        done = db.execute(
+            select(func.count()).select_from(models.AIJob)
+            .where(models.AIJob.status == schemas.AiJobStatus.COMPLETED.value)
+        ).scalar()
+    assert stats["completed"] == summaries == done == jobs, (stats["completed"], summaries, done, jobs)
+    return elapsed, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--batch-sizes", default="1,2,4,8,16,32", help="virgülle ayrılmış batch boyutları")
+    parser.add_argument("--concurrency", type=int, default=1, help="eşzamanlı batch sayısı")
+    parser.add_argument("--groups", type=int, default=2, help="farklı prompt sürümü sayısı")
+    parser.add_argument("--latency-ms", type=float, default=50, help="model çağrısı başına sabit gecikme")
+    parser.add_argument("--item-latency-ms", type=float, default=2, help="batch'teki her ek öğenin gecikmesi")
+    args = parser.parse_args()
+
+    provider = FakeModelProvider(
+        latency_seconds=args.latency_ms / 1000,
+        batch_item_latency_seconds=args.item_latency_ms / 1000,
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(args.database_url, tmp)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        seed(Session, args.jobs)
+        assign_groups(Session, args.groups)
+
+        print(
+            f"{args.jobs} iş, {args.groups} prompt sürümü, çağrı {args.latency_ms:.0f} ms "
+            f"+ öğe başı {args.item_latency_ms:.0f} ms, {args.concurrency} eşzamanlı batch"
+        )
+        baseline = None
+        for batch_size in (int(b) for b in args.batch_sizes.split(",")):
+            reset(Session)
+            elapsed, stats = run(Session, batch_size, args.concurrency, provider, args.jobs)
+            rate = args.jobs / elapsed
+            baseline = baseline or rate
+            calls = stats["batches"] or stats["completed"]
+            print(
+                f"batch={batch_size:<4} {rate:8.1f} iş/s  x{rate / baseline:5.1f}  "
+                f"model çağrısı={calls:<5} ort. batch={args.jobs / calls:5.1f}"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+AI iş kuyruğunda tenant'lar arası adil paylaşımın (AI_JOB_SCHEDULER) çarpık yük altında simülasyonu.
+
+İki senaryo, önce "fifo" sonra "fair" sıralamayla çalıştırılır:
+
+1. Backfill: büyük bir klinik (ağırlık 1) binlerce BATCH işi kuyruğa atmışken küçük
+   klinikler (ağırlık 1 / 2 / 4) düzenli aralıklarla INTERACTIVE iş gönderir.
+   Tenant başına kuyrukta bekleme süresi (p50 / p95) ölçülür.
+2. Ağırlık payı: ağırlıkları 1 / 2 / 4 olan üç tenant aynı anda eşit sayıda iş
+   atar; ilk tamamlanan işlerin tenant'lara dağılımı ölçülür (fair'de ~1:2:4).
+
+Model çağrısı fake sağlayıcı ile simüle edilir; Postgres gerekmez (geçici SQLite):
+
+    python -m scripts.bench_ai_scheduling --backfill 400 --interactive 20 --latency-ms 20
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from app import models, schemas
+from app.core.config import settings
+from app.database import Base
+from app.services.ai_job_queue_service import AiJobQueueService
+from app.services.ai_provider import FakeModelProvider
+from app.worker import AiJobWorker
+from scripts.bench_ai_worker import build_engine
+
+WEIGHTS = {"starter": 1, "pro": 2, "business": 4}
+
+
+def seed_tenants(Session, specs):
+    """
+    specs: [(ad, plan kodu)] -> {ad: (tenant_id, user_id, session_id)}
+    """
+    base = datetime(2024, 1, 1)
+    tenants = {}
+    with Session() as db:
+        plans = {}
+        for code, weight in WEIGHTS.items():
+            plan = models.SubscriptionPlan(code=code, name=code.title(), monthly_price=0, ai_job_weight=weight)
+            db.add(plan)
+            plans[code] = plan
+        db.flush()
+        for name, plan_code in specs:
+            tenant = models.Tenant(name=name, slug=name.lower())
+            db.add(tenant)
+            db.flush()
+            user = models.User(
+                tenant_id=tenant.id, email=f"{name.lower()}@bench.local", password_hash="x",
+                full_name=name, role="OWNER",
+            )
+            client = models.Client(tenant_id=tenant.id, first_name="Danışan", last_name=name)
+            db.add_all([user, client])
+            db.flush()
+            session = models.Session(
+                tenant_id=tenant.id, practitioner_id=user.id, client_id=client.id,
+                session_type="online", occurred_at=base,
+            )
+            db.add(session)
+            db.add(models.Subscription(
+                tenant_id=tenant.id, plan_id=plans[plan_code].id,
+                status=schemas.SubscriptionStatus.ACTIVE.value, starts_at=base,
+            ))
+            db.flush()
+            tenants[name] = (tenant.id, user.id, session.id)
+        db.commit()
+    return tenants
+
+
+def enqueue(Session, tenant, count: int, priority: str, created_at=None) -> None:
+    """
+    Tenant için `count` not + her not için bir NOTE_SUMMARY işi ekler.
+    """
+    tenant_id, user_id, session_id = tenant
+    created_at = created_at or datetime.utcnow()
+    with Session() as db:
+        note_ids = db.execute(
+            insert(models.SessionNote).returning(models.SessionNote.id),
+            [
+                {
+                    "session_id": session_id, "author_id": user_id, "type": "manual",
+                    "content": f"Not {i}. Danışan haftayı anlattı. Ödevler konuşuldu.",
+                    "created_at": created_at,
+                }
+                for i in range(count)
+            ],
+        ).scalars().all()
+        db.execute(insert(models.AIJob), [
+            {
+                "tenant_id": tenant_id, "type": schemas.AiJobType.NOTE_SUMMARY.value,
+                "status": schemas.AiJobStatus.PENDING.value, "priority": priority,
+                "input_ref_type": "session_note", "input_ref_id": note_id,
+                "model_name": "fake", "prompt_version": "v1", "created_at": created_at,
+            }
+            for note_id in note_ids
+        ])
+        db.commit()
+
+
+def clear(Session) -> None:
+    with Session() as db:
+        for model in (models.AISummary, models.AIJob, models.SessionNote):
+            db.execute(delete(model))
+        db.commit()
+
+
+def start_worker(Session, args) -> AiJobWorker:
+    worker = AiJobWorker(
+        session_factory=Session,
+        provider=FakeModelProvider(latency_seconds=args.latency_ms / 1000),
+        concurrency=args.concurrency,
+        poll_interval=0.005,
+        worker_id="bench-scheduler",
+        use_cache=False,
+        batch_size=1,
+    )
+    worker.start()
+    return worker
+
+
+def backfill_scenario(Session, tenants, args) -> list:
+    clear(Session)
+    # Backfill işleri kuyrukta zaten bekliyor
+    enqueue(Session, tenants["Buyuk"], args.backfill, schemas.AiJobPriority.BATCH.value)
+    started = datetime.utcnow()
+
+    small = ["Kucuk1", "Kucuk2", "Kucuk4"]
+    interval = args.arrival_ms / 1000
+
+    def feed():
+        for _ in range(args.interactive):
+            for name in small:
+                enqueue(Session, tenants[name], 1, schemas.AiJobPriority.INTERACTIVE.value)
+            time.sleep(interval)
+
+    worker = start_worker(Session, args)
+    feeder = threading.Thread(target=feed)
+    feeder.start()
+    feeder.join()
+    worker.wait_until_idle()
+    worker.stop()
+
+    with Session() as db:
+        return AiJobQueueService.queue_stats(db, since=started - timedelta(seconds=1))
+
+
+def share_scenario(Session, tenants, args) -> Counter:
+    clear(Session)
+    created_at = datetime.utcnow()
+    # Aynı anda, eşit sayıda; FIFO'da ekleme sırası (önce ağırlığı düşük olan) belirleyici olur
+    for name in ("Pay1", "Pay2", "Pay4"):
+        enqueue(Session, tenants[name], args.share_jobs, schemas.AiJobPriority.INTERACTIVE.value, created_at)
+
+    worker = start_worker(Session, args)
+    worker.wait_until_idle()
+    worker.stop()
+
+    names = {tenants[name][0]: name for name in ("Pay1", "Pay2", "Pay4")}
+    with Session() as db:
+        first = db.execute(
+            select(models.AIJob.tenant_id)
+            .order_by(models.AIJob.started_at, models.AIJob.id)
+            .limit(args.share_jobs)
+        ).scalars().all()
+    return Counter(names[tenant_id] for tenant_id in first)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--backfill", type=int, default=400, help="büyük kliniğin BATCH iş sayısı")
+    parser.add_argument("--interactive", type=int, default=20, help="küçük klinik başına INTERACTIVE iş")
+    parser.add_argument("--arrival-ms", type=float, default=100, help="INTERACTIVE işlerin gelme aralığı")
+    parser.add_argument("--share-jobs", type=int, default=150, help="pay senaryosunda tenant başına iş")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=20, help="fake model çağrısı gecikmesi")
+    parser.add_argument("--policies", default="fifo,fair")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(args.database_url, tmp)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        tenants = seed_tenants(Session, [
+            ("Buyuk", "starter"), ("Kucuk1", "starter"), ("Kucuk2", "pro"), ("Kucuk4", "business"),
+            ("Pay1", "starter"), ("Pay2", "pro"), ("Pay4", "business"),
+        ])
+        names = {tenant_id: name for name, (tenant_id, _, _) in tenants.items()}
+
+        for policy in args.policies.split(","):
+            settings.AI_JOB_SCHEDULER = policy
+            print(f"\n=== {policy} ===")
+            print(
+                f"1) {args.backfill} BATCH backfill + tenant başına {args.interactive} INTERACTIVE "
+                f"({args.arrival_ms:.0f} ms arayla), kuyrukta bekleme (sn):"
+            )
+            for item in backfill_scenario(Session, tenants, args):
+                wait = item["wait_seconds"]
+                print(
+                    f"   {names[item['tenant_id']]:<7} {item['priority']:<12} n={item['started']:<4} "
+                    f"p50={wait['p50']:7.3f}  p95={wait['p95']:7.3f}  max={wait['max']:7.3f}"
+                )
+
+            shares = share_scenario(Session, tenants, args)
+            total = sum(shares.values())
+            print(f"2) Ağırlık 1/2/4, tenant başına {args.share_jobs} iş; ilk {total} işin dağılımı:")
+            print("   " + "  ".join(
+                f"{name}={shares[name]} (%{100 * shares[name] / total:.0f})" for name in ("Pay1", "Pay2", "Pay4")
+            ))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+AI job worker veriminin (iş/saniye) worker sayısına göre ölçümü.
+
+Her tur için aynı iş kümesi PENDING'e döndürülür ve W adet worker (ayrı süreçleri
+simüle eden AiJobWorker örnekleri) kuyruğu boşaltana kadar çalıştırılır. Model
+çağrısı, gecikmesi ayarlanabilen fake sağlayıcı ile simüle edilir. Tur sonunda her
+işin tam bir kez tamamlandığı (çift kiralama olmadığı) kontrol edilir.
+
+Postgres gerekmez (geçici SQLite dosyası); --database-url ile Postgres'te de çalışır:
+
+    python -m scripts.bench_ai_worker --jobs 500 --workers 1,2,4,8 --latency-ms 50
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, delete, event, func, insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app import models, schemas
+from app.database import Base
+from app.services.ai_provider import FakeModelProvider
+from app.worker import AiJobWorker
+
+
+def build_engine(database_url, tmp):
+    if database_url:
+        return create_engine(database_url)
+    engine = create_engine(
+        f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+        connect_args={"timeout": 30, "check_same_thread": False},
+        pool_size=32,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    return engine
+
+
+def seed(Session, jobs: int) -> None:
+    base = datetime(2024, 1, 1)
+    with Session() as db:
+        tenant = models.Tenant(name="Bench Klinik", slug="bench-klinik")
+        db.add(tenant)
+        db.flush()
+        user = models.User(
+            tenant_id=tenant.id, email="bench@bench.local", password_hash="x",
+            full_name="Bench", role="OWNER",
+        )
+        client = models.Client(tenant_id=tenant.id, first_name="Danışan", last_name="Bench")
+        db.add_all([user, client])
+        db.flush()
+        session = models.Session(
+            tenant_id=tenant.id, practitioner_id=user.id, client_id=client.id,
+            session_type="online", occurred_at=base,
+        )
+        db.add(session)
+        db.flush()
+
+        notes = [
+            {
+                "session_id": session.id, "author_id": user.id, "type": "manual",
+                "content": f"Not {i}. Danışan hafta boyunca uyku düzeninin bozulduğunu anlattı. "
+                           f"İş yerindeki stres etkenleri konuşuldu. Nefes egzersizleri önerildi.",
+                "created_at": base + timedelta(minutes=i),
+            }
+            for i in range(jobs)
+        ]
+        db.execute(insert(models.SessionNote), notes)
+        note_ids = db.execute(select(models.SessionNote.id).order_by(models.SessionNote.id)).scalars().all()
+        db.execute(insert(models.AIJob), [
+            {
+                "tenant_id": tenant.id, "type": schemas.AiJobType.NOTE_SUMMARY.value,
+                "status": schemas.AiJobStatus.PENDING.value, "input_ref_type": "session_note",
+                "input_ref_id": note_id, "model_name": "fake", "prompt_version": "v1",
+                "created_at": base + timedelta(seconds=i),
+            }
+            for i, note_id in enumerate(note_ids)
+        ])
+        db.commit()
+
+
+def reset(Session) -> None:
+    with Session() as db:
+        db.execute(delete(models.AISummary))
+        # Her tur modeli gerçekten çağırsın (önceki turun çıktıları cache'ten gelmesin)
+        db.execute(delete(models.AISummaryCache))
+        db.execute(update(models.AIJob).values(
+            status=schemas.AiJobStatus.PENDING.value, worker_id=None, lease_expires_at=None,
+            started_at=None, finished_at=None, attempts=0,
+        ))
+        db.commit()
+
+
+def run(Session, n_workers: int, concurrency: int, latency: float, jobs: int) -> float:
+    workers = [
+        AiJobWorker(
+            session_factory=Session,
+            provider=FakeModelProvider(latency_seconds=latency),
+            concurrency=concurrency,
+            poll_interval=0.01,
+            worker_id=f"bench-{i}",
+        )
+        for i in range(n_workers)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.wait_until_idle()
+    elapsed = time.perf_counter() - start
+    for worker in workers:
+        worker.stop()
+
+    completed = sum(w.stats()["completed"] for w in workers)
+    with Session() as db:
+        summaries = db.execute(select(func.count()).select_from(models.AISummary)).scalar()
+        done = db.execute(
+            select(func.count()).select_from(models.AIJob)
+            .where(models.AIJob.status == schemas.AiJobStatus.COMPLETED.value)
+        ).scalar()
+    assert completed == summaries == done == jobs, (completed, summaries, done, jobs)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--workers", default="1,2,4,8", help="virgülle ayrılmış worker sayıları")
+    parser.add_argument("--concurrency", type=int, default=1, help="worker başına eşzamanlı iş")
+    parser.add_argument("--latency-ms", type=float, default=50, help="fake model çağrısı gecikmesi")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(args.database_url, tmp)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        seed(Session, args.jobs)
+
+        print(f"{args.jobs} iş, model gecikmesi {args.latency_ms:.0f} ms, worker başına {args.concurrency} slot")
+        for n_workers in (int(w) for w in args.workers.split(",")):
+            reset(Session)
+            elapsed = run(Session, n_workers, args.concurrency, args.latency_ms / 1000, args.jobs)
+            print(f"workers={n_workers:<3} {args.jobs / elapsed:8.1f} iş/s")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Sync (threadpool + psycopg2 Session) ve async (event loop + AsyncSession)
+DB yığınlarının aynı listeleme sorgusu üzerinde istek/saniye karşılaştırması.
+
+Postgres gerekmez; süreç içi SQLite / aiosqlite ile çalışır:
+
+    pip install -r requirements-dev.txt
+    python -m scripts.bench_async_db --requests 2000 --concurrency 50
+
+Not: SQLite yerel bir dosya olduğu için I/O beklemesi çok kısadır; gerçek
+Postgres'te (ağ gecikmesiyle) async yığının farkı daha belirgin olur.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import List
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models, schemas
+from app.database import Base
+from app.services.client_service import AsyncClientService, ClientService
+
+
+def seed(sync_session_factory, n_clients: int) -> int:
+    db = sync_session_factory()
+    try:
+        tenant = models.Tenant(name="Bench Klinik", slug="bench-klinik")
+        db.add(tenant)
+        db.flush()
+        db.add_all(
+            models.Client(
+                tenant_id=tenant.id,
+                first_name=f"Danisan{i:05d}",
+                last_name="Bench",
+                status="ACTIVE",
+            )
+            for i in range(n_clients)
+        )
+        db.commit()
+        return tenant.id
+    finally:
+        db.close()
+
+
+def build_app(db_path: str, n_clients: int, pool_size: int) -> FastAPI:
+    sync_engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+        pool_size=pool_size,
+    )
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}",
+        pool_size=pool_size,
+    )
+    SyncSession = sessionmaker(bind=sync_engine, autoflush=False)
+    AsyncSession = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    Base.metadata.create_all(bind=sync_engine)
+    tenant_id = seed(SyncSession, n_clients)
+
+    def get_sync_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    app = FastAPI()
+
+    @app.get("/sync/clients", response_model=List[schemas.ClientOut])
+    def sync_clients(db=Depends(get_sync_db)):
+        return ClientService.list_clients(db=db, tenant_id=tenant_id).items
+
+    @app.get("/async/clients", response_model=List[schemas.ClientOut])
+    async def async_clients(db=Depends(get_async_db)):
+        page = await AsyncClientService.list_clients(db=db, tenant_id=tenant_id)
+        return page.items
+
+    return app
+
+
+async def run_load(app: FastAPI, path: str, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    remaining = total
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.get(path)
+                response.raise_for_status()
+
+        # Isınma
+        await client.get(path)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return total / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--clients", type=int, default=50, help="tenant başına danışan sayısı")
+    parser.add_argument("--pool-size", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = build_app(os.path.join(tmp, "bench.db"), args.clients, args.pool_size)
+
+        for label, path in (("sync ", "/sync/clients"), ("async", "/async/clients")):
+            rps = asyncio.run(run_load(app, path, args.requests, args.concurrency))
+            print(f"{label}  {rps:8.1f} req/s  ({args.requests} istek, eşzamanlılık {args.concurrency})")
+
+
+if __name__ == "__main__":
+    main()
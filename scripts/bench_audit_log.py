@@ -0,0 +1,128 @@
+"""
+Audit log yazım modlarının mutasyon verimine etkisi (işlem/saniye):
+
+- sync    : her mutasyon = iş commit'i + audit log commit'i (2 fsync)
+- buffered: audit log kayıtları kuyruğa atılır, arka planda toplu INSERT ile yazılır
+- transactional: audit satırı flush hook'u ile iş transaction'ına eklenir (tek commit)
+
+Postgres gerekmez; fsync maliyetinin görünmesi için SQLite dosyası
+PRAGMA synchronous=FULL ile kullanılır:
+
+    python -m scripts.bench_audit_log --mutations 2000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app import models, schemas
+from app.core.config import settings
+from app.database import Base
+from app.services import audit_log_service
+from app.services.audit_log_hooks import install_audit_hooks, set_audit_actor
+from app.services.audit_log_writer import AuditLogWriter
+from app.services.client_service import ClientService
+
+
+def build_engine(db_path: str):
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"timeout": 30})
+
+    @event.listens_for(engine, "connect")
+    def _pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=FULL")
+        cursor.close()
+
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def seed_user(Session) -> models.User:
+    with Session() as db:
+        tenant = models.Tenant(name="Bench Klinik", slug="bench-klinik")
+        db.add(tenant)
+        db.flush()
+        user = models.User(
+            tenant_id=tenant.id,
+            email="bench@bench.local",
+            password_hash="x",
+            full_name="Bench",
+            role="OWNER",
+        )
+        db.add(user)
+        db.commit()
+        return user.id
+
+
+def run(Session, user_id: int, mutations: int, offset: int) -> float:
+    start = time.perf_counter()
+    with Session() as db:
+        user = db.get(models.User, user_id)
+        set_audit_actor(db, user)
+        for i in range(mutations):
+            ClientService.create_client(
+                db=db,
+                tenant_id=user.tenant_id,
+                data=schemas.ClientCreate(
+                    first_name=f"Danisan{offset + i:06d}",
+                    last_name="Bench",
+                    status="ACTIVE",
+                ),
+                current_user=user,
+            )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mutations", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=settings.AUDIT_LOG_BATCH_SIZE)
+    parser.add_argument("--flush-interval-ms", type=int, default=settings.AUDIT_LOG_FLUSH_INTERVAL_MS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(os.path.join(tmp, "bench.db"))
+        Session = sessionmaker(bind=engine, autoflush=False)
+        user_id = seed_user(Session)
+
+        settings.AUDIT_LOG_MODE = "sync"
+        elapsed = run(Session, user_id, args.mutations, offset=0)
+        print(f"sync           {args.mutations / elapsed:8.1f} mutasyon/s")
+
+        writer = AuditLogWriter(
+            bind=engine,
+            batch_size=args.batch_size,
+            flush_interval=args.flush_interval_ms / 1000,
+            max_queue=args.mutations * 2,
+        )
+        audit_log_service.audit_log_writer = writer
+        settings.AUDIT_LOG_MODE = "buffered"
+        writer.start()
+        elapsed = run(Session, user_id, args.mutations, offset=args.mutations)
+        drain_start = time.perf_counter()
+        writer.stop()
+        drain = time.perf_counter() - drain_start
+
+        stats = writer.stats()
+        print(
+            f"buffered       {args.mutations / elapsed:8.1f} mutasyon/s  "
+            f"({stats['written']} kayıt, {stats['batches']} INSERT, kapanışta boşaltma {drain * 1000:.0f} ms)"
+        )
+
+        install_audit_hooks()
+        settings.AUDIT_LOG_MODE = "transactional"
+        elapsed = run(Session, user_id, args.mutations, offset=args.mutations * 2)
+        print(f"transactional  {args.mutations / elapsed:8.1f} mutasyon/s")
+
+        with Session() as db:
+            total = db.query(models.AuditLog).count()
+        assert total == args.mutations * 3, f"beklenen {args.mutations * 3} audit kaydı, bulunan {total}"
+
+
+if __name__ == "__main__":
+    main()
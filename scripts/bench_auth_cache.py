@@ -0,0 +1,165 @@
+"""
+get_current_user kullanıcı cache'inin istek başına DB tasarrufunu ölçer:
+cache kapalı / açık iken istek başına SQL ifadesi sayısı ve istek/saniye.
+
+Postgres gerekmez; süreç içi SQLite / aiosqlite ile çalışır:
+
+    pip install -r requirements-dev.txt
+    python -m scripts.bench_auth_cache --requests 2000 --users 50
+
+Not: SQLite yerel bir dosya olduğu için sorgu maliyeti çok düşüktür; gerçek
+Postgres'te (ağ gecikmesiyle) kazanılan her sorgu istek süresine daha çok yansır.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import List
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.core.security import create_access_token
+from app.database import Base, get_async_db, get_db
+from app.services.auth_service import (
+    get_current_user,
+    get_current_user_async,
+    user_cache,
+)
+
+
+class StatementCounter:
+    def __init__(self, *engines):
+        self.count = 0
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+def seed(sync_session_factory, n_users: int) -> List[str]:
+    """
+    Tek tenant altında n_users kullanıcı oluşturur, her biri için token döner.
+    """
+    db = sync_session_factory()
+    try:
+        tenant = models.Tenant(name="Bench Klinik", slug="bench-klinik")
+        db.add(tenant)
+        db.flush()
+        users = [
+            models.User(
+                tenant_id=tenant.id,
+                email=f"user{i:04d}@bench.local",
+                password_hash="x",
+                full_name=f"Kullanici {i}",
+                role="PRACTITIONER",
+                is_active=True,
+            )
+            for i in range(n_users)
+        ]
+        db.add_all(users)
+        db.commit()
+        return [create_access_token(data={"sub": str(u.id)}) for u in users]
+    finally:
+        db.close()
+
+
+def build_app(db_path: str, n_users: int):
+    sync_engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+    )
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    SyncSession = sessionmaker(bind=sync_engine, autoflush=False)
+    AsyncSession = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    Base.metadata.create_all(bind=sync_engine)
+    tokens = seed(SyncSession, n_users)
+
+    def get_sync_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_session():
+        async with AsyncSession() as db:
+            yield db
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = get_sync_db
+    app.dependency_overrides[get_async_db] = get_async_session
+
+    @app.get("/sync/me")
+    def sync_me(current_user: models.User = Depends(get_current_user)):
+        return {"id": current_user.id, "tenant_id": current_user.tenant_id}
+
+    @app.get("/async/me")
+    async def async_me(current_user: models.User = Depends(get_current_user_async)):
+        return {"id": current_user.id, "tenant_id": current_user.tenant_id}
+
+    counter = StatementCounter(sync_engine, async_engine.sync_engine)
+    return app, tokens, counter
+
+
+async def run_load(app: FastAPI, path: str, tokens: List[str], total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    remaining = total
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                token = tokens[remaining % len(tokens)]
+                response = await client.get(path, headers={"Authorization": f"Bearer {token}"})
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return total / elapsed
+
+
+async def compare(app: FastAPI, tokens: List[str], counter: StatementCounter, args) -> None:
+    ttl = user_cache.ttl_seconds or 30
+
+    for label, path in (("sync ", "/sync/me"), ("async", "/async/me")):
+        for cache_label, cache_ttl in (("cache kapalı", 0), ("cache açık  ", ttl)):
+            user_cache.clear()
+            user_cache.ttl_seconds = cache_ttl
+            user_cache.hits = user_cache.misses = 0
+            counter.count = 0
+
+            rps = await run_load(app, path, tokens, args.requests, args.concurrency)
+            stats = user_cache.stats()
+            print(
+                f"{label} {cache_label}  {counter.count / args.requests:5.2f} sorgu/istek  "
+                f"{rps:8.1f} req/s  hit oranı {stats['hit_rate']:.2%}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--users", type=int, default=50, help="token'ı olan farklı kullanıcı sayısı")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app, tokens, counter = build_app(os.path.join(tmp, "bench.db"), args.users)
+        # aiosqlite havuzu tek event loop'a bağlı olduğu için tüm ölçümler tek loop'ta
+        asyncio.run(compare(app, tokens, counter, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+İstek başına JWT doğrulama maliyetinin mikro-benchmark'ı (µs / decode):
+
+- ham anahtar      : python-jose'a her çağrıda secret / PEM string verilir
+- yüklenmiş anahtar: anahtar nesnesi bir kez kurulur (security.jwt_keys)
+- cache'li         : aynı token tekrar geldiğinde doğrulanmış claim'ler döner
+
+    python -m scripts.bench_jwt_decode --iterations 5000
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwt
+
+from app.core import security
+from app.core.cache import TTLCache
+
+
+def _pem_pair(private_key):
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+    return private_pem, public_pem
+
+
+def per_call_us(fn: Callable[[], object], iterations: int) -> float:
+    fn()  # ısınma
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def bench_algorithm(algorithm: str, raw_verify_key: str, keys: security.JWTKeys, iterations: int):
+    security.jwt_keys = keys
+    security.token_cache = TTLCache(max_size=1000, ttl_seconds=3600)
+    token = security.create_access_token({"sub": "1", "tenant_id": 1, "role": "OWNER"})
+
+    raw = per_call_us(
+        lambda: jwt.decode(token, raw_verify_key, algorithms=[algorithm]), iterations
+    )
+    loaded = per_call_us(
+        lambda: jwt.decode(token, keys.verification_key, algorithms=[algorithm]), iterations
+    )
+    cached = per_call_us(lambda: security.decode_access_token(token), iterations)
+
+    print(
+        f"{algorithm:6s}  ham anahtar {raw:8.1f} µs   yüklenmiş anahtar {loaded:8.1f} µs   "
+        f"cache'li {cached:6.1f} µs"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    secret = "bench-secret"
+    bench_algorithm(
+        "HS256", secret, security.load_jwt_keys("HS256", secret=secret), args.iterations
+    )
+
+    private_pem, public_pem = _pem_pair(rsa.generate_private_key(public_exponent=65537, key_size=2048))
+    bench_algorithm(
+        "RS256",
+        public_pem,
+        security.load_jwt_keys("RS256", private_key_pem=private_pem, public_key_pem=public_pem),
+        args.iterations,
+    )
+
+    private_pem, public_pem = _pem_pair(ec.generate_private_key(ec.SECP256R1()))
+    bench_algorithm(
+        "ES256",
+        public_pem,
+        security.load_jwt_keys("ES256", private_key_pem=private_pem, public_key_pem=public_pem),
+        args.iterations,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+/auth/login verimini (login/s) eşzamanlılığa göre ölçer; aynı anda hafif bir
+endpoint'e (/ping) atılan isteklerin gecikmesini ve 503 ile reddedilen login
+oranını da raporlar.
+
+Postgres gerekmez; süreç içi aiosqlite ile çalışır:
+
+    pip install -r requirements-dev.txt
+    python -m scripts.bench_login --rounds 10 --concurrency 1,4,16,64
+
+--workers / --queue bcrypt havuzunu (BCRYPT_MAX_WORKERS / BCRYPT_MAX_QUEUE) ayarlar.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.core import security
+from app.core.config import settings
+from app.core.executor import BoundedExecutor, ExecutorSaturated
+from app.database import Base, get_async_db
+from app.main import executor_saturated_handler
+from app.routers import auth
+
+EMAIL = "bench@bench.local"
+PASSWORD = "bench-password"
+
+
+def build_app(db_path: str) -> FastAPI:
+    sync_engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=sync_engine)
+    SyncSession = sessionmaker(bind=sync_engine)
+    with SyncSession() as db:
+        tenant = models.Tenant(name="Bench Klinik", slug="bench-klinik")
+        db.add(tenant)
+        db.flush()
+        db.add(models.User(
+            tenant_id=tenant.id,
+            email=EMAIL,
+            password_hash=security._hashpw(PASSWORD),
+            full_name="Bench",
+            role="OWNER",
+        ))
+        db.commit()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    AsyncSession = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def get_async_session():
+        async with AsyncSession() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(auth.router)
+    app.add_exception_handler(ExecutorSaturated, executor_saturated_handler)
+    app.dependency_overrides[get_async_db] = get_async_session
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def run_level(app: FastAPI, concurrency: int, duration: float) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    ok = rejected = 0
+    ping_latencies = []
+    deadline = time.perf_counter() + duration
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def login_worker():
+            nonlocal ok, rejected
+            while time.perf_counter() < deadline:
+                response = await client.post(
+                    "/auth/login",
+                    data={"username": EMAIL, "password": PASSWORD},
+                )
+                if response.status_code == 200:
+                    ok += 1
+                elif response.status_code == 503:
+                    rejected += 1
+                    await asyncio.sleep(0.005)
+                else:
+                    response.raise_for_status()
+
+        async def ping_worker():
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                (await client.get("/ping")).raise_for_status()
+                ping_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.01)
+
+        start = time.perf_counter()
+        await asyncio.gather(ping_worker(), *(login_worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    ping_latencies.sort()
+    return {
+        "logins_per_sec": ok / elapsed,
+        "rejected": rejected,
+        "ping_p50_ms": statistics.median(ping_latencies) * 1000,
+        "ping_p95_ms": ping_latencies[int(len(ping_latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def run_all(app: FastAPI, levels, duration: float) -> None:
+    for concurrency in levels:
+        r = await run_level(app, concurrency, duration)
+        print(
+            f"eşzamanlılık {concurrency:4d}  {r['logins_per_sec']:7.1f} login/s  "
+            f"503: {r['rejected']:5d}  /ping p50 {r['ping_p50_ms']:6.1f} ms  "
+            f"p95 {r['ping_p95_ms']:6.1f} ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=10, help="bcrypt maliyet faktörü")
+    parser.add_argument("--workers", type=int, default=settings.BCRYPT_MAX_WORKERS)
+    parser.add_argument("--queue", type=int, default=settings.BCRYPT_MAX_QUEUE)
+    parser.add_argument("--concurrency", default="1,4,16,64")
+    parser.add_argument("--duration", type=float, default=3.0, help="her seviye için saniye")
+    args = parser.parse_args()
+
+    settings.BCRYPT_ROUNDS = args.rounds
+    security.password_executor = BoundedExecutor(
+        max_workers=args.workers,
+        max_queue=args.queue,
+        thread_name_prefix="bcrypt",
+    )
+    levels = [int(x) for x in args.concurrency.split(",")]
+
+    print(f"bcrypt rounds={args.rounds}, havuz {args.workers} worker + {args.queue} kuyruk")
+    with tempfile.TemporaryDirectory() as tmp:
+        app = build_app(os.path.join(tmp, "bench.db"))
+        # aiosqlite havuzu tek event loop'a bağlı olduğu için tüm ölçümler tek loop'ta
+        asyncio.run(run_all(app, levels, args.duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Bir kullanıcıya sistem yöneticiliği (users.is_system_admin) veren / geri alan komut.
+
+Sistem yöneticileri tenant'lar arası /admin endpoint'lerine (yavaş sorgular,
+AI cache ve kuyruk istatistikleri) erişir. Bu yetki tenant API'lerinden
+verilemez; sadece veritabanına erişimi olan operatör bu komutla verir:
+
+    python -m scripts.grant_system_admin ops@example.com
+    python -m scripts.grant_system_admin ops@example.com --revoke
+
+Çalışan API süreçleri değişikliği auth cache'i yüzünden en geç
+AUTH_USER_CACHE_TTL_SECONDS sonra görür.
+"""
+
+import argparse
+import sys
+
+from sqlalchemy import create_engine, update
+
+from app import models
+from app.database import engine as app_engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("email")
+    parser.add_argument("--revoke", action="store_true", help="yetkiyi geri al")
+    parser.add_argument("--database-url", default=None, help="verilmezse uygulamanın veritabanı")
+    args = parser.parse_args()
+
+    bind = create_engine(args.database_url) if args.database_url else app_engine
+    with bind.begin() as conn:
+        updated = conn.execute(
+            update(models.User.__table__)
+            .where(models.User.email == args.email)
+            .values(is_system_admin=not args.revoke)
+        ).rowcount
+
+    if not updated:
+        print(f"Kullanıcı bulunamadı: {args.email}")
+        sys.exit(1)
+    print(f"{args.email}: sistem yöneticiliği {'geri alındı' if args.revoke else 'verildi'}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Arşivlenmiş (saklama süresi dolup tablodan çıkarılmış) audit log kayıtlarını sorgular.
+
+Sadece istenen zaman aralığına düşen ayların dosyaları açılır; sonuçlar
+NDJSON olarak stdout'a yazılır:
+
+    python -m scripts.query_audit_archive --tenant-id 1 --entity-type client --entity-id 123
+    python -m scripts.query_audit_archive --tenant-id 1 --since 2023-01-01 --until 2023-04-01
+"""
+
+import argparse
+import json
+from datetime import datetime
+
+from app.services.audit_diff import jsonable
+from app.services.audit_log_archive import AuditLogArchive
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--archive-dir", default=None, help="verilmezse AUDIT_LOG_ARCHIVE_DIR")
+    parser.add_argument("--tenant-id", type=int, required=True)
+    parser.add_argument("--since", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--until", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--entity-type", default=None)
+    parser.add_argument("--entity-id", type=int, default=None)
+    parser.add_argument("--user-id", type=int, default=None)
+    parser.add_argument("--action", default=None)
+    args = parser.parse_args()
+
+    archive = AuditLogArchive(args.archive_dir)
+    for row in archive.iter_logs(
+        tenant_id=args.tenant_id,
+        start=args.since,
+        end=args.until,
+        entity_type=args.entity_type,
+        entity_id=args.entity_id,
+        user_id=args.user_id,
+        action=args.action,
+    ):
+        print(json.dumps(jsonable(row), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# tests/conftest.py
+#
+# Uygulamayı geçici bir SQLite veritabanına bağlar (Postgres gerekmez).
+# Lifespan çalıştırılmaz; tablolar create_all ile açılır.
+#
+#     python -m pytest -q
+
+import itertools
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import database, models
+from app.core.config import settings
+from app.database import Base
+from app.main import app
+from app.services.auth_service import user_cache
+
+_emails = itertools.count(1)
+
+
+@pytest.fixture(scope="session")
+def session_factory(tmp_path_factory):
+    path = tmp_path_factory.mktemp("db") / "test.db"
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    AsyncSession = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    def get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    overrides = {
+        database.get_db: get_db,
+        database.get_read_db: get_db,
+        database.get_async_db: get_async_db,
+        database.get_async_read_db: get_async_db,
+    }
+    app.dependency_overrides.update(overrides)
+    yield Session
+    for dependency in overrides:
+        app.dependency_overrides.pop(dependency, None)
+    engine.dispose()
+
+
+@pytest.fixture
+def client(session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "AUDIT_LOG_MODE", "sync")
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+    user_cache.clear()
+    return TestClient(app)
+
+
+@pytest.fixture
+def register(client):
+    """
+    Yeni bir tenant + OWNER kaydeder; (kullanıcı bilgisi, Authorization header'ı) döner.
+    """
+    def _register(password="secret123"):
+        n = next(_emails)
+        email = f"owner{n}@example.com"
+        r = client.post("/api/v1/auth/register", json={
+            "email": email, "password": password, "full_name": f"Owner {n}",
+            "tenant_name": f"Klinik {n}",
+        })
+        assert r.status_code == 201, r.text
+        r = client.post("/api/v1/auth/login", data={"username": email, "password": password})
+        assert r.status_code == 200, r.text
+        headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+        return client.get("/api/v1/auth/me", headers=headers).json(), headers
+
+    return _register
+
+
+@pytest.fixture
+def create_member(client):
+    """
+    Owner'ın tenant'ına verilen rolde bir kullanıcı ekler; (kullanıcı bilgisi, Authorization header'ı) döner.
+    """
+    def _create(owner_headers, role="STAFF", password="secret123"):
+        email = f"member{next(_emails)}@example.com"
+        r = client.post("/api/v1/users/", headers=owner_headers, json={
+            "full_name": "Personel", "email": email, "password": password, "role": role,
+        })
+        assert r.status_code == 201, r.text
+        r = client.post("/api/v1/auth/login", data={"username": email, "password": password})
+        assert r.status_code == 200, r.text
+        headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+        return client.get("/api/v1/auth/me", headers=headers).json(), headers
+
+    return _create
+
+
+@pytest.fixture
+def make_system_admin(session_factory):
+    def _make(user_id: int) -> None:
+        with session_factory() as db:
+            db.execute(update(models.User).where(models.User.id == user_id).values(is_system_admin=True))
+            db.commit()
+        user_cache.clear()
+
+    return _make
+
+
+@pytest.fixture
+def db_factory(tmp_path):
+    """
+    Teste özel boş bir veritabanı (kuyruk gibi tablonun tamamını okuyan servisler için).
+    """
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'isolated.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    engine.dispose()
@@ -0,0 +1,84 @@
+# tests/factories.py
+#
+# Servis testleri için kayıt üreten yardımcılar (API'ye gitmeden, doğrudan ORM).
+
+import itertools
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app import models, schemas
+
+_ids = itertools.count(1)
+
+
+def create_tenant(db, weight: Optional[int] = None) -> models.Tenant:
+    """
+    Tenant + OWNER + danışan + seans. weight verilirse tenant'a bu
+    ai_job_weight'e sahip planla aktif bir abonelik açılır.
+    """
+    n = next(_ids)
+    tenant = models.Tenant(name=f"Klinik {n}", slug=f"klinik-{n}")
+    db.add(tenant)
+    db.flush()
+    owner = models.User(
+        tenant_id=tenant.id, email=f"owner{n}@factory.local", password_hash="x",
+        full_name=f"Owner {n}", role=schemas.UserRole.OWNER.value,
+    )
+    client = models.Client(tenant_id=tenant.id, first_name="Danışan", last_name=str(n))
+    db.add_all([owner, client])
+    db.flush()
+    db.add(models.Session(
+        tenant_id=tenant.id, practitioner_id=owner.id, client_id=client.id,
+        session_type="online", occurred_at=datetime(2024, 1, 1),
+    ))
+    if weight is not None:
+        plan = models.SubscriptionPlan(
+            code=f"plan-{n}", name=f"Plan {n}", monthly_price=0, ai_job_weight=weight,
+        )
+        db.add(plan)
+        db.flush()
+        db.add(models.Subscription(
+            tenant_id=tenant.id, plan_id=plan.id,
+            status=schemas.SubscriptionStatus.ACTIVE.value,
+            starts_at=datetime.utcnow() - timedelta(days=1),
+        ))
+    db.flush()
+    return tenant
+
+
+def create_note(db, tenant: models.Tenant, content: str = "Danışan uyku sorunlarını anlattı.") -> models.SessionNote:
+    session = db.query(models.Session).filter(models.Session.tenant_id == tenant.id).first()
+    note = models.SessionNote(
+        session_id=session.id, author_id=session.practitioner_id, type="manual", content=content,
+    )
+    db.add(note)
+    db.flush()
+    return note
+
+
+def create_job(
+    db,
+    tenant: models.Tenant,
+    note: Optional[models.SessionNote] = None,
+    priority: str = "INTERACTIVE",
+    created_at: Optional[datetime] = None,
+    **values,
+) -> models.AIJob:
+    """
+    PENDING bir NOTE_SUMMARY işi. note verilmezse girdisi olmayan bir nota işaret eder.
+    """
+    job = models.AIJob(
+        tenant_id=tenant.id,
+        type=schemas.AiJobType.NOTE_SUMMARY.value,
+        status=values.pop("status", schemas.AiJobStatus.PENDING.value),
+        input_ref_type="session_note",
+        input_ref_id=note.id if note is not None else 10 ** 6 + next(_ids),
+        model_name=values.pop("model_name", "fake"),
+        prompt_version=values.pop("prompt_version", "v1"),
+        priority=priority,
+        created_at=created_at or datetime.utcnow(),
+        **values,
+    )
+    db.add(job)
+    db.flush()
+    return job
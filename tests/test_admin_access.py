@@ -0,0 +1,50 @@
+# tests/test_admin_access.py
+
+import pytest
+
+ADMIN_ENDPOINTS = [
+    "/api/v1/admin/slow-queries",
+    "/api/v1/admin/slow-queries/recent",
+    "/api/v1/admin/ai-summary-cache",
+    "/api/v1/admin/ai-job-queue",
+    "/health/db-pool",
+    "/health/auth-cache",
+    "/health/password-hashing",
+    "/health/audit-log",
+    "/health/ai-job-events",
+]
+
+
+@pytest.mark.parametrize("path", ADMIN_ENDPOINTS)
+def test_tenant_owner_cannot_read_admin_endpoints(client, register, path):
+    _, headers = register()
+    assert client.get(path, headers=headers).status_code == 403
+
+
+@pytest.mark.parametrize("path", ["/health/db-pool", "/health/auth-cache"])
+def test_health_details_require_authentication(client, path):
+    assert client.get(path).status_code == 401
+
+
+def test_liveness_check_is_public(client):
+    assert client.get("/health").json() == {"status": "healthy"}
+
+
+def test_owner_cannot_grant_itself_admin(client, register):
+    owner, headers = register()
+    r = client.patch(f"/api/v1/users/{owner['id']}", headers=headers, json={"role": "ADMIN"})
+    assert r.status_code == 422
+    assert client.get("/api/v1/admin/slow-queries", headers=headers).status_code == 403
+
+
+def test_owner_cannot_change_own_role(client, register):
+    owner, headers = register()
+    r = client.patch(f"/api/v1/users/{owner['id']}", headers=headers, json={"role": "STAFF"})
+    assert r.status_code == 403
+
+
+def test_system_admin_can_read_admin_endpoints(client, register, make_system_admin):
+    user, headers = register()
+    make_system_admin(user["id"])
+    for path in ADMIN_ENDPOINTS:
+        assert client.get(path, headers=headers).status_code == 200, path
@@ -0,0 +1,127 @@
+# tests/test_ai_job_batching.py
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app import models
+from app.services.ai_job_queue_service import COMPLETED, PENDING, AiJobQueueService
+from app.services.ai_provider import FakeModelProvider
+from app.worker import AiJobWorker
+from tests.factories import create_job, create_note, create_tenant
+
+
+class _BatchProvider(FakeModelProvider):
+    def __init__(self, drop_outputs: int = 0):
+        super().__init__(latency_seconds=0, batch_item_latency_seconds=0)
+        self.drop_outputs = drop_outputs
+        self.batch_sizes = []
+
+    def generate_batch(self, requests):
+        self.batch_sizes.append(len(requests))
+        outputs = super().generate_batch(requests)
+        return outputs[:len(outputs) - self.drop_outputs]
+
+
+def _worker(Session, provider) -> AiJobWorker:
+    return AiJobWorker(
+        session_factory=Session, provider=provider, concurrency=1, use_cache=False,
+        batch_size=3, batch_max_wait=60,
+    )
+
+
+def _ids(rows) -> set:
+    return {row.id for row in rows}
+
+
+def test_claim_batch_waits_for_the_group_to_fill(db_factory):
+    with db_factory() as db:
+        assert AiJobQueueService.claim_batch(db, "w1", 3, max_wait_seconds=60) is None
+
+        tenant = create_tenant(db)
+        jobs = {create_job(db, tenant).id for _ in range(2)}
+        db.commit()
+        # Bekleyen iş var ama grup dolmadı ve süre dolmadı
+        assert AiJobQueueService.claim_batch(db, "w1", 3, max_wait_seconds=60) == []
+
+        # Süre dolunca eksik batch de alınır
+        assert _ids(AiJobQueueService.claim_batch(db, "w1", 3, max_wait_seconds=0)) == jobs
+        assert AiJobQueueService.claim_batch(db, "w1", 3, max_wait_seconds=0) is None
+
+
+def test_claim_batch_groups_by_model_and_prompt_version(db_factory):
+    old = datetime.utcnow() - timedelta(minutes=5)
+    with db_factory() as db:
+        tenant = create_tenant(db)
+        a1 = create_job(db, tenant, created_at=old).id
+        b = create_job(db, tenant, created_at=old + timedelta(seconds=1), prompt_version="v2").id
+        c = create_job(db, tenant, created_at=old + timedelta(seconds=2), model_name="other").id
+        a2 = create_job(db, tenant, created_at=old + timedelta(seconds=3)).id
+        db.commit()
+
+        batches = [
+            _ids(AiJobQueueService.claim_batch(db, "w1", 3, max_wait_seconds=60)) for _ in range(3)
+        ]
+
+    assert batches == [{a1, a2}, {b}, {c}]
+
+
+def test_filling_group_does_not_block_the_groups_behind_it(db_factory):
+    now = datetime.utcnow()
+    with db_factory() as db:
+        tenant = create_tenant(db)
+        head = create_job(db, tenant, created_at=now - timedelta(seconds=2)).id
+        full = {
+            create_job(db, tenant, created_at=now - timedelta(seconds=1), prompt_version="v2").id
+            for _ in range(3)
+        }
+        db.commit()
+
+        assert _ids(AiJobQueueService.claim_batch(db, "w1", 3, max_wait_seconds=60)) == full
+        assert AiJobQueueService.claim_batch(db, "w1", 3, max_wait_seconds=60) == []
+        assert db.get(models.AIJob, head).status == PENDING
+
+
+def test_batch_outputs_fan_out_to_each_jobs_summary(db_factory):
+    with db_factory() as db:
+        tenant = create_tenant(db)
+        notes = [create_note(db, tenant, f"Not {i}: uyku sorunu.") for i in range(3)]
+        note_of_job = {create_job(db, tenant, note).id: note.id for note in notes}
+        db.commit()
+
+    provider = _BatchProvider()
+    worker = _worker(db_factory, provider)
+    with db_factory() as db:
+        batch = AiJobQueueService.claim_batch(db, worker.worker_id, 3, max_wait_seconds=60)
+        worker._process_batch(db, batch)
+        db.expire_all()
+        statuses = {job.id: job.status for job in db.scalars(select(models.AIJob))}
+        summaries = db.scalars(select(models.AISummary)).all()
+
+    assert provider.batch_sizes == [3]
+    assert (worker.batches, worker.batched_jobs, worker.completed) == (1, 3, 3)
+    assert set(statuses.values()) == {COMPLETED}
+    assert {s.job_id: s.source_note_id for s in summaries} == note_of_job
+    # Her iş kendi notunun özetini alır
+    contents = {note.id: note.content for note in notes}
+    assert all(s.summary_text == contents[s.source_note_id] for s in summaries)
+
+
+def test_output_count_mismatch_retries_the_whole_batch(db_factory):
+    with db_factory() as db:
+        tenant = create_tenant(db)
+        jobs = {create_job(db, tenant, create_note(db, tenant)).id for _ in range(3)}
+        db.commit()
+
+    worker = _worker(db_factory, _BatchProvider(drop_outputs=1))
+    with db_factory() as db:
+        batch = AiJobQueueService.claim_batch(db, worker.worker_id, 3, max_wait_seconds=60)
+        worker._process_batch(db, batch)
+        db.expire_all()
+        rows = db.scalars(select(models.AIJob).where(models.AIJob.id.in_(jobs))).all()
+        summaries = db.scalars(select(models.AISummary)).all()
+
+    assert {(job.status, job.attempts) for job in rows} == {(PENDING, 1)}
+    assert all("2 outputs for 3 requests" in job.error_message for job in rows)
+    assert summaries == []
+    assert (worker.retried, worker.completed, worker.batches) == (3, 0, 0)
@@ -0,0 +1,114 @@
+# tests/test_ai_job_dedup.py
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import update
+
+from app import models, schemas
+from app.services.ai_job_service import AiJobService
+from tests.factories import create_note, create_tenant
+
+
+@pytest.fixture
+def setup(db_factory):
+    db = db_factory()
+    tenant = create_tenant(db)
+    note = create_note(db, tenant)
+    owner = db.query(models.User).filter(models.User.tenant_id == tenant.id).one()
+    db.commit()
+    yield db, owner, note
+    db.close()
+
+
+def _request(note, prompt_version: str = "v1") -> schemas.AiJobCreate:
+    return schemas.AiJobCreate(
+        type=schemas.AiJobType.NOTE_SUMMARY,
+        input_ref_type="session_note",
+        input_ref_id=note.id,
+        model_name="fake",
+        prompt_version=prompt_version,
+    )
+
+
+def _complete(db, job, finished_at: datetime) -> None:
+    db.execute(
+        update(models.AIJob)
+        .where(models.AIJob.id == job.id)
+        .values(status=schemas.AiJobStatus.COMPLETED.value, finished_at=finished_at)
+    )
+    db.commit()
+
+
+def _edit_note(db, note, updated_at: datetime) -> None:
+    db.execute(
+        update(models.SessionNote)
+        .where(models.SessionNote.id == note.id)
+        .values(content="Düzeltilmiş not.", updated_at=updated_at)
+    )
+    db.commit()
+
+
+def test_inflight_job_is_reused(setup):
+    db, owner, note = setup
+    first, created = AiJobService.create_job(db, owner, _request(note))
+    second, created_again = AiJobService.create_job(db, owner, _request(note))
+
+    assert created and not created_again
+    assert second.id == first.id
+
+
+def test_recent_completed_job_is_reused_while_source_is_unchanged(setup):
+    db, owner, note = setup
+    _edit_note(db, note, datetime.utcnow() - timedelta(minutes=10))
+    job, _ = AiJobService.create_job(db, owner, _request(note))
+    _complete(db, job, datetime.utcnow() - timedelta(minutes=5))
+
+    again, created = AiJobService.create_job(db, owner, _request(note))
+
+    assert not created and again.id == job.id
+
+
+def test_completed_job_is_not_reused_after_source_was_edited(setup):
+    db, owner, note = setup
+    job, _ = AiJobService.create_job(db, owner, _request(note))
+    finished_at = datetime.utcnow() - timedelta(minutes=5)
+    _complete(db, job, finished_at)
+    _edit_note(db, note, finished_at + timedelta(minutes=1))
+
+    fresh, created = AiJobService.create_job(db, owner, _request(note))
+
+    assert created and fresh.id != job.id
+
+
+def test_idempotency_key_with_different_parameters_is_rejected(setup):
+    db, owner, note = setup
+    job, _ = AiJobService.create_job(db, owner, _request(note), idempotency_key="key-1")
+    same, created = AiJobService.create_job(db, owner, _request(note), idempotency_key="key-1")
+    assert not created and same.id == job.id
+
+    with pytest.raises(HTTPException) as exc:
+        AiJobService.create_job(db, owner, _request(note, prompt_version="v2"), idempotency_key="key-1")
+    assert exc.value.status_code == 422
+
+
+def test_concurrent_duplicate_falls_back_to_existing_job(setup, monkeypatch):
+    db, owner, note = setup
+    job, _ = AiJobService.create_job(db, owner, _request(note))
+
+    # Yarış: ikinci istek kontrolü ilk iş commit edilmeden yaptı (boş gördü)
+    find_duplicate = AiJobService._find_duplicate
+    calls = []
+
+    def racing_find_duplicate(*args):
+        calls.append(args)
+        return None if len(calls) == 1 else find_duplicate(*args)
+
+    monkeypatch.setattr(AiJobService, "_find_duplicate", staticmethod(racing_find_duplicate))
+    again, created = AiJobService.create_job(db, owner, _request(note))
+
+    # INSERT unique in-flight index'ine takıldı; mevcut iş döndü
+    assert len(calls) == 2
+    assert not created and again.id == job.id
+    assert db.query(models.AIJob).count() == 1
@@ -0,0 +1,154 @@
+# tests/test_ai_job_events.py
+
+import asyncio
+import json
+from contextlib import suppress
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.main import app
+from app.services.ai_job_events import MAX_PARTIAL_CHARS, AiJobEventBroker, broker, job_event
+
+
+def _job(job_id: int, tenant_id: int):
+    return SimpleNamespace(
+        id=job_id, tenant_id=tenant_id, type="NOTE_SUMMARY", status="RUNNING",
+        input_ref_type="session_note", input_ref_id=1,
+    )
+
+
+def test_long_partial_output_is_marked_truncated():
+    short = job_event(_job(1, 1), kind="partial", partial="Kısa özet.")
+    assert short["partial"] == "Kısa özet." and "truncated" not in short
+
+    long = job_event(_job(1, 1), kind="partial", partial="x" * (MAX_PARTIAL_CHARS + 1))
+    assert long["partial"] == "x" * MAX_PARTIAL_CHARS
+    assert long["truncated"] is True
+
+
+async def _collect(subscription) -> list:
+    items = []
+    while (item := await subscription.get(timeout=0.01)) is not None:
+        items.append(item)
+    return items
+
+
+def test_broker_filters_by_tenant_and_job():
+    async def scenario():
+        events = AiJobEventBroker(queue_size=10)
+        with events.subscribe(1) as tenant_one, events.subscribe(2) as tenant_two, \
+                events.subscribe(1, job_id=6) as single_job:
+            events.publish(job_event(_job(5, 1), "RUNNING"))
+            events.publish(job_event(_job(6, 1), "COMPLETED", summary_id=3))
+            events.publish(job_event(_job(7, 2), "RUNNING"))
+            # Tenant'sız olay (ör. listener yeniden bağlandı) herkese gider
+            events.publish({"event": "resync", "reason": "reconnect"})
+            received = [await _collect(sub) for sub in (tenant_one, tenant_two, single_job)]
+        return events, received
+
+    events, (tenant_one, tenant_two, single_job) = asyncio.run(scenario())
+
+    def ids(items):
+        return [item.get("job_id", item["event"]) for item in items]
+
+    assert ids(tenant_one) == [5, 6, "resync"]
+    assert ids(tenant_two) == [7, "resync"]
+    assert ids(single_job) == [6, "resync"]
+    assert tenant_one[1]["summary_id"] == 3
+    assert (events.published, events.delivered) == (4, 7)
+
+
+def test_slow_subscriber_gets_resync_after_overflow():
+    async def scenario():
+        events = AiJobEventBroker(queue_size=2)
+        with events.subscribe(1) as subscription:
+            for job_id in (1, 2, 3):
+                events.publish(job_event(_job(job_id, 1), "RUNNING"))
+            assert events.stats()["dropped"] == 1
+            return await _collect(subscription)
+
+    received = asyncio.run(scenario())
+
+    # En eski olay atılır; istemci önce resync alır, sonra kalan olayları
+    assert received[0] == {"event": "resync", "reason": "overflow"}
+    assert [item["job_id"] for item in received[1:]] == [2, 3]
+
+
+def _stream_token(client, headers) -> str:
+    r = client.post("/api/v1/ai-jobs/stream-token", headers=headers)
+    assert r.status_code == 200, r.text
+    return r.json()["stream_token"]
+
+
+async def _read_sse(path: str, count: int, publish) -> list:
+    """
+    Uygulamayı doğrudan ASGI ile çağırır (TestClient sonsuz akışı sonuna kadar
+    okumaya çalışır); akış açılınca publish() çalışır, ilk `count` olayın
+    data JSON'ları döner ve bağlantı kapatılır.
+    """
+    path, _, query = path.partition("?")
+    chunks = asyncio.Queue()
+    disconnected = asyncio.Event()
+    requested = False
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            await chunks.put(message.get("body", b"").decode())
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": query.encode(), "headers": [], "client": ("test", 1), "server": ("test", 80),
+    }
+    task = asyncio.create_task(app(scope, receive, send))
+    try:
+        assert await asyncio.wait_for(chunks.get(), 5) == "retry: 3000\n\n"
+        publish()
+        events = []
+        while len(events) < count:
+            chunk = await asyncio.wait_for(chunks.get(), 5)
+            events += [
+                json.loads(line[len("data: "):])
+                for line in chunk.splitlines() if line.startswith("data: ")
+            ]
+        return events
+    finally:
+        disconnected.set()
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+def test_sse_streams_status_and_partial_events_of_own_tenant(client, register, monkeypatch):
+    monkeypatch.setattr(settings, "AI_JOB_EVENTS_KEEPALIVE_SECONDS", 0.05)
+    # Önceki testlerin kapanmış loop'u yerine akışın loop'u kullanılsın
+    monkeypatch.setattr(broker, "_loop", None)
+    me, headers = register()
+    other, _ = register()
+    tenant_id = me["tenant_id"]
+    token = _stream_token(client, headers)
+
+    def publish():
+        # Başka tenant'ın olayı bu akışa düşmez
+        broker.publish(job_event(_job(100, other["tenant_id"]), "RUNNING"))
+        broker.publish(job_event(_job(101, tenant_id), "RUNNING"))
+        broker.publish(job_event(_job(101, tenant_id), kind="partial", partial="Danışan uyku"))
+        broker.publish(job_event(_job(101, tenant_id), "COMPLETED", summary_id=9))
+
+    status, partial, completed = asyncio.run(
+        _read_sse(f"/api/v1/ai-jobs/events?stream_token={token}", 3, publish)
+    )
+
+    assert (status["event"], status["job_id"], status["status"]) == ("status", 101, "RUNNING")
+    assert (partial["event"], partial["partial"]) == ("partial", "Danışan uyku")
+    assert (completed["status"], completed["summary_id"]) == ("COMPLETED", 9)
@@ -0,0 +1,150 @@
+# tests/test_ai_job_queue.py
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+
+from app import models
+from app.core.config import settings
+from app.services.ai_job_queue_service import COMPLETED, FAILED, PENDING, RUNNING, AiJobQueueService
+from app.services.ai_provider import FakeModelProvider, ModelOutput
+from app.worker import AiJobWorker
+from tests.factories import create_job, create_note, create_tenant
+
+OUTPUT = ModelOutput(summary_text="Özet.", key_points=["Özet."])
+
+
+@pytest.fixture
+def Session(db_factory):
+    return db_factory
+
+
+def _expire_leases(db) -> None:
+    db.execute(
+        update(models.AIJob)
+        .where(models.AIJob.status == RUNNING)
+        .values(lease_expires_at=datetime.utcnow() - timedelta(seconds=1))
+    )
+    db.commit()
+
+
+def _job(db, job_id: int) -> models.AIJob:
+    db.expire_all()
+    return db.get(models.AIJob, job_id)
+
+
+def _worker(Session, provider=None) -> AiJobWorker:
+    return AiJobWorker(
+        session_factory=Session,
+        provider=provider or FakeModelProvider(latency_seconds=0),
+        concurrency=1,
+        use_cache=False,
+        batch_size=1,
+    )
+
+
+def test_claimed_job_completes_exactly_once(Session):
+    with Session() as db:
+        tenant = create_tenant(db)
+        job_id = create_job(db, tenant, create_note(db, tenant)).id
+        db.commit()
+
+        [claimed] = AiJobQueueService.claim_jobs(db, "w1", 5)
+        assert claimed.id == job_id and claimed.attempts == 1
+        # Kiralanmış iş ikinci kez alınamaz
+        assert AiJobQueueService.claim_jobs(db, "w2", 5) == []
+
+        session_id = db.query(models.Session.id).scalar()
+        assert AiJobQueueService.complete_job(db, claimed, "w1", OUTPUT, session_id, None)
+        assert not AiJobQueueService.complete_job(db, claimed, "w1", OUTPUT, session_id, None)
+
+        assert _job(db, job_id).status == COMPLETED
+        assert db.scalar(select(func.count()).select_from(models.AISummary)) == 1
+
+
+def test_expired_lease_is_requeued_then_failed_at_max_attempts(Session):
+    with Session() as db:
+        tenant = create_tenant(db)
+        job_id = create_job(db, tenant, create_note(db, tenant)).id
+        db.commit()
+
+        AiJobQueueService.claim_jobs(db, "w1", 1)
+        _expire_leases(db)
+        assert AiJobQueueService.requeue_expired(db, max_attempts=2) == (1, 0)
+        job = _job(db, job_id)
+        assert (job.status, job.worker_id, job.attempts) == (PENDING, None, 1)
+
+        [claimed] = AiJobQueueService.claim_jobs(db, "w2", 1)
+        assert claimed.attempts == 2
+        _expire_leases(db)
+        assert AiJobQueueService.requeue_expired(db, max_attempts=2) == (0, 1)
+        job = _job(db, job_id)
+        assert job.status == FAILED
+        assert job.error_message == "Lease expired too many times."
+
+        # Kapanmış iş tekrar alınmaz
+        assert AiJobQueueService.claim_jobs(db, "w3", 1) == []
+
+
+def test_worker_that_lost_its_lease_cannot_write(Session):
+    with Session() as db:
+        tenant = create_tenant(db)
+        job_id = create_job(db, tenant, create_note(db, tenant)).id
+        db.commit()
+        session_id = db.query(models.Session.id).scalar()
+
+        [stale] = AiJobQueueService.claim_jobs(db, "w1", 1)
+        _expire_leases(db)
+        AiJobQueueService.requeue_expired(db)
+        [current] = AiJobQueueService.claim_jobs(db, "w2", 1)
+
+        assert AiJobQueueService.heartbeat(db, "w1", [job_id]) == set()
+        assert not AiJobQueueService.complete_job(db, stale, "w1", OUTPUT, session_id, None)
+        assert AiJobQueueService.fail_job(db, stale, "w1", "boom", retry=True) is None
+        job = _job(db, job_id)
+        assert (job.status, job.worker_id) == (RUNNING, "w2")
+
+        assert AiJobQueueService.complete_job(db, current, "w2", OUTPUT, session_id, None)
+        assert db.scalar(select(func.count()).select_from(models.AISummary)) == 1
+
+
+def test_missing_input_fails_without_retry(Session):
+    with Session() as db:
+        tenant = create_tenant(db)
+        job_id = create_job(db, tenant, note=None).id
+        db.commit()
+
+    worker = _worker(Session)
+    with Session() as db:
+        [claimed] = AiJobQueueService.claim_jobs(db, worker.worker_id, 1)
+        worker._process(db, claimed)
+        job = _job(db, job_id)
+
+    assert (job.status, job.attempts) == (FAILED, 1)
+    assert job.error_message == "Session note not found."
+    assert (worker.failed, worker.retried) == (1, 0)
+
+
+class _FailingProvider(FakeModelProvider):
+    def generate_streaming(self, request, on_partial):
+        raise RuntimeError("model unavailable")
+
+
+def test_provider_errors_are_retried_until_max_attempts(Session, monkeypatch):
+    monkeypatch.setattr(settings, "AI_JOB_MAX_ATTEMPTS", 2)
+    with Session() as db:
+        tenant = create_tenant(db)
+        job_id = create_job(db, tenant, create_note(db, tenant)).id
+        db.commit()
+
+    worker = _worker(Session, provider=_FailingProvider(latency_seconds=0))
+    statuses = []
+    with Session() as db:
+        for _ in range(2):
+            [claimed] = AiJobQueueService.claim_jobs(db, worker.worker_id, 1)
+            worker._process(db, claimed)
+            statuses.append(_job(db, job_id).status)
+
+    assert statuses == [PENDING, FAILED]
+    assert (worker.retried, worker.failed) == (1, 1)
@@ -0,0 +1,111 @@
+# tests/test_ai_job_scheduling.py
+
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.services.ai_job_queue_service import AiJobQueueService
+from tests.factories import create_job, create_tenant
+
+
+@pytest.fixture(autouse=True)
+def fair_scheduler(monkeypatch):
+    monkeypatch.setattr(settings, "AI_JOB_SCHEDULER", "fair")
+    # Aday kesme noktası (per-group cutoff) da test edilsin
+    monkeypatch.setattr(settings, "AI_JOB_FAIR_CANDIDATES_PER_GROUP", 2)
+
+
+def _backlog(db, tenant, count: int, priority: str = "INTERACTIVE", start: datetime = None) -> list:
+    start = start or datetime.utcnow() - timedelta(minutes=10)
+    return [
+        create_job(db, tenant, priority=priority, created_at=start + timedelta(seconds=i)).id
+        for i in range(count)
+    ]
+
+
+def _claim_one_by_one(db, n: int) -> list:
+    claimed = []
+    for _ in range(n):
+        claimed.extend(AiJobQueueService.claim_jobs(db, "w1", 1))
+    return claimed
+
+
+def test_interactive_jobs_are_claimed_before_older_batch_jobs(db_factory):
+    with db_factory() as db:
+        backfill, user = create_tenant(db, weight=4), create_tenant(db)
+        batch = _backlog(db, backfill, 5, priority="BATCH", start=datetime.utcnow() - timedelta(hours=2))
+        interactive = _backlog(db, user, 2)
+        db.commit()
+
+        first = AiJobQueueService.claim_jobs(db, "w1", 2)
+        second = AiJobQueueService.claim_jobs(db, "w1", 1)
+
+    # RETURNING satır sırası garanti değil; kümeler karşılaştırılır
+    assert {row.id for row in first} == set(interactive)
+    assert [row.id for row in second] == batch[:1]
+
+
+def test_claims_follow_plan_weights(db_factory):
+    with db_factory() as db:
+        tenants = {weight: create_tenant(db, weight=weight) for weight in (1, 2, 4)}
+        for tenant in tenants.values():
+            _backlog(db, tenant, 20)
+        db.commit()
+        by_tenant = {tenant.id: weight for weight, tenant in tenants.items()}
+
+        # Tek claim içinde sanal zamana göre: 1 / 2 / 4
+        shares = Counter(by_tenant[row.tenant_id] for row in AiJobQueueService.claim_jobs(db, "w1", 7))
+        assert shares == {1: 1, 2: 2, 4: 4}
+
+        # Ardışık claim'lerde pencere içindeki kullanım da sayılır
+        shares += Counter(by_tenant[row.tenant_id] for row in _claim_one_by_one(db, 7))
+        assert shares == {1: 2, 2: 4, 4: 8}
+
+
+def test_jobs_within_a_tenant_are_claimed_in_creation_order(db_factory):
+    with db_factory() as db:
+        tenant = create_tenant(db)
+        ids = _backlog(db, tenant, 6)
+        db.commit()
+
+        assert [row.id for row in _claim_one_by_one(db, 6)] == ids
+
+
+def test_tenant_without_subscription_gets_default_weight(db_factory, monkeypatch):
+    monkeypatch.setattr(settings, "AI_JOB_DEFAULT_WEIGHT", 3)
+    with db_factory() as db:
+        unsubscribed, subscribed = create_tenant(db), create_tenant(db, weight=1)
+        for tenant in (unsubscribed, subscribed):
+            _backlog(db, tenant, 10)
+        db.commit()
+
+        shares = Counter(row.tenant_id for row in _claim_one_by_one(db, 8))
+
+    assert shares == {unsubscribed.id: 6, subscribed.id: 2}
+
+
+def test_queue_stats_reports_waits_and_pending_per_priority(db_factory):
+    now = datetime.utcnow()
+    with db_factory() as db:
+        tenant = create_tenant(db)
+        for wait in (1, 2, 3, 10):
+            create_job(
+                db, tenant, status="COMPLETED",
+                created_at=now - timedelta(minutes=5), started_at=now - timedelta(minutes=5) + timedelta(seconds=wait),
+            )
+        create_job(db, tenant, priority="BATCH", created_at=now - timedelta(seconds=30))
+        create_job(db, tenant, priority="BATCH", created_at=now - timedelta(seconds=5))
+        db.commit()
+
+        stats = AiJobQueueService.queue_stats(db, since=now - timedelta(hours=1))
+        other = AiJobQueueService.queue_stats(db, since=now - timedelta(hours=1), tenant_id=tenant.id + 1)
+
+    assert other == []
+    batch, interactive = stats
+    assert (batch["priority"], batch["pending"], batch["started"], batch["wait_seconds"]) == ("BATCH", 2, 0, None)
+    assert 30 <= batch["oldest_pending_seconds"] < 40
+    assert (interactive["priority"], interactive["pending"], interactive["started"]) == ("INTERACTIVE", 0, 4)
+    assert interactive["oldest_pending_seconds"] is None
+    assert interactive["wait_seconds"] == {"avg": 4.0, "p50": 2.0, "p95": 10.0, "max": 10.0}
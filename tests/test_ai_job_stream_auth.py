@@ -0,0 +1,67 @@
+# tests/test_ai_job_stream_auth.py
+
+import asyncio
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app.core.config import settings
+from app.core.middleware import RequestContextMiddleware, redact_query_string
+
+
+def _stream_token(client, headers) -> str:
+    r = client.post("/api/v1/ai-jobs/stream-token", headers=headers)
+    assert r.status_code == 200, r.text
+    assert r.json()["expires_in"] == settings.AI_JOB_STREAM_TOKEN_EXPIRE_SECONDS
+    return r.json()["stream_token"]
+
+
+def test_stream_rejects_access_token_in_query(client, register):
+    _, headers = register()
+    access_token = headers["Authorization"].split(" ", 1)[1]
+
+    for param in ("stream_token", "access_token"):
+        r = client.get(f"/api/v1/ai-jobs/events?{param}={access_token}")
+        assert r.status_code == 401
+
+
+def test_stream_token_is_not_an_access_token(client, register):
+    _, headers = register()
+    stream_token = _stream_token(client, headers)
+
+    r = client.get("/api/v1/ai-jobs/", headers={"Authorization": f"Bearer {stream_token}"})
+    assert r.status_code == 401
+
+
+def test_websocket_accepts_stream_token(client, register, monkeypatch):
+    monkeypatch.setattr(settings, "AI_JOB_EVENTS_KEEPALIVE_SECONDS", 0.05)
+    _, headers = register()
+    stream_token = _stream_token(client, headers)
+
+    with client.websocket_connect(f"/api/v1/ai-jobs/ws?stream_token={stream_token}") as ws:
+        assert ws.receive_json() == {"event": "ping"}
+
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/api/v1/ai-jobs/ws?stream_token=invalid") as ws:
+            ws.receive_json()
+
+
+def test_query_tokens_are_redacted_once_response_starts():
+    assert redact_query_string(b"job_id=5&stream_token=abc.def") == b"job_id=5&stream_token=REDACTED"
+    assert redact_query_string(b"limit=10") == b"limit=10"
+
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["during"] = scope["query_string"]
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def noop_send(message):
+        pass
+
+    scope = {"type": "http", "method": "GET", "path": "/", "query_string": b"access_token=secret"}
+    asyncio.run(RequestContextMiddleware(app)(scope, None, noop_send))
+
+    assert seen["during"] == b"access_token=secret"
+    assert scope["query_string"] == b"access_token=REDACTED"
@@ -0,0 +1,174 @@
+# tests/test_ai_summary_cache.py
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+
+from app import models
+from app.services.ai_job_queue_service import COMPLETED, AiJobQueueService
+from app.services.ai_provider import FakeModelProvider, ModelOutput
+from app.services.ai_summary_cache_service import AiSummaryCacheService, cache_key, normalize_content
+from app.worker import AiJobWorker
+from tests.factories import create_job, create_note, create_tenant
+
+OUTPUT = ModelOutput(summary_text="Özet.", key_points=["Özet."])
+
+
+class _CountingProvider(FakeModelProvider):
+    def __init__(self):
+        super().__init__(latency_seconds=0, batch_item_latency_seconds=0)
+        self.calls = 0
+
+    def generate(self, request):
+        self.calls += 1
+        return super().generate(request)
+
+    def generate_streaming(self, request, on_partial):
+        self.calls += 1
+        return super().generate_streaming(request, on_partial)
+
+    def generate_batch(self, requests):
+        self.calls += 1
+        return super().generate_batch(requests)
+
+
+def _worker(Session, provider) -> AiJobWorker:
+    return AiJobWorker(
+        session_factory=Session, provider=provider, concurrency=1, use_cache=True, batch_size=1,
+    )
+
+
+def _entries(db, tenant_id: int) -> list:
+    return db.scalars(
+        select(models.AISummaryCache.cache_key)
+        .where(models.AISummaryCache.tenant_id == tenant_id)
+        .order_by(models.AISummaryCache.cache_key)
+    ).all()
+
+
+def test_normalize_content_ignores_whitespace_and_unicode_form():
+    a = "Danışan  uyku sorunlarını anlattı.\r\n\r\n\r\n\tİlaç yok. "
+    b = "Danışan uyku sorunlarını anlattı.\n\nİlaç yok."
+    assert normalize_content(a) == b
+    # NFD (e + birleşik vurgu) ile NFC aynı metin
+    assert normalize_content("Cafe\u0301") == normalize_content("Caf\u00e9")
+    # Büyük / küçük harf anlam taşıyabilir, korunur
+    assert normalize_content("Ilaç") != normalize_content("ilaç")
+
+
+def test_cache_key_is_stable_and_separates_model_and_prompt():
+    key = cache_key("NOTE_SUMMARY", "Not  metni.\r\n", "fake", "v1")
+    assert key == cache_key("NOTE_SUMMARY", "Not metni.", "fake", "v1")
+    assert len(key) == 64
+
+    others = {
+        cache_key("SESSION_SUMMARY", "Not metni.", "fake", "v1"),
+        cache_key("NOTE_SUMMARY", "Not metni.", "other", "v1"),
+        cache_key("NOTE_SUMMARY", "Not metni.", "fake", "v2"),
+        cache_key("NOTE_SUMMARY", "Not metni!", "fake", "v1"),
+        # Alan sınırları ayırıcıyla korunur: ("fa", "kev1") ≠ ("fake", "v1")
+        cache_key("NOTE_SUMMARY", "Not metni.", "fa", "kev1"),
+    }
+    assert key not in others and len(others) == 5
+
+
+def test_cache_hit_skips_the_provider(db_factory):
+    with db_factory() as db:
+        tenant = create_tenant(db)
+        first = create_job(db, tenant, create_note(db, tenant, "Uyku  sorunu.")).id
+        db.commit()
+
+    provider = _CountingProvider()
+    worker = _worker(db_factory, provider)
+    with db_factory() as db:
+        [job] = AiJobQueueService.claim_jobs(db, worker.worker_id, 1)
+        worker._process(db, job)
+        assert provider.calls == 1
+        assert len(_entries(db, tenant.id)) == 1
+
+        # Yalnızca boşlukta farklı ikinci not aynı anahtarı alır
+        second = create_job(db, tenant, create_note(db, tenant, "Uyku sorunu.\n")).id
+        db.commit()
+        [job] = AiJobQueueService.claim_jobs(db, worker.worker_id, 1)
+        worker._process(db, job)
+
+        db.expire_all()
+        jobs = {job.id: job for job in db.scalars(select(models.AIJob))}
+        entry = db.scalar(select(models.AISummaryCache))
+
+    assert provider.calls == 1
+    assert (worker.cache_hits, worker.cache_misses, worker.completed) == (1, 1, 2)
+    assert (jobs[first].status, jobs[first].cache_hit) == (COMPLETED, False)
+    assert (jobs[second].status, jobs[second].cache_hit) == (COMPLETED, True)
+    assert entry.hit_count == 1
+
+
+def test_cache_is_tenant_scoped(db_factory):
+    with db_factory() as db:
+        tenant, other = create_tenant(db), create_tenant(db)
+        db.commit()
+        key = cache_key("NOTE_SUMMARY", "Ortak metin.", "fake", "v1")
+        assert AiSummaryCacheService.store(db, tenant.id, key, OUTPUT)
+        # Aynı anahtarı ikinci yazan sessizce atlanır
+        assert not AiSummaryCacheService.store(db, tenant.id, key, OUTPUT)
+
+        assert AiSummaryCacheService.lookup(db, tenant.id, key) == OUTPUT
+        assert AiSummaryCacheService.lookup(db, other.id, key) is None
+
+
+def test_evict_removes_expired_then_least_recently_used(db_factory):
+    now = datetime.utcnow()
+    with db_factory() as db:
+        tenant, other = create_tenant(db), create_tenant(db)
+        db.commit()
+        for name, tenant_id, days_ago in [
+            ("expired", tenant.id, 40), ("old", tenant.id, 5), ("mid", tenant.id, 2),
+            ("new", tenant.id, 1), ("other", other.id, 5),
+        ]:
+            AiSummaryCacheService.store(db, tenant_id, name, OUTPUT)
+            db.execute(
+                update(models.AISummaryCache)
+                .where(models.AISummaryCache.cache_key == name)
+                .values(last_used_at=now - timedelta(days=days_ago))
+            )
+        db.commit()
+
+        # "old" kullanıldığında sıranın başına geçer; en uzun süredir kullanılmayan "mid" olur
+        assert AiSummaryCacheService.lookup(db, tenant.id, "old") is not None
+
+        assert AiSummaryCacheService.evict(db, ttl_days=30, max_entries_per_tenant=2) == (1, 1)
+        assert _entries(db, tenant.id) == ["new", "old"]
+        assert _entries(db, other.id) == ["other"]
+
+        # 0 sınırları kapatır
+        assert AiSummaryCacheService.evict(db, ttl_days=0, max_entries_per_tenant=0) == (0, 0)
+
+
+@pytest.mark.parametrize("tenant_filter", [False, True])
+def test_hit_rates(db_factory, tenant_filter):
+    now = datetime.utcnow()
+    with db_factory() as db:
+        tenant, other = create_tenant(db), create_tenant(db)
+        for target, cache_hit, finished_at in [
+            (tenant, True, now), (tenant, True, now), (tenant, False, now),
+            # Cache kapalıyken tamamlanan ve pencere dışındaki işler sayılmaz
+            (tenant, None, now), (tenant, True, now - timedelta(days=2)),
+            (other, False, now),
+        ]:
+            create_job(db, target, status=COMPLETED, cache_hit=cache_hit, finished_at=finished_at)
+        db.commit()
+        AiSummaryCacheService.store(db, tenant.id, "k1", OUTPUT)
+
+        rates = AiSummaryCacheService.hit_rates(
+            db, since=now - timedelta(hours=1), tenant_id=tenant.id if tenant_filter else None,
+        )
+
+    expected = [
+        {"tenant_id": tenant.id, "lookups": 3, "hits": 2, "misses": 1, "hit_rate": 0.6667, "entries": 1},
+    ]
+    if not tenant_filter:
+        expected.append(
+            {"tenant_id": other.id, "lookups": 1, "hits": 0, "misses": 1, "hit_rate": 0.0, "entries": 0}
+        )
+    assert rates == expected
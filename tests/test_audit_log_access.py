@@ -0,0 +1,46 @@
+# tests/test_audit_log_access.py
+
+import pytest
+
+
+@pytest.fixture
+def audited_tenant(client, register):
+    """
+    Audit kaydı olan bir tenant: (owner header'ı, en yeni audit kaydı).
+    """
+    _, headers = register()
+    r = client.post("/api/v1/clients/", headers=headers, json={
+        "first_name": "Ayşe", "last_name": "Yılmaz", "status": "ACTIVE",
+    })
+    assert r.status_code == 201, r.text
+    logs = client.get("/api/v1/audit-logs/", headers=headers).json()
+    assert logs
+    return headers, logs[0]
+
+
+def _paths(log: dict) -> list:
+    return [
+        "/api/v1/audit-logs/",
+        f"/api/v1/audit-logs/entities/{log['entity_type']}/{log['entity_id']}",
+        f"/api/v1/audit-logs/{log['id']}",
+    ]
+
+
+@pytest.mark.parametrize("role", ["STAFF", "PRACTITIONER", "ASSISTANT"])
+def test_non_owner_cannot_read_audit_logs(client, audited_tenant, create_member, role):
+    owner_headers, log = audited_tenant
+    _, headers = create_member(owner_headers, role=role)
+    for path in _paths(log):
+        assert client.get(path, headers=headers).status_code == 403, path
+
+
+def test_owner_can_read_audit_logs(client, audited_tenant):
+    owner_headers, log = audited_tenant
+    for path in _paths(log):
+        assert client.get(path, headers=owner_headers).status_code == 200, path
+
+
+def test_other_tenant_owner_cannot_read_audit_log(client, audited_tenant, register):
+    _, log = audited_tenant
+    _, other_headers = register()
+    assert client.get(f"/api/v1/audit-logs/{log['id']}", headers=other_headers).status_code == 404
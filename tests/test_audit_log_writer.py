@@ -0,0 +1,40 @@
+# tests/test_audit_log_writer.py
+
+import json
+from datetime import datetime
+
+from sqlalchemy import create_engine, func, select
+
+from app import models
+from app.database import Base
+from app.services.audit_log_writer import AuditLogWriter
+
+
+def _row(i, action="UPDATE"):
+    return {
+        "tenant_id": 1, "user_id": None, "entity_type": "client", "entity_id": i,
+        "action": action, "changes": {"n": i}, "created_at": datetime(2024, 1, 1),
+    }
+
+
+def test_bad_row_is_dead_lettered_and_rest_is_written(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    Base.metadata.create_all(bind=engine, tables=[models.AuditLog.__table__])
+    dead_letter = tmp_path / "dead.jsonl"
+    writer = AuditLogWriter(
+        bind=engine, batch_size=100, flush_interval=0.01, max_queue=100,
+        max_attempts=2, dead_letter_path=str(dead_letter),
+    )
+
+    # action NOT NULL: tek satır tüm batch'in INSERT'ünü bozar
+    batch = [_row(i) for i in range(10)]
+    batch[3] = _row(3, action=None)
+    writer._write_with_retry(batch)
+
+    with engine.connect() as conn:
+        written = conn.execute(select(func.count()).select_from(models.AuditLog)).scalar()
+    assert written == 9
+    assert writer.stats()["dead_lettered"] == 1
+    lines = dead_letter.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["entity_id"] for line in lines] == [3]
+    engine.dispose()
@@ -0,0 +1,37 @@
+# tests/test_exports.py
+
+import csv
+import io
+import json
+from datetime import datetime
+
+from app import models, schemas
+from app.services.export_service import ExportService
+
+
+def test_csv_writes_json_columns_as_json(session_factory):
+    changes = {"before": {"full_name": "Ayşe"}, "after": {"full_name": "Ayşe Yılmaz"}, "tags": [1, 2]}
+    with session_factory() as db:
+        tenant = models.Tenant(name="Export Klinik")
+        db.add(tenant)
+        db.flush()
+        db.add(models.AuditLog(
+            tenant_id=tenant.id,
+            entity_type="client",
+            entity_id=1,
+            action="UPDATE",
+            changes=changes,
+            created_at=datetime(2024, 5, 1, 12, 0),
+        ))
+        db.commit()
+        tenant_id = tenant.id
+
+    body = "".join(ExportService.stream(
+        session_factory, tenant_id, schemas.ExportEntity.AUDIT_LOGS, schemas.ExportFormat.CSV,
+    ))
+
+    rows = list(csv.DictReader(io.StringIO(body)))
+    assert len(rows) == 1
+    assert json.loads(rows[0]["changes"]) == changes
+    assert "Ayşe Yılmaz" in rows[0]["changes"]
+    assert rows[0]["created_at"] == "2024-05-01T12:00:00"
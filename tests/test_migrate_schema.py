@@ -0,0 +1,46 @@
+# tests/test_migrate_schema.py
+
+from datetime import datetime
+
+from sqlalchemy import create_engine, inspect, insert, text
+
+from app import models
+from scripts.migrate_schema import migrate
+
+
+def _job(job_id: int) -> dict:
+    return {
+        "id": job_id,
+        "tenant_id": 1,
+        "type": "SUMMARY",
+        "status": "PENDING",
+        "input_ref_type": "session_note",
+        "input_ref_id": 7,
+        "created_at": datetime(2024, 1, 1, 0, job_id),
+    }
+
+
+def test_migrate_adds_missing_columns_and_closes_duplicates(tmp_path):
+    bind = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    migrate(bind)
+
+    # Eski şema: is_system_admin kolonu ve tekil in-flight index'i yok, çift işler var
+    with bind.begin() as conn:
+        conn.execute(text("DROP INDEX ix_ai_jobs_dedup_inflight"))
+        conn.execute(text("ALTER TABLE users DROP COLUMN is_system_admin"))
+        conn.execute(insert(models.AIJob.__table__), [_job(1), _job(2)])
+
+    result = migrate(bind)
+
+    assert "is_system_admin" in {c["name"] for c in inspect(bind).get_columns("users")}
+    assert result["closed_duplicate_jobs"] == 1
+    with bind.connect() as conn:
+        # İfade içeren index'ler reflection'da görünmez
+        assert conn.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'ix_ai_jobs_dedup_inflight'"
+        )).scalar()
+        statuses = conn.execute(text("SELECT id, status FROM ai_jobs ORDER BY id")).all()
+    assert [tuple(r) for r in statuses] == [(1, "PENDING"), (2, "FAILED")]
+
+    # Tekrar çalıştırılabilir
+    assert migrate(bind)["closed_duplicate_jobs"] == 0
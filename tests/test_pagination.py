@@ -0,0 +1,38 @@
+# tests/test_pagination.py
+
+from app.core.pagination import DEFAULT_PAGE_LIMIT, NEXT_CURSOR_HEADER
+
+
+def _create_clients(client, headers, count):
+    for i in range(count):
+        r = client.post("/api/v1/clients/", headers=headers, json={
+            "first_name": f"Danışan{i:03d}", "last_name": "Test", "status": "ACTIVE",
+        })
+        assert r.status_code == 201, r.text
+
+
+def test_list_without_limit_or_cursor_returns_everything(client, register):
+    _, headers = register()
+    _create_clients(client, headers, DEFAULT_PAGE_LIMIT + 5)
+
+    r = client.get("/api/v1/clients/", headers=headers)
+    assert r.status_code == 200
+    assert len(r.json()) == DEFAULT_PAGE_LIMIT + 5
+    assert NEXT_CURSOR_HEADER not in r.headers
+
+
+def test_limit_opts_into_keyset_pages(client, register):
+    _, headers = register()
+    _create_clients(client, headers, 12)
+
+    seen = []
+    r = client.get("/api/v1/clients/", headers=headers, params={"limit": 5})
+    while True:
+        assert r.status_code == 200
+        seen.extend(c["id"] for c in r.json())
+        cursor = r.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+        r = client.get("/api/v1/clients/", headers=headers, params={"limit": 5, "cursor": cursor})
+
+    assert len(seen) == len(set(seen)) == 12
@@ -0,0 +1,109 @@
+# tests/test_query_plans.py
+#
+# Tenant'a göre filtrelenen liste sorgularının beklenen index'i kullandığını
+# SQLite EXPLAIN QUERY PLAN ile doğrular (scripts.check_query_plans'ın seed ve
+# analizini kullanır). Postgres planları için script'i --database-url ile çalıştırın.
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from scripts.check_query_plans import (
+    _get_cases,
+    _list_cases,
+    capture_selects,
+    check_plans,
+    plan_check_engine,
+    seed,
+)
+
+TENANTS = 3
+ROWS = 600
+
+# Liste sorgusunun ilk sayfasında okunması gereken index
+EXPECTED_INDEXES = {
+    "ClientService.list_clients": "ix_clients_tenant_name",
+    "SessionService.list_sessions": "ix_sessions_tenant_occurred_at",
+    "AppointmentService.list_appointments": "ix_appointments_tenant_starts_at",
+    "AppointmentService.list_appointments[practitioner]": "ix_appointments_tenant_practitioner_starts_at",
+    "AppointmentService.list_appointments[client]": "ix_appointments_tenant_client_starts_at",
+    "ReportService.list_reports": "ix_reports_tenant_created_at",
+    "ReportService.list_reports[client]": "ix_reports_tenant_client_created_at",
+    "ReportService.list_reports[practitioner]": "ix_reports_tenant_practitioner_created_at",
+    "AuditLogService.list_logs": "ix_audit_logs_tenant_created_at",
+    "AuditLogService.list_logs[user]": "ix_audit_logs_tenant_user_created_at",
+    "AuditLogService.list_logs[action, range]": "ix_audit_logs_tenant_action_created_at",
+    "AuditLogService.get_entity_history": "ix_audit_logs_tenant_entity_created_at",
+    "AiJobService.list_jobs": "ix_ai_jobs_tenant_created_at",
+    "AiSummaryService.list_summaries": "ix_ai_summaries_tenant_created_at",
+    "AiSummaryService.list_summaries[session]": "ix_ai_summaries_tenant_session_created_at",
+    "SessionNoteService.list_notes": "ix_session_notes_session_created_at",
+    "SessionNoteService.list_notes[session]": "ix_session_notes_session_created_at",
+    "ClientConsentService.list_consents": "ix_client_consents_client_created_at",
+    "ClientConsentService.list_consents[client]": "ix_client_consents_client_created_at",
+    "PractitionerService.list_profiles": "ix_users_tenant_id",
+    "SubscriptionService.list_subscriptions": "ix_subscriptions_tenant_starts_at",
+    "UserService.list_users": "ix_users_tenant_id",
+}
+
+
+@pytest.fixture(scope="module")
+def plans():
+    """
+    Liste sorgularının etiketleri, etiket başına ilk sorgunun plan satırları ve
+    büyük bir tabloyu index'siz okuyan sorgular.
+    """
+    with plan_check_engine(None) as engine:
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        with Session() as db:
+            ctx = seed(db, TENANTS, ROWS)
+        with engine.connect() as conn:
+            conn.execute(text("ANALYZE"))
+            conn.commit()
+
+        statements = []
+        with Session() as db:
+            for label, fn in _list_cases(ctx):
+                with capture_selects(engine) as captured:
+                    page = fn(db, None)
+                    # İkinci sayfa (cursor'lı) sorgusu da kontrol edilir
+                    if page.next_cursor:
+                        fn(db, page.next_cursor)
+                statements += [(label, sql, params) for sql, params in captured]
+                db.expunge_all()
+            for label, fn in _get_cases(ctx):
+                with capture_selects(engine) as captured:
+                    fn(db)
+                statements += [(label, sql, params) for sql, params in captured]
+
+        first_plans = {}
+        with engine.connect() as conn:
+            for label, sql, params in statements:
+                if label not in first_plans:
+                    rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql, params).all()
+                    first_plans[label] = [row[-1] for row in rows]
+
+        large_tables = {name for name, count in ctx["counts"].items() if count >= ROWS}
+        failures = check_plans(engine, statements, large_tables, ctx)
+
+    return {
+        "list_labels": [label for label, _ in _list_cases(ctx)],
+        "first_plans": first_plans,
+        "failures": failures,
+    }
+
+
+def test_every_list_query_has_an_expected_index(plans):
+    assert sorted(plans["list_labels"]) == sorted(EXPECTED_INDEXES)
+
+
+@pytest.mark.parametrize("label", sorted(EXPECTED_INDEXES))
+def test_list_query_uses_expected_index(plans, label):
+    details = plans["first_plans"][label]
+    assert any(f"INDEX {EXPECTED_INDEXES[label]} " in detail for detail in details), details
+
+
+def test_no_query_reads_a_large_table_without_an_index(plans):
+    assert [(label, problems) for label, _sql, problems in plans["failures"]] == []
@@ -0,0 +1,30 @@
+# tests/test_sql_instrumentation.py
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.sql_instrumentation import (
+    install_sql_instrumentation,
+    start_request_stats,
+    stop_request_stats,
+)
+
+
+def test_failed_statements_do_not_leave_timing_state():
+    install_sql_instrumentation()
+    engine = create_engine("sqlite://")
+    stats, token = start_request_stats()
+    try:
+        with engine.connect() as conn:
+            for _ in range(3):
+                with pytest.raises(OperationalError):
+                    conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+            info = dict(conn.info)
+    finally:
+        stop_request_stats(token)
+
+    # Hata veren ifadeler sayılmaz ve bağlantıda zaman kaydı bırakmaz
+    assert stats.count == 1
+    assert not any("start" in key for key in info)
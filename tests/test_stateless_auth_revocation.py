@@ -0,0 +1,60 @@
+# tests/test_stateless_auth_revocation.py
+
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.core.security import decode_access_token
+from app.services.token_revocation_service import TokenRevocationService, revocation_list
+
+
+@pytest.fixture(autouse=True)
+def stateless_reads(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_STATELESS_READS", True)
+
+
+def _login(client, email: str) -> dict:
+    r = client.post("/api/v1/auth/login", data={"username": email, "password": "secret123"})
+    assert r.status_code == 200, r.text
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+def test_role_change_revokes_tokens_carrying_the_old_role(client, register, create_member):
+    _, owner = register()
+    member, old_headers = create_member(owner, role="STAFF")
+    assert client.get("/api/v1/clients/", headers=old_headers).status_code == 200
+
+    r = client.patch(f"/api/v1/users/{member['id']}", headers=owner, json={"role": "PRACTITIONER"})
+    assert r.status_code == 200, r.text
+
+    # Eski token'daki rol claim'i artık kabul edilmez
+    assert client.get("/api/v1/clients/", headers=old_headers).status_code == 401
+
+    new_headers = _login(client, member["email"])
+    assert client.get("/api/v1/clients/", headers=new_headers).status_code == 200
+    token = new_headers["Authorization"].split()[1]
+    assert decode_access_token(token)["role"] == "PRACTITIONER"
+
+
+def test_other_changes_keep_existing_tokens(client, register, create_member):
+    _, owner = register()
+    member, headers = create_member(owner, role="STAFF")
+
+    r = client.patch(f"/api/v1/users/{member['id']}", headers=owner, json={"full_name": "Yeni Ad"})
+    assert r.status_code == 200, r.text
+
+    assert client.get("/api/v1/clients/", headers=headers).status_code == 200
+
+
+def test_user_cutoff_survives_refresh_from_db(session_factory):
+    with session_factory() as db:
+        TokenRevocationService.revoke_user(db, 10 ** 6)
+        # Başka bir süreç listeyi DB'den kurar
+        revocation_list.replace(jtis=(), user_ids=(), started_at=float("inf"))
+        assert not revocation_list.is_user_revoked(10 ** 6, time.time())
+        TokenRevocationService.refresh(db)
+
+    assert revocation_list.is_user_revoked(10 ** 6, time.time() - 60)
+    assert revocation_list.is_user_revoked(10 ** 6)
+    assert not revocation_list.is_user_revoked(10 ** 6, time.time() + 1)
@@ -0,0 +1,49 @@
+# tests/test_users.py
+
+from sqlalchemy import event
+
+
+def test_bulk_create_does_not_reload_users(client, register, session_factory):
+    _, headers = register()
+    users = [
+        {"full_name": f"Personel {i}", "email": f"bulk{i}@example.com", "password": "secret123"}
+        for i in range(20)
+    ]
+    statements = []
+    engine = session_factory.kw["bind"]
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        r = client.post("/api/v1/users/bulk", headers=headers, json={"users": users})
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert r.status_code == 201, r.text
+    assert len(r.json()["created"]) == 20
+    assert all(u["id"] and u["created_at"] for u in r.json()["created"])
+    # Auth + mevcut email kontrolü; kullanıcı başına SELECT yok
+    assert len(statements) < 5, statements
+
+
+def test_staff_cannot_create_users_or_change_roles(client, register):
+    _, owner_headers = register()
+    r = client.post("/api/v1/users/", headers=owner_headers, json={
+        "full_name": "Personel", "email": "staff-perm@example.com", "password": "secret123",
+    })
+    assert r.status_code == 201, r.text
+    staff_id = r.json()["id"]
+    r = client.post("/api/v1/auth/login", data={"username": "staff-perm@example.com", "password": "secret123"})
+    staff_headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+    r = client.post("/api/v1/users/", headers=staff_headers, json={
+        "full_name": "X", "email": "x-perm@example.com", "password": "secret123",
+    })
+    assert r.status_code == 403
+    r = client.patch(f"/api/v1/users/{staff_id}", headers=staff_headers, json={"role": "OWNER"})
+    assert r.status_code == 403
+    r = client.patch(f"/api/v1/users/{staff_id}", headers=staff_headers, json={"full_name": "Yeni Ad"})
+    assert r.status_code == 200